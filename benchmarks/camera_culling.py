@@ -0,0 +1,77 @@
+"""
+Mede o custo de `Phase.render_camera` com muitos elementos acessiveis espalhados pelo
+mapa: o teste de todos os elementos contra a camera com um grupo novo a cada quadro
+contra o conjunto visivel persistente mantido pelo indice espacial. Mede tambem apenas a
+selecao dos elementos visiveis, sem o desenho, que e o mesmo nos dois casos.
+
+O indice so le as linhas que mudaram desde o quadro anterior, entao a selecao pelo
+conjunto visivel ja e mais rapida com cerca de mil elementos. Com poucas dezenas a
+varredura ainda ganha, por alguns microssegundos, o custo fixo de consultar o indice.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.camera_culling [quadros]
+"""
+import sys
+import time
+import random
+import pygame as pg
+from src.settings import SCREEN_DIMENSIONS
+from src.classes.gameobjects import GameObject
+from src.classes.projectiles import projectile_pools
+from benchmarks.render_camera import build_phase
+
+
+def full_scan_culling(phase):
+    objects_to_render = pg.sprite.spritecollide(phase.background, phase.collide_controller.accessible_elements, False)
+    to_render = pg.sprite.Group()
+    to_render.add(phase.player)
+    to_render.add(objects_to_render)
+    to_render.add(projectile_pools.visible)
+    return to_render
+
+
+def full_scan(phase):
+    # O mesmo quadro de render_camera, com os elementos visiveis escolhidos pela varredura
+    visible_elements = phase.visible_elements
+    phase.visible_elements = pg.sprite.Group(pg.sprite.spritecollide(phase.background, phase.collide_controller.accessible_elements, False))
+    phase.update_visible = lambda: None
+    try:
+        phase.render_camera()
+    finally:
+        del phase.update_visible
+        phase.visible_elements = visible_elements
+
+
+def measure(phase, render, frames):
+    elapsed = 0
+    for frame in range(frames):
+        # A camera percorre o mapa para que elementos entrem e saiam do campo de visao
+        phase.background.update_camera(1000 + 5*frame, 1000 + 3*frame)
+        phase.phase_elements.update()
+        start = time.perf_counter()
+        render(phase)
+        elapsed += time.perf_counter() - start
+    return elapsed/frames*1000
+
+
+def main(frames=1000):
+    pg.init()
+    screen = pg.display.set_mode(SCREEN_DIMENSIONS)
+    phase = build_phase(screen)
+    map_limits_sup = list(phase.background.get_shape())
+    for count in (0, 1000, 4000):
+        extra = [GameObject(random.randrange(map_limits_sup[0]), random.randrange(map_limits_sup[1]), 40, 40, map_limits_sup, 'assets\\backgrounds\\shaggy_right_1.png', 0, 0, 1, False) for _ in range(count)]
+        phase.collide_controller.accessible_elements.add(extra)
+        phase.phase_elements.add(extra)
+        full_ms = measure(phase, full_scan, frames)
+        culled_ms = measure(phase, type(phase).render_camera, frames)
+        full_culling_ms = measure(phase, full_scan_culling, frames)
+        culling_ms = measure(phase, type(phase).update_visible, frames)
+        print(f'{len(phase.collide_controller.accessible_elements):5d} acessiveis ({len(phase.visible_elements)} visiveis): '
+              f'varredura {full_ms:6.2f} ms ({full_culling_ms:5.2f} ms sem desenho), '
+              f'conjunto visivel {culled_ms:6.2f} ms ({culling_ms:5.2f} ms sem desenho)')
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
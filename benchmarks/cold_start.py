@@ -0,0 +1,48 @@
+"""
+Mede o tempo de carregar todas as superficies usadas pelo jogo (fases, interface e menu)
+decodificando os arquivos soltos e lendo do pacote gerado por `src.classes.assetpack`.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.cold_start
+"""
+import os
+import time
+import tempfile
+import pygame as pg
+from src.settings import SCREEN_DIMENSIONS
+from src.classes.assets import AssetCache
+from src.classes.assetpack import game_manifest, write_pack
+
+
+def measure(cache, keys):
+    start = time.perf_counter()
+    for path, size in keys:
+        cache.load(path, size)
+    return (time.perf_counter() - start)*1000
+
+
+def main():
+    pg.init()
+    pg.display.set_mode(SCREEN_DIMENSIONS)
+    keys = [key for key in game_manifest() if os.path.exists(key[0])]
+
+    with tempfile.TemporaryDirectory() as directory:
+        pack_path = os.path.join(directory, 'assets.pack')
+        write_pack(keys, pack_path)
+
+        loose_ms = measure(AssetCache(), keys)
+        pack_cache = AssetCache(pack_path=pack_path)
+        pack_ms = measure(pack_cache, keys)
+
+        print(f'{len(keys)} superficies, pacote de {os.path.getsize(pack_path)/2**20:.1f} MB')
+        print(f'arquivos soltos: {loose_ms:.1f} ms')
+        print(f'pacote:          {pack_ms:.1f} ms ({pack_cache.stats()["pack_hits"]} lidas do pacote)')
+        print(f'ganho: {loose_ms/pack_ms:.2f}x')
+        # Libera as superficies apoiadas no mapeamento antes de apagar o pacote
+        pack_cache.clear()
+        pack_cache.close_pack()
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Mede o custo das consultas de colisao de `CollideController` com N entidades espalhadas
+pelo mapa: `pg.sprite.groupcollide` contra `SpatialHash` (incluindo o `sync` do quadro).
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.collisions [quadros]
+"""
+import sys
+import time
+import random
+import pygame as pg
+from src.classes.spatial import SpatialHash
+
+MAP_SIZE = (8000, 6000)
+
+
+def build(count):
+    def sprite():
+        each = pg.sprite.Sprite()
+        each.rect = pg.Rect(random.randrange(MAP_SIZE[0]), random.randrange(MAP_SIZE[1]), 67, 100)
+        return each
+    characters = pg.sprite.Group(sprite() for _ in range(count//2))
+    game_objects = pg.sprite.Group(sprite() for _ in range(count//4))
+    ammus = pg.sprite.Group(sprite() for _ in range(count//4))
+    return characters, game_objects, ammus
+
+
+def with_pygame(characters, game_objects, ammus):
+    pg.sprite.groupcollide(ammus, characters, False, False)
+    pg.sprite.groupcollide(ammus, game_objects, False, False)
+    pg.sprite.groupcollide(characters, game_objects, False, False)
+    pg.sprite.groupcollide(characters, characters, False, False)
+
+
+def with_hash(spatial_hash, characters, game_objects, ammus):
+    spatial_hash.sync(list(characters) + list(game_objects) + list(ammus))
+    spatial_hash.groupcollide(ammus, characters)
+    spatial_hash.groupcollide(ammus, game_objects)
+    spatial_hash.groupcollide(characters, game_objects)
+    spatial_hash.groupcollide(characters, characters)
+
+
+def measure(function, frames, *args):
+    start = time.perf_counter()
+    for _ in range(frames):
+        function(*args)
+    return (time.perf_counter() - start)*1000/frames
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    random.seed(0)
+    for count in (100, 1000, 4000):
+        groups = build(count)
+        pygame_ms = measure(with_pygame, frames, *groups)
+        hash_ms = measure(with_hash, frames, SpatialHash(), *groups)
+        print(f'{count:5d} entidades: groupcollide {pygame_ms:8.2f} ms, SpatialHash {hash_ms:6.2f} ms ({pygame_ms/hash_ms:.1f}x)')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Mede o custo por quadro da translacao da camera e do enquadramento nos limites do mapa
+para N entidades: uma chamada de `PositionController` por entidade contra uma unica
+operacao vetorizada de `EntityStore`.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.entity_transforms [quadros]
+"""
+import sys
+import time
+import numpy as np
+from src.classes.background import PositionController
+from src.classes.entities import EntityStore
+
+MAP_SIZE = [4000, 3000]
+
+
+def per_entity(positions, frames):
+    controllers = [PositionController(MAP_SIZE, 50, 50) for _ in positions]
+    start = time.perf_counter()
+    for frame in range(frames):
+        PositionController.set_origin(frame, frame)
+        for controller, (x, y) in zip(controllers, positions):
+            controller.apply_translation(*controller.to_frame(x + 1, y + 1))
+    return (time.perf_counter() - start)*1000/frames
+
+
+def vectorised(positions, frames):
+    store = EntityStore()
+    rows = np.array([store.add(x, y, 50, 50, MAP_SIZE) for x, y in positions])
+    movement = np.ones((len(rows), 2))
+    start = time.perf_counter()
+    for frame in range(frames):
+        store.move(rows, movement)
+        store.translate((frame, frame))
+    return (time.perf_counter() - start)*1000/frames
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = np.random.default_rng(0)
+    for count in (10, 100, 1000):
+        positions = rng.uniform(0, 3000, (count, 2)).tolist()
+        loop_ms = per_entity(positions, frames)
+        store_ms = vectorised(positions, frames)
+        print(f'{count:5d} entidades: por entidade {loop_ms:7.3f} ms, vetorizado {store_ms:7.3f} ms ({loop_ms/store_ms:.1f}x)')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Mede o custo por quadro de N projeteis em voo com `ProjectilePool`: integracao e teste
+de limites vetorizados, com apenas os projeteis na tela atualizados como sprites.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.projectiles [quadros]
+"""
+import sys
+import time
+import numpy as np
+import pygame as pg
+from src.classes.projectiles import ProjectilePool
+
+MAP_SIZE = [4000, 3000]
+VIEW_SIZE = (1280, 720)
+
+
+def measure(count, frames):
+    pool = ProjectilePool(pg.Surface((20, 20)), damage=1, effects=[], speed=7, map_limits_sup=MAP_SIZE, capacity=count)
+    rng = np.random.default_rng(0)
+    start = time.perf_counter()
+    for position, direction in zip(rng.uniform(100, 2900, (count, 2)), rng.normal(size=(count, 2))):
+        pool.spawn(position, direction)
+    spawn_ms = (time.perf_counter() - start)*1000
+    start = time.perf_counter()
+    for _ in range(frames):
+        pool.update((1000, 1000), VIEW_SIZE)
+    return spawn_ms, (time.perf_counter() - start)*1000/frames, len(pool.visible)
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    pg.init()
+    for count in (100, 1000, 10000):
+        spawn_ms, frame_ms, visible = measure(count, frames)
+        print(f'{count:6d} projeteis: disparo {spawn_ms:7.2f} ms, quadro {frame_ms:6.3f} ms ({visible} visiveis)')
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
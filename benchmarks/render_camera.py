@@ -0,0 +1,71 @@
+"""
+Mede o tempo de blit de `Phase.render_camera` (fundo + sprites visiveis) com as
+superficies como saem do decodificador e depois de convertidas para o formato da tela.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.render_camera [quadros]
+"""
+import os
+import sys
+import time
+import random
+import pygame as pg
+from src.settings import SCREEN_DIMENSIONS
+from src.classes.assets import asset_cache
+from src.classes.background import Background
+from src.classes.phase import Phase, random_data
+
+
+def open_mixer():
+    # Como em Game.init_mixer: sem placa de som, o benchmark roda com o driver mudo do SDL
+    if pg.mixer.get_init():
+        return
+    try:
+        pg.mixer.init()
+    except pg.error:
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        pg.mixer.init()
+
+
+def build_phase(screen):
+    random.seed(0)
+    open_mixer()
+    background = Background(screen, 'assets/backgrounds/garden.jpg', SCREEN_DIMENSIONS[0], SCREEN_DIMENSIONS[1], 4000, 3000, 'audios/backmusic.mp3', 0, [])
+    npcs, collectibles, mandatory_events, optional_events, player, monster, scooby_snacks = random_data(background)
+    phase = Phase(screen, background, npcs, collectibles, mandatory_events, optional_events, player, monster, [], scooby_snacks)
+    background.stop_music()
+    return phase
+
+
+def measure(phase, frames):
+    phase.background.update(phase.player.x_position, phase.player.y_position)
+    phase.phase_elements.update()
+    start = time.perf_counter()
+    for _ in range(frames):
+        phase.render_camera()
+    return (time.perf_counter() - start)/frames*1000
+
+
+def main(frames=300):
+    pg.init()
+    asset_cache.clear()
+
+    # Superficies carregadas antes da tela existir ficam no formato do arquivo
+    raw_phase = build_phase(pg.Surface(SCREEN_DIMENSIONS))
+    screen = pg.display.set_mode(SCREEN_DIMENSIONS)
+    raw_phase.screen = screen
+    raw_phase.background.screen = screen
+    raw_ms = measure(raw_phase, frames)
+
+    asset_cache.convert_pending()
+    converted_phase = build_phase(screen)
+    converted_ms = measure(converted_phase, frames)
+
+    print(f'render_camera sem conversao: {raw_ms:.3f} ms/quadro')
+    print(f'render_camera convertido:    {converted_ms:.3f} ms/quadro')
+    print(f'ganho: {raw_ms/converted_ms:.2f}x')
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,52 @@
+"""
+Mede o custo por tick da IA dos viloes: `Villain.update` chamado para cada vilao contra
+a passada vetorizada de `VillainAI`, com muitos viloes espalhados pelo mapa.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.villains [ticks]
+"""
+import sys
+import time
+import random
+import contextlib
+import io
+import pygame as pg
+from src.settings import SCREEN_DIMENSIONS
+from src.classes.villain import Villain
+from src.classes.villainai import VillainAI
+from benchmarks.render_camera import build_phase
+
+
+def build_villains(phase, count):
+    monster = phase.monster
+    map_limits_sup = list(phase.background.get_shape())
+    return [Villain('Fred', monster.speed, 3, random.randrange(map_limits_sup[0]), random.randrange(map_limits_sup[1]), monster.width, monster.height, 0, 'default', 5, 4,
+                    map_limits_sup, 100, monster.weapon, monster.mem_size, monster.vision_field.width//2, phase.background, phase.scooby_snacks) for _ in range(count)]
+
+
+def measure(update, player, ticks):
+    start = time.perf_counter()
+    # Os ataques imprimem uma mensagem a cada tick
+    with contextlib.redirect_stdout(io.StringIO()):
+        for tick in range(ticks):
+            player.store.set_position(player.row, (1000 + 5*tick, 1000 + 3*tick))
+            update(player)
+    return (time.perf_counter() - start)/ticks*1000
+
+
+def main(ticks=100):
+    pg.init()
+    screen = pg.display.set_mode(SCREEN_DIMENSIONS)
+    phase = build_phase(screen)
+    for count in (50, 200, 1000):
+        random.seed(count)
+        individual = pg.sprite.Group(build_villains(phase, count))
+        batched = VillainAI(build_villains(phase, count))
+        individual_ms = measure(individual.update, phase.player, ticks)
+        batched_ms = measure(batched.update, phase.player, ticks)
+        print(f'{count:5d} viloes: individual {individual_ms:7.3f} ms/tick, em lote {batched_ms:6.3f} ms/tick ({individual_ms/batched_ms:.1f}x)')
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -1,3 +1,8 @@
+import sys
+import time
+
+start = time.perf_counter()
 from src.classes.game import Game
+import_time = time.perf_counter() - start
 
-Game().run()
\ No newline at end of file
+Game(startup_profile='--startup-profile' in sys.argv, import_time=import_time, frame_profile='--frame-profile' in sys.argv).run()
@@ -0,0 +1,379 @@
+"""
+Pacote binario de assets pre-processados.
+
+O comando
+
+    python -m src.classes.assetpack [saida]
+
+le as fases em `jsons/phase_*.json`, as telas do menu e as imagens da interface, e grava
+em um unico arquivo as superficies ja redimensionadas, como blocos de pixels crus de 32
+bits, junto com um indice. Em tempo de execucao o pacote e mapeado em memoria e as
+superficies sao montadas diretamente sobre o buffer mapeado, sem decodificar PNG/JPG.
+Entradas cujo arquivo de origem mudou depois do pacote sao ignoradas, e o jogo volta a
+carregar o arquivo solto. O mesmo comando gera os arquivos de tiles dos fundos com `tile_size`.
+"""
+import os
+import sys
+import glob
+import json
+import mmap
+import struct
+import pygame as pg
+from src.settings import EVENT_SPRITE, PROFILE_SIZE, FULL_HEART, HALF_HEART, EMPTY_HEART, HEART_SIZE, ASSET_PACK
+from src.settings import SHAGGY_PROFILE, DAPHNE_PROFILE, SCOOBY_PROFILE, FRED_PROFILE, VELMA_PROFILE
+from src.settings import START_BACKGROUND_MENU, FINAL_SCREEN_MENU, PAUSE_SCREEN_MENU, PAUSE_SCREEN_SIZE, GAME_OVER_SCREEN_MENU, GAME_OVER_SCREEN_SIZE
+
+
+MAGIC = b'SDPK'
+VERSION = 1
+HEADER = struct.Struct('<4sII')
+ALIGNMENT = 64
+
+# Blocos com transparencia usam a ordem de bytes da tela ARGB8888 (little endian);
+# blocos opacos guardam apenas RGB com um byte de preenchimento
+ALPHA_FORMAT = 'BGRA'
+OPAQUE_FORMAT = 'RGBX'
+
+
+def entry_name(key):
+    """
+    Monta o nome de uma entrada do pacote a partir da chave do `AssetCache`.
+
+    Parameters
+    ----------
+    key : tuple
+        Chave (caminho normalizado, tamanho) do cache.
+
+    Returns
+    -------
+    str
+        Nome independente do sistema operacional, como 'assets/menus/full heart.png@50x50'.
+    """
+    path, size = key
+    path = path.replace(os.sep, '/')
+    if size is None:
+        return f'{path}@original'
+    return f'{path}@{size[0]}x{size[1]}'
+
+
+def source_signature(path):
+    """
+    Retorna a assinatura (mtime em ns, tamanho em bytes) do arquivo de origem, ou None se ele nao existir.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def write_blocks(blocks, pack_path, meta=None):
+    """
+    Grava superficies como blocos de pixels crus em um pacote.
+
+    Parameters
+    ----------
+    blocks : iterable
+        Triplas (nome da entrada, superficie, assinatura da origem ou None).
+    pack_path : str
+        Caminho do pacote gerado.
+    meta : dict, opcional
+        Informacoes extras guardadas junto com o indice.
+    """
+    entries = {}
+    data = []
+    offset = 0
+    for name, surface, signature in blocks:
+        pixel_format = ALPHA_FORMAT if surface.get_flags() & pg.SRCALPHA else OPAQUE_FORMAT
+        pixels = pg.image.tobytes(surface, pixel_format)
+        entries[name] = {
+            'offset': offset,
+            'length': len(pixels),
+            'size': list(surface.get_size()),
+            'format': pixel_format,
+            'source': signature,
+        }
+        padding = -len(pixels) % ALIGNMENT
+        data.append(pixels + bytes(padding))
+        offset += len(pixels) + padding
+
+    # Os offsets do indice sao relativos ao inicio dos dados, alinhado apos o indice
+    index = json.dumps({'entries': entries, 'meta': meta or {}}).encode('utf-8')
+    data_start = HEADER.size + len(index)
+    data_start += -data_start % ALIGNMENT
+
+    with open(pack_path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(index)))
+        file.write(index)
+        file.write(bytes(data_start - HEADER.size - len(index)))
+        for block in data:
+            file.write(block)
+
+
+def write_pack(keys, pack_path):
+    """
+    Decodifica, redimensiona e grava as superficies de `keys` em um pacote.
+
+    Parameters
+    ----------
+    keys : iterable
+        Chaves (caminho normalizado, tamanho) no formato de `AssetCache.make_key`.
+    pack_path : str
+        Caminho do pacote gerado.
+
+    Returns
+    -------
+    list
+        Caminhos que nao puderam ser empacotados por nao existirem.
+    """
+    missing = []
+
+    def blocks():
+        for key in dict.fromkeys(keys):
+            path, size = key
+            signature = source_signature(path)
+            if signature is None:
+                missing.append(path)
+                continue
+            surface = pg.image.load(path)
+            if size is not None and surface.get_size() != size:
+                surface = pg.transform.scale(surface, size)
+            yield entry_name(key), surface, signature
+
+    write_blocks(blocks(), pack_path)
+    return missing
+
+
+class AssetPack:
+    """
+    Leitor de um pacote gerado por `write_pack`, mapeado em memoria.
+
+    Parameters
+    ----------
+    path : str
+        Caminho do pacote.
+
+    Attributes
+    ----------
+    entries : dict
+        Indice do pacote, por nome de entrada.
+    meta : dict
+        Informacoes extras gravadas com `write_blocks`.
+    stale : int
+        Quantidade de consultas recusadas porque o arquivo de origem mudou.
+
+    Raises
+    ------
+    ValueError
+        Se o arquivo nao for um pacote valido desta versao.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.stale = 0
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, index_length = HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f'{path} nao e um pacote de assets versao {VERSION}')
+            index = json.loads(self._map[HEADER.size:HEADER.size + index_length].decode('utf-8'))
+        except (ValueError, struct.error):
+            self.close()
+            raise ValueError(f'{path} nao e um pacote de assets valido')
+        self.entries = index['entries']
+        self.meta = index.get('meta', {})
+        self._data_start = HEADER.size + index_length
+        self._data_start += -self._data_start % ALIGNMENT
+        self._view = memoryview(self._map)
+
+    def is_stale(self, path, entry):
+        """
+        Verifica se o arquivo de origem mudou depois que o pacote foi gerado.
+
+        Arquivos de origem ausentes nao tornam a entrada obsoleta: o pacote pode ser
+        distribuido sem os arquivos soltos.
+        """
+        signature = source_signature(path)
+        return signature is not None and signature != entry['source']
+
+    def surface(self, key):
+        """
+        Monta a superficie de `key` sobre o buffer mapeado.
+
+        Parameters
+        ----------
+        key : tuple
+            Chave (caminho normalizado, tamanho) do cache.
+
+        Returns
+        -------
+        pg.Surface ou None
+            Superficie que compartilha a memoria do pacote, ou None se a entrada nao
+            existir ou estiver obsoleta.
+        """
+        entry = self.entries.get(entry_name(key))
+        if entry is None:
+            return None
+        if self.is_stale(key[0], entry):
+            self.stale += 1
+            return None
+        return self.block(entry_name(key))
+
+    def block(self, name):
+        """
+        Monta a superficie da entrada `name` sobre o buffer mapeado, sem verificar a origem.
+
+        Parameters
+        ----------
+        name : str
+            Nome da entrada no indice.
+
+        Returns
+        -------
+        pg.Surface
+            Superficie que compartilha a memoria do pacote.
+        """
+        entry = self.entries[name]
+        start = self._data_start + entry['offset']
+        block = self._view[start:start + entry['length']]
+        return pg.image.frombuffer(block, tuple(entry['size']), entry['format'])
+
+    def close(self):
+        """
+        Fecha o pacote. Superficies ainda apoiadas no buffer mantem o mapeamento vivo.
+        """
+        view = getattr(self, '_view', None)
+        if view is not None:
+            try:
+                view.release()
+            except BufferError:
+                return
+        if getattr(self, '_map', None) is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                return
+        self._file.close()
+
+
+def phase_manifest(phase_data):
+    """
+    Lista as chaves (caminho, tamanho) carregadas por uma fase.
+
+    Os tamanhos seguem os construtores das entidades: personagens usam a spritesheet
+    inteira com 4 direcoes (`Character`), objetos uma unica linha (`GameObject`) e os
+    eventos a imagem do evento no tamanho de cada zona (`Event`).
+
+    Parameters
+    ----------
+    phase_data : dict
+        Conteudo de um `jsons/phase_*.json`.
+
+    Returns
+    -------
+    list
+        Pares (caminho, tamanho).
+    """
+    manifest = []
+    background = phase_data['background']
+    # Fundos em tiles ficam no seu proprio arquivo (src.classes.tiles)
+    if not background.get('tile_size'):
+        manifest.append((background['sprite'], (background['width'], background['height'])))
+
+    characters = [phase_data['player']] + list(phase_data['monsters'])
+    for character in characters:
+        columns = character['sprites_quantity']
+        manifest.append((f"assets\\spritesheets\\{character['name']}_{character['skin']}.png", (character['width']*columns, character['height']*4)))
+
+    objects = list(phase_data['ammos'].values()) + list(phase_data['weapons'].values()) + [phase_data['scooby_snacks']]
+    for group in ('collectibles', 'game_objects', 'npcs'):
+        objects += list(phase_data[group].values())
+    for each_object in objects:
+        manifest.append((each_object['spritesheet'], (each_object['width']*each_object['sprites_quantity'], each_object['height'])))
+
+    for group in ('mandatory_events', 'optional_events'):
+        for event in phase_data[group].values():
+            for zone in ('start_zone', 'event_zone'):
+                manifest.append((EVENT_SPRITE, tuple(event[zone][2:4])))
+
+    for dialogs in phase_data['dialogs'].values():
+        for dialog in dialogs:
+            manifest.append((f"assets/spritesheets/{dialog['speaker']}_dialogue.png", PROFILE_SIZE))
+    return manifest
+
+
+def hud_manifest():
+    """
+    Lista as chaves (caminho, tamanho) da interface desenhada durante as fases.
+
+    Returns
+    -------
+    list
+        Pares (caminho, tamanho).
+    """
+    manifest = [(heart, HEART_SIZE) for heart in (FULL_HEART, HALF_HEART, EMPTY_HEART)]
+    manifest += [(profile, PROFILE_SIZE) for profile in (SHAGGY_PROFILE, DAPHNE_PROFILE, SCOOBY_PROFILE, FRED_PROFILE, VELMA_PROFILE)]
+    return manifest
+
+
+def interface_manifest():
+    """
+    Lista as chaves (caminho, tamanho) da interface e do menu, que nao dependem da fase.
+
+    Returns
+    -------
+    list
+        Pares (caminho, tamanho).
+    """
+    manifest = hud_manifest()
+    manifest += [(START_BACKGROUND_MENU, None), (FINAL_SCREEN_MENU, None)]
+    manifest += [(PAUSE_SCREEN_MENU, PAUSE_SCREEN_SIZE), (GAME_OVER_SCREEN_MENU, GAME_OVER_SCREEN_SIZE)]
+
+    with open('jsons/cutscene_dialogs.json', 'r') as file:
+        cutscene = json.load(file)
+    for dialogs in cutscene['dialogs'].values():
+        for dialog in dialogs:
+            manifest.append((f"assets/spritesheets/{dialog['speaker']}_dialogue.png", PROFILE_SIZE))
+    return manifest
+
+
+def game_manifest():
+    """
+    Lista as chaves do cache de todas as fases e da interface, sem repeticoes.
+
+    Returns
+    -------
+    list
+        Chaves (caminho normalizado, tamanho) no formato de `AssetCache.make_key`.
+    """
+    # Importado aqui porque o modulo assets depende deste
+    from src.classes.assets import AssetCache
+
+    manifest = interface_manifest()
+    for phase_path in sorted(glob.glob('jsons/phase_*.json')):
+        with open(phase_path, 'r') as file:
+            manifest += phase_manifest(json.load(file))
+    return list(dict.fromkeys(AssetCache.make_key(path, size) for path, size in manifest))
+
+
+def main(pack_path=None):
+    # Importado aqui porque o modulo tiles depende deste
+    from src.classes.tiles import build_tiles
+
+    pack_path = pack_path or ASSET_PACK
+    keys = game_manifest()
+    missing = write_pack(keys, pack_path)
+    for path in missing:
+        print(f'ignorado (arquivo ausente): {path}')
+    print(f'{len(keys) - len(missing)} entradas gravadas em {pack_path} ({os.path.getsize(pack_path)/2**20:.1f} MB)')
+
+    for phase_path in sorted(glob.glob('jsons/phase_*.json')):
+        with open(phase_path, 'r') as file:
+            background = json.load(file)['background']
+        if background.get('tile_size'):
+            tile_path = build_tiles(background['sprite'], background['width'], background['height'], background['tile_size'])
+            print(f'tiles de {phase_path} gravados em {tile_path}')
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
@@ -0,0 +1,419 @@
+import os
+import weakref
+import threading
+from collections import OrderedDict
+import pygame as pg
+from src.settings import ASSET_PACK
+from src.classes.assetpack import AssetPack
+
+
+def normalize_path(path):
+    """
+    Normaliza o caminho de um asset, aceitando tanto '/' quanto '\\' como separador.
+
+    Parameters
+    ----------
+    path : str
+        Caminho do arquivo como aparece nos jsons e nas configuracoes.
+
+    Returns
+    -------
+    str
+        Caminho normalizado para o sistema operacional atual.
+    """
+    return os.path.normpath(path.replace('\\', '/'))
+
+
+def convert_for_display(surface):
+    """
+    Converte a superficie para o formato de pixel da tela, caso a tela ja exista.
+
+    Superficies com transparencia por pixel usam `convert_alpha`; as opacas usam `convert`.
+
+    Parameters
+    ----------
+    surface : pg.Surface
+        Superficie recem carregada.
+
+    Returns
+    -------
+    tuple
+        A superficie (convertida ou nao) e um booleano indicando se a conversao foi feita.
+    """
+    if pg.display.get_surface() is None:
+        return surface, False
+    if surface.get_flags() & pg.SRCALPHA:
+        return surface.convert_alpha(), True
+    return surface.convert(), True
+
+
+class AssetCache:
+    """
+    Cache central de superficies decodificadas, compartilhadas entre todas as entidades do jogo.
+
+    Cada entrada e identificada por (caminho, tamanho) e guarda uma unica superficie ja
+    redimensionada e convertida para o formato da tela. As entradas possuem contagem de
+    referencias: enquanto alguma entidade usa a superficie ela nunca e descartada. Entradas
+    sem referencias continuam em cache e sao descartadas na ordem LRU quando ultrapassam
+    `max_unused`. Entradas carregadas antes da tela existir ficam pendentes e sao convertidas
+    por `convert_pending`. Se `pack_path` apontar para um pacote gerado por
+    `python -m src.classes.assetpack`, as superficies sao lidas dele sem decodificar a imagem.
+    Todos os metodos podem ser chamados de qualquer thread; a conversao para o formato da tela
+    so acontece no thread que chama `load` ou `convert_pending`.
+
+    Parameters
+    ----------
+    max_unused : int
+        Quantidade maxima de entradas sem referencias mantidas em cache.
+    pack_path : str, opcional
+        Pacote de assets pre-processados. Arquivos ausentes ou invalidos sao ignorados.
+
+    Attributes
+    ----------
+    hits : int
+        Quantidade de requisicoes atendidas pelo cache.
+    misses : int
+        Quantidade de requisicoes que precisaram decodificar o arquivo.
+    evictions : int
+        Quantidade de entradas descartadas pela politica LRU.
+    pack_hits : int
+        Quantidade de entradas lidas do pacote em vez do arquivo solto.
+    """
+    def __init__(self, max_unused=32, pack_path=None):
+        self.max_unused = max_unused
+        self.pack_path = pack_path
+        self._pack = None
+        self._lock = threading.RLock()
+        self._surfaces = {}
+        self._refcounts = {}
+        self._tables = {}
+        self._owners = {}
+        self._pending = set()
+        self._unused = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.pack_hits = 0
+
+    @staticmethod
+    def make_key(path, size=None):
+        """
+        Monta a chave de cache de um asset.
+
+        Parameters
+        ----------
+        path : str
+            Caminho do arquivo de imagem.
+        size : tuple, opcional
+            Tamanho final (largura, altura) da superficie. None mantem o tamanho original.
+
+        Returns
+        -------
+        tuple
+            Chave (caminho normalizado, tamanho).
+        """
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+        return normalize_path(path), size
+
+    def open_pack(self):
+        """
+        Abre o pacote de assets, se existir e ainda nao estiver aberto.
+
+        Returns
+        -------
+        AssetPack ou None
+            O pacote aberto, ou None se nao houver pacote utilizavel.
+        """
+        with self._lock:
+            if self._pack is None and self.pack_path is not None:
+                try:
+                    self._pack = AssetPack(self.pack_path)
+                except (OSError, ValueError):
+                    # Sem pacote utilizavel: usa sempre os arquivos soltos
+                    self.pack_path = None
+            return self._pack
+
+    def _decode(self, key):
+        # Retorna a superficie redimensionada, ainda no formato do arquivo, e se veio do pacote
+        path, size = key
+        pack = self.open_pack()
+        surface = pack.surface(key) if pack is not None else None
+        if surface is not None:
+            return surface, True
+        surface = pg.image.load(path)
+        if size is not None and surface.get_size() != size:
+            surface = pg.transform.scale(surface, size)
+        return surface, False
+
+    def _insert(self, key, surface, from_pack, convert=True):
+        converted = False
+        if convert:
+            surface, converted = convert_for_display(surface)
+        if not converted:
+            self._pending.add(key)
+        if from_pack:
+            self.pack_hits += 1
+        self.misses += 1
+        self._surfaces[key] = surface
+        self._refcounts[key] = 0
+
+    def _reference(self, key):
+        self._unused.pop(key, None)
+        self._refcounts[key] += 1
+        return self._surfaces[key]
+
+    def convert_pending(self):
+        """
+        Converte para o formato da tela as entradas carregadas antes da tela existir.
+
+        Deve ser chamado uma vez depois de `pg.display.set_mode`. Entidades que ja receberam a
+        superficie antiga continuam com ela; as proximas requisicoes recebem a convertida.
+
+        Returns
+        -------
+        int
+            Quantidade de entradas convertidas.
+        """
+        converted_count = 0
+        with self._lock:
+            for key in list(self._pending):
+                surface, converted = convert_for_display(self._surfaces[key])
+                if not converted:
+                    break
+                self._surfaces[key] = surface
+                self._tables.pop(key, None)
+                self._pending.discard(key)
+                converted_count += 1
+        return converted_count
+
+    def _evict(self):
+        while len(self._unused) > self.max_unused:
+            key, _ = self._unused.popitem(last=False)
+            del self._surfaces[key]
+            del self._refcounts[key]
+            self._tables.pop(key, None)
+            self._pending.discard(key)
+            self.evictions += 1
+
+    def load(self, path, size=None):
+        """
+        Retorna a superficie compartilhada de (path, size) e incrementa sua contagem de referencias.
+
+        Parameters
+        ----------
+        path : str
+            Caminho do arquivo de imagem.
+        size : tuple, opcional
+            Tamanho final (largura, altura) da superficie.
+
+        Returns
+        -------
+        pg.Surface
+            Superficie compartilhada. Nao deve ser alterada por quem a recebe.
+        """
+        key = self.make_key(path, size)
+        with self._lock:
+            if key in self._surfaces:
+                self.hits += 1
+            else:
+                self._insert(key, *self._decode(key))
+            return self._reference(key)
+
+    def preload(self, path, size=None):
+        """
+        Como `load`, mas sem converter para o formato da tela, para ser chamado por um thread
+        de carregamento. A decodificacao acontece fora do lock, sem bloquear o thread principal.
+        A entrada fica pendente ate `convert_pending` ser chamado no thread principal.
+
+        Parameters
+        ----------
+        path : str
+            Caminho do arquivo de imagem.
+        size : tuple, opcional
+            Tamanho final (largura, altura) da superficie.
+
+        Returns
+        -------
+        pg.Surface
+            Superficie compartilhada, ainda no formato do arquivo. A referencia deve ser
+            liberada com `release`.
+        """
+        key = self.make_key(path, size)
+        with self._lock:
+            if key in self._surfaces:
+                self.hits += 1
+                return self._reference(key)
+        surface, from_pack = self._decode(key)
+        with self._lock:
+            # Outro thread pode ter carregado a mesma entrada enquanto esta era decodificada
+            if key in self._surfaces:
+                self.hits += 1
+            else:
+                self._insert(key, surface, from_pack, convert=False)
+            return self._reference(key)
+
+    def acquire(self, owner, path, size=None):
+        """
+        Como `load`, mas libera a referencia automaticamente quando `owner` deixa de existir.
+
+        Parameters
+        ----------
+        owner : object
+            Objeto dono da referencia (sprite, evento, etc.).
+        path : str
+            Caminho do arquivo de imagem.
+        size : tuple, opcional
+            Tamanho final (largura, altura) da superficie.
+
+        Returns
+        -------
+        pg.Surface
+            Superficie compartilhada.
+        """
+        with self._lock:
+            surface = self.load(path, size)
+            owner_key = (id(owner), self.make_key(path, size))
+            if owner_key in self._owners:
+                # O dono ja possui essa referencia
+                self.release(path, size)
+            else:
+                self._owners[owner_key] = weakref.finalize(owner, self._release_owner, owner_key)
+        return surface
+
+    def _release_owner(self, owner_key):
+        with self._lock:
+            self._owners.pop(owner_key, None)
+            self.release(*owner_key[1])
+
+    def drop(self, owner, path, size=None):
+        """
+        Libera antecipadamente a referencia de `owner` obtida com `acquire`.
+
+        Parameters
+        ----------
+        owner : object
+            Objeto dono da referencia.
+        path : str
+            Caminho do arquivo de imagem.
+        size : tuple, opcional
+            Tamanho usado no `acquire` correspondente.
+        """
+        finalizer = self._owners.get((id(owner), self.make_key(path, size)))
+        if finalizer is not None:
+            finalizer()
+
+    def frames(self, path, size, columns, rows):
+        """
+        Retorna a tabela de quadros de animacao de uma spritesheet ja carregada.
+
+        A spritesheet e fatiada uma unica vez em `rows` linhas (direcoes) e `columns`
+        colunas (quadros). A tabela e imutavel e compartilhada por todas as entidades
+        que usam a mesma spritesheet no mesmo tamanho.
+
+        Parameters
+        ----------
+        path : str
+            Caminho da spritesheet, previamente obtida com `load` ou `acquire`.
+        size : tuple
+            Tamanho (largura, altura) da spritesheet inteira.
+        columns : int
+            Quantidade de quadros por linha.
+        rows : int
+            Quantidade de linhas da spritesheet.
+
+        Returns
+        -------
+        tuple
+            Tupla de linhas, cada uma uma tupla de superficies, indexada por [linha][quadro].
+        """
+        key = self.make_key(path, size)
+        with self._lock:
+            tables = self._tables.setdefault(key, {})
+            if (columns, rows) not in tables:
+                sheet = self._surfaces[key]
+                width = sheet.get_width()//columns
+                height = sheet.get_height()//rows
+                tables[(columns, rows)] = tuple(
+                    tuple(sheet.subsurface((column*width, row*height, width, height)) for column in range(columns))
+                    for row in range(rows)
+                )
+            return tables[(columns, rows)]
+
+    def release(self, path, size=None):
+        """
+        Decrementa a contagem de referencias de (path, size). Entradas sem referencias
+        passam a ser candidatas ao descarte LRU.
+
+        Parameters
+        ----------
+        path : str
+            Caminho do arquivo de imagem.
+        size : tuple, opcional
+            Tamanho usado no `load` correspondente.
+        """
+        key = self.make_key(path, size)
+        with self._lock:
+            if key not in self._refcounts:
+                return
+            self._refcounts[key] -= 1
+            if self._refcounts[key] <= 0:
+                self._refcounts[key] = 0
+                self._unused[key] = True
+                self._evict()
+
+    def refcount(self, path, size=None):
+        """
+        Retorna a contagem de referencias atual de (path, size).
+        """
+        return self._refcounts.get(self.make_key(path, size), 0)
+
+    def close_pack(self):
+        """
+        Fecha o pacote de assets, se estiver aberto. As proximas leituras voltam a abri-lo.
+        """
+        with self._lock:
+            if self._pack is not None:
+                self._pack.close()
+                self._pack = None
+
+    def clear(self):
+        """
+        Esvazia o cache e zera as estatisticas.
+        """
+        with self._lock:
+            self._surfaces.clear()
+            self._refcounts.clear()
+            self._tables.clear()
+            self._pending.clear()
+            self._unused.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.pack_hits = 0
+
+    def stats(self):
+        """
+        Retorna as estatisticas de uso do cache.
+
+        Returns
+        -------
+        dict
+            Acertos, falhas, descartes, entradas em cache, entradas sem referencias e
+            entradas ainda nao convertidas para o formato da tela, entradas lidas do pacote
+            e entradas do pacote recusadas por estarem desatualizadas.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._surfaces),
+            'unused': len(self._unused),
+            'pending': len(self._pending),
+            'pack_hits': self.pack_hits,
+            'pack_stale': self._pack.stale if self._pack is not None else 0,
+        }
+
+
+# Cache compartilhado por todas as fases
+asset_cache = AssetCache(pack_path=ASSET_PACK)
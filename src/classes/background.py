@@ -1,16 +1,18 @@
 import pygame as pg
-from src.settings import SCREEN_DIMENSIONS, Fonts, FULL_HEART, HALF_HEART, EMPTY_HEART
+from src.settings import SCREEN_DIMENSIONS, Fonts, FULL_HEART, HALF_HEART, EMPTY_HEART, HEART_SIZE, PROFILE_SIZE
 from src.settings import SHAGGY_PROFILE, DAPHNE_PROFILE, SCOOBY_PROFILE, VELMA_PROFILE, FRED_PROFILE
+from src.classes.assets import asset_cache
+from src.classes.tiles import TileMap
+from src.classes.sounds import sound_bank
+from src.classes.entities import entity_store
+from src.classes.spatial import SpatialHash, VersionedGroup
+from src.classes.raycast import AimRays
 import numpy as np
 
-damage = pg.mixer.Sound('assets\sounds\dano.wav')
-
 class Background(pg.sprite.Sprite):
-    def __init__(self, screen, sprite, x_position, y_position, width, height, music, volume, sounds):
+    def __init__(self, screen, sprite, x_position, y_position, width, height, music, volume, sounds, tile_size=None, tile_pack=None):
         super().__init__()
         self.screen = screen
-        self.sprite = pg.image.load(sprite)
-        self.sprite = pg.transform.scale(self.sprite, (width, height))
         self.position_controller = PositionController([width, height], SCREEN_DIMENSIONS[0], SCREEN_DIMENSIONS[1])
         self.x_position = x_position - SCREEN_DIMENSIONS[0]//2
         self.y_position = y_position - SCREEN_DIMENSIONS[1]//2
@@ -19,8 +21,18 @@ class Background(pg.sprite.Sprite):
         self.music = music
         self.volume = volume
         self.sounds = sounds
-        self.image = self.sprite.subsurface((self.x_position, self.y_position, *SCREEN_DIMENSIONS))
-        self.rect = self.image.get_rect()
+        if tile_size:
+            # Mapa em tiles: apenas os tiles perto da camera ficam em memoria
+            self.sprite = None
+            self.tiles = TileMap(sprite, width, height, tile_size, pack=tile_pack)
+            self.image = None
+            self.rect = pg.Rect(0, 0, *SCREEN_DIMENSIONS)
+            self.tiles.page(self.x_position, self.y_position, *SCREEN_DIMENSIONS)
+        else:
+            self.sprite = asset_cache.acquire(self, sprite, (width, height))
+            self.tiles = None
+            self.image = self.sprite.subsurface(self.view_rect())
+            self.rect = self.image.get_rect()
         pg.mixer.music.load(self.music)
         pg.mixer.music.set_volume(self.volume)
         
@@ -37,6 +49,10 @@ class Background(pg.sprite.Sprite):
     def get_position(self):
         return self.x_position, self.y_position
         
+    def view_rect(self, origin=None):
+        # Parte do mapa vista pela camera, cortada nas bordas quando o mapa e menor que a tela
+        return pg.Rect(*(self.get_position() if origin is None else origin), *SCREEN_DIMENSIONS).clip(self.sprite.get_rect())
+
     def set_position(self, x_new, y_new):
         self.x_position = x_new
         self.y_position = y_new
@@ -47,7 +63,10 @@ class Background(pg.sprite.Sprite):
         x_new -= SCREEN_DIMENSIONS[0]/2
         y_new -= SCREEN_DIMENSIONS[1]/2
         self.set_position(x_new, y_new)
-        self.image = self.sprite.subsurface((*self.get_position(), *SCREEN_DIMENSIONS))
+        if self.tiles is not None:
+            self.tiles.page(*self.get_position(), *SCREEN_DIMENSIONS)
+        else:
+            self.image = self.sprite.subsurface(self.view_rect())
         
     def play_music(self):
         pg.mixer.music.play(-1)
@@ -59,12 +78,23 @@ class Background(pg.sprite.Sprite):
         self.volume = volume
         pg.mixer.music.set_volume(self.volume)
     
-    def draw_background_image(self):
-        self.screen.blit(self.image, self.rect)
+    def draw_background_image(self, origin=None):
+        # Sem origem, desenha a camera do tick; com ela, a camera entre dois ticks, como os sprites
+        if self.tiles is not None:
+            self.tiles.draw(self.screen, *(self.get_position() if origin is None else origin), *SCREEN_DIMENSIONS)
+        elif origin is None:
+            self.screen.blit(self.image, self.rect)
+        else:
+            self.screen.blit(self.sprite, self.rect, self.view_rect(origin))
     
-    def update(self, x_player, y_player):
+    def update_camera(self, x_player, y_player):
         self.center(x_player, y_player)
         self.position_controller.set_origin(*self.get_position())
+        # Posicao na tela de todas as entidades em uma unica operacao
+        entity_store.translate(self.get_position())
+
+    def update(self, x_player, y_player):
+        self.update_camera(x_player, y_player)
         self.draw_background_image()
         
 
@@ -73,10 +103,10 @@ class Interface():
         self.screen = screen
         self.phase_atual = phase_atual
         self.interface_elements = interface_elements
-        self.player_name = Fonts.PLAYER_NAME.value.render('Player :'+str(self.phase_atual.player.name), True, (123, 173, 123))
-        # self.player_life = Fonts.PLAYER_LIFE.value.render('Life: '+str(self.phase_atual.player.life), True, (123, 173, 223))
-        self.event_warning =  Fonts.EVENT_WARNING.value.render('Volte para a Zona!', True, (255, 255, 255))
-        # self.event_time = Fonts.EVENT_TIME.value.render('Time: '+str(self.phase_atual.current_mandatory_event.time), True, (123, 173, 223))
+        self.player_name = Fonts.PLAYER_NAME.font.render('Player :'+str(self.phase_atual.player.name), True, (123, 173, 123))
+        # self.player_life = Fonts.PLAYER_LIFE.font.render('Life: '+str(self.phase_atual.player.life), True, (123, 173, 223))
+        self.event_warning =  Fonts.EVENT_WARNING.font.render('Volte para a Zona!', True, (255, 255, 255))
+        # self.event_time = Fonts.EVENT_TIME.font.render('Time: '+str(self.phase_atual.current_mandatory_event.time), True, (123, 173, 223))
         
         #  Localizações
         self.player_name_location = (50, 50)
@@ -85,63 +115,81 @@ class Interface():
         self.event_time_location = (SCREEN_DIMENSIONS[0]//2-50, 50)
         
         # Sprite de Vida do Personagem  
-        self.full_heart_image = pg.image.load(FULL_HEART)
-        self.full_heart_image = pg.transform.scale(self.full_heart_image, (50, 50)) 
-        self.empty_heart_image = pg.image.load(EMPTY_HEART)
-        self.empty_heart_image = pg.transform.scale(self.empty_heart_image, (50, 50)) 
-        self.half_heart_image = pg.image.load(HALF_HEART)
-        self.half_heart_image = pg.transform.scale(self.half_heart_image, (50, 50))
+        self.full_heart_image = asset_cache.acquire(self, FULL_HEART, HEART_SIZE)
+        self.empty_heart_image = asset_cache.acquire(self, EMPTY_HEART, HEART_SIZE)
+        self.half_heart_image = asset_cache.acquire(self, HALF_HEART, HEART_SIZE)
         
         self.heart_location = (115, 45)  # Local inicial para os corações
 
         # Sprite de Foto de Perfil do personagem
-        self.shaggy_profile = SHAGGY_PROFILE
-        self.dapnhe_proflle = DAPHNE_PROFILE
-        self.velma_profile = VELMA_PROFILE
-        self.scooby_profile = SCOOBY_PROFILE
-        self.fred_profile = FRED_PROFILE
-        
+        self.profiles = {
+            "Scooby": SCOOBY_PROFILE,
+            "Velma": VELMA_PROFILE,
+            "Daphne": DAPHNE_PROFILE,
+            "Fred": FRED_PROFILE,
+            "Shaggy": SHAGGY_PROFILE,
+        }
+        self.profile_size = PROFILE_SIZE
+        self.profile_location = (10, 10)
+        
+        # Camada retida do HUD, refeita apenas quando o player ou sua vida mudam
+        self.hud = pg.Surface((self.heart_location[0] + 4*60 + 50, self.profile_location[1] + self.profile_size[1]), pg.SRCALPHA)
+        self.hud_state = None
+        self.player_image = None
+        self.player_profile = None
+        self.hud_rebuilds = 0
         
     def set_phase_atual(self, new_phase):
         self.phase_atual = new_phase
-        
-    def draw_interface(self):
-        # Desenha os atributos do player no canto superior esquerdo
-        # self.screen.blit(self.player_name, self.player_name_location)
-        # self.screen.blit(self.player_life, self.player_life_location)
-
-        if self.phase_atual.player.name == "Scooby":
-            player_image = pg.image.load(self.scooby_profile)  # Carrega a imagem de perfil do Scooby
-        
-             # Desenha a imagem no canto superior esquerdo (10, 10)
-        elif self.phase_atual.player.name =="Velma":
-            player_image = pg.image.load(self.velma_profile)  # Carrega a imagem de perfil do Scooby
-        
-        elif self.phase_atual.player.name == "Daphne":
-            player_image = pg.image.load(self.dapnhe_proflle)
-           
-        elif self.phase_atual.player.name == "Fred":
-            player_image = pg.image.load(self.fred_profile)
-           
-        elif self.phase_atual.player.name == "Shaggy":
-            player_image = pg.image.load(self.shaggy_profile)
-           
-        if player_image:
-            player_image = pg.transform.scale(player_image, (100, 100))  # Redimensiona para caber na interface
-            self.screen.blit(player_image, (10, 10))            
-            
-                # Desenha a quantidade de vidas como corações
+    
+    def get_hearts(self, life):
+        # Estado de cada um dos cinco coracoes para a vida atual
+        hearts = []
         for num in range(1, 6):
-            x = self.heart_location[0] + (num-1) * 60  # Espaçamento entre corações
+            if num <= life:
+                hearts.append('full')
+            elif num-1 < life and life < num:
+                hearts.append('half')
+            elif num > life:
+                hearts.append('empty')
+        return tuple(hearts)
+    
+    def set_player_image(self, player):
+        # Carrega a foto de perfil uma unica vez por player, ja no tamanho da interface
+        profile = self.profiles.get(player.name)
+        if profile == self.player_profile:
+            return
+        if self.player_profile:
+            asset_cache.drop(self, self.player_profile, self.profile_size)
+        self.player_profile = profile
+        self.player_image = asset_cache.acquire(self, profile, self.profile_size) if profile else None
+    
+    def build_hud(self, player, hearts):
+        self.set_player_image(player)
+        self.player_life = Fonts.PLAYER_LIFE.font.render('Life: '+str(int(player.life)), True, (123, 173, 223))
+        
+        self.hud.fill((0, 0, 0, 0))
+        if self.player_image:
+            self.hud.blit(self.player_image, self.profile_location)
+        
+        # Desenha a quantidade de vidas como corações
+        heart_images = {'full': self.full_heart_image, 'half': self.half_heart_image, 'empty': self.empty_heart_image}
+        for num, heart in enumerate(hearts):
+            x = self.heart_location[0] + num * 60  # Espaçamento entre corações
             y = self.heart_location[1]
-            if num <=self.phase_atual.player.life:
-                self.screen.blit(self.full_heart_image, (x, y))
-            elif num-1 < self.phase_atual.player.life  and self.phase_atual.player.life < num:
-                self.screen.blit(self.half_heart_image, (x,y))
-            elif num >self.phase_atual.player.life:
-                self.screen.blit(self.empty_heart_image, (x,y))      
+            self.hud.blit(heart_images[heart], (x, y))
+        self.hud_rebuilds += 1
         
-
+    def draw_interface(self):
+        # Refaz a camada do HUD apenas se o que aparece na tela mudou
+        player = self.phase_atual.player
+        hearts = self.get_hearts(player.life)
+        hud_state = (player, player.name, hearts, int(player.life))
+        if hud_state != self.hud_state:
+            self.build_hud(player, hearts)
+            self.hud_state = hud_state
+        
+        self.screen.blit(self.hud, (0, 0))
         
         # Desenha avisos e informacoes da phase no centro superior da tela
         # if self.phase_atual.current_mandatory_event:
@@ -149,13 +197,12 @@ class Interface():
         #         if self.phase_atual.current_mandatory_event.out_zone:
         #             self.screen.blit(self.event_warning, self.event_warning_location)
                 # self.event_time = self.phase_atual.current_mandatory_event.time
-                # self.event_time = Fonts.EVENT_TIME.value.render('Time: '+str(self.event_time), True, (123, 173, 223))
+                # self.event_time = Fonts.EVENT_TIME.font.render('Time: '+str(self.event_time), True, (123, 173, 223))
                 # self.screen.blit(self.event_time, self.event_time_location)
         
         # Desenha o minimapa e as configuracoes no canto superior direito
         
     def update(self):
-        self.player_life = Fonts.PLAYER_LIFE.value.render('Life: '+str(int(self.phase_atual.player.life)), True, (123, 173, 223))
         self.draw_interface()
     
 class PositionController:
@@ -175,6 +222,7 @@ class PositionController:
 
     @staticmethod
     def normalize_movement(movement, speed):
+        movement = np.array(movement, dtype=float)
         norma = np.linalg.norm(movement)
         if norma:
             movement /= norma
@@ -241,7 +289,7 @@ class CollideController:
         comeback = min_distance*np.array([collide_x_axis, not collide_x_axis])*signal
         return -comeback
             
-    def __init__(self, player, npcs, villains, game_objects, collectibles, ammus, mandatory_events, optional_events, scooby_snacks, weapons, phase_elements):
+    def __init__(self, player, npcs, villains, game_objects, collectibles, ammus, mandatory_events, optional_events, scooby_snacks, weapons, phase_elements, static_grid=None, projectiles=None):
         """ Classe que gerencia as colisoes entre os elementos da fase, atualizando os estados dos elementos que colidiram entre si.
 
         Args:
@@ -250,19 +298,28 @@ class CollideController:
             villains (pg.sprite.Group): Monstros da fase.
             game_objects (pg.sprite.Group): Objetos da fase.
             collectibles (pg.sprite.Group): Coletaveis da fase.
-            ammus (pg.sprite.Group): Municoes disparadas na fase.
+            ammus (pg.sprite.Group): Municoes disparadas na fase que estao na tela.
             mandatory_events (pg.sprite.Group): Eventos obrigatorios da fase.
             optional_events (pg.sprite.Group): Eventos opcionais da fase.
             scooby_snacks (Collectible): Caixa de biscoitos scooby da fase.
             weapons (pg.sprite.Group): Armas usadas na fase.
+            static_grid (StaticGrid, opcional): Grade dos objetos estaticos, ja associada aos sprites.
+            projectiles (ProjectilePools, opcional): Pools dos projeteis; os que estao fora da tela tambem atingem os personagens.
         """
         
         self.player = player
         self.npcs = npcs
         self.villains = villains
         self.game_objects = game_objects
+        self.static_grid = static_grid
+        # Objetos estaticos sao tratados pela grade; os demais passam pelo indice espacial
+        if static_grid is not None:
+            self.dynamic_objects = pg.sprite.Group(each_object for each_object in game_objects if each_object not in static_grid.objects)
+        else:
+            self.dynamic_objects = game_objects
         self.collectibles = collectibles
         self.ammus = ammus
+        self.projectiles = projectiles
         self.mandatory_events = mandatory_events
         self.current_mandatory_event = next(iter(self.mandatory_events), None)
         self.optional_events = optional_events
@@ -272,8 +329,13 @@ class CollideController:
         self.characters = pg.sprite.Group(self.villains)
         self.characters.add(self.npcs)
         self.characters.add(self.player)
+        # Indice espacial usado por todos os testes de colisao
+        self.spatial_hash = SpatialHash()
+        # Linhas de tiro dos viloes do ultimo tick, usadas tambem para desenhar as miras
+        self.aim_rays = AimRays()
         
-        self.accessible_elements = pg.sprite.Group()
+        # Conta as mudancas de membros para o conjunto visivel de Phase saber quando refaze-lo
+        self.accessible_elements = VersionedGroup()
         for each_monster in self.villains.sprites():
             self.accessible_elements.add(each_monster.weapon)
 
@@ -304,7 +366,7 @@ class CollideController:
                 optional_event.kill()
         
         # Colisao com coletaveis
-        to_collectible = pg.sprite.spritecollide(self.player, self.collectibles, False)
+        to_collectible = self.spatial_hash.collide(self.player, self.collectibles)
         for each_collectible in to_collectible:
             if each_collectible.visible:
                 # Adiciona ao inventario
@@ -313,98 +375,155 @@ class CollideController:
                 each_collectible.kill()
             
         # Colisao com npcs
-        npcs_to_push = pg.sprite.spritecollide(self.player, self.npcs, False)
+        npcs_to_push = self.spatial_hash.collide(self.player, self.npcs)
         for each_npc in npcs_to_push:
             comeback = -self.locate_collide(self.player, each_npc)
-            comeback = each_npc.apply_movement(comeback)
+            comeback = self.push(each_npc, comeback)
             if comeback.any():
-                self.player.apply_movement(comeback, False)
+                self.push(self.player, comeback, False)
     
+    def push(self, sprite, movement, *args):
+        """ Move um sprite durante a resolucao das colisoes e atualiza suas celulas no indice espacial,
+        para que as consultas seguintes do mesmo tick o encontrem na posicao nova.
+
+        Args:
+            sprite (pg.sprite.Sprite): Sprite movido.
+            movement (np.array): Movimento aplicado com `apply_movement`.
+            *args: Demais argumentos de `apply_movement`.
+
+        Returns:
+            np.array: Parte do movimento que nao pode ser aplicada.
+        """
+        comeback = sprite.apply_movement(movement, *args)
+        if sprite in self.spatial_hash:
+            self.spatial_hash.insert(sprite)
+        return comeback
+
     def ammus_collide_with(self):
+        """ Processa os projeteis que atingem personagens ou objetos.
+
+        Cada par projetil-personagem que se sobrepoe no tick causa o dano do projetil uma
+        vez: um projetil sobre dois personagens atinge os dois e depois e devolvido ao pool.
+        """
         # Colisao com personagens
-        character_hit_by_ammu = pg.sprite.groupcollide(self.ammus, self.characters, False, False)
-        for ammu  in self.ammus.sprites():
-            for each_ammu in character_hit_by_ammu.keys():
-                for each_character in character_hit_by_ammu[each_ammu]:
-                    # Atinge o personagem
+        character_hit_by_ammu = self.spatial_hash.groupcollide(self.ammus, self.characters)
+        hits = [(each_ammu, each_character) for each_ammu in character_hit_by_ammu.keys() for each_character in character_hit_by_ammu[each_ammu]]
+        # Projeteis fora da tela nao tem rect: sao testados no mapa, pelas posicoes do armazenamento
+        if self.projectiles is not None:
+            characters = self.characters.sprites()
+            rows = [each_character.row for each_character in characters]
+            for each_ammu, index in self.projectiles.hidden_hits(entity_store.position[rows], entity_store.size[rows]/2):
+                hits.append((each_ammu, characters[index]))
 
-                    each_character.life -= each_ammu.damage
+        for each_ammu, each_character in hits:
+            # Atinge o personagem
 
-                    if not damage.get_num_channels():  # Verifica se o canal está livre
-                        # self.steps.stop()
-                        damage.play(0)
+            each_character.life -= each_ammu.damage
 
-                    # Remove todas as referencias
-                    each_ammu.kill()
+            if not sound_bank.is_playing('damage'):  # Verifica se o canal está livre
+                # self.steps.stop()
+                sound_bank.play('damage')
+
+            # Remove todas as referencias
+            each_ammu.kill()
 
         # Colisao com objetos
-        destroyed_ammus = pg.sprite.groupcollide(self.ammus, self.game_objects, False, False).keys()
+        # Os objetos estaticos ja destruiram os projeteis no pool
+        destroyed_ammus = self.spatial_hash.groupcollide(self.ammus, self.dynamic_objects).keys()
         for each_ammu in destroyed_ammus:
             each_ammu.kill()
         
     
 
     def game_objects_collide_with(self):
+        # Objetos estaticos nao se movem: apenas devolvem o personagem
+        if self.static_grid is not None:
+            origin = (PositionController.x_origin, PositionController.y_origin)
+            for each_character in self.characters:
+                for each_object in self.static_grid.collide(each_character.rect, origin):
+                    comeback = self.locate_collide(each_character, each_object)
+                    self.push(each_character, comeback, False)
+
         # Colisao com objetos (empurra-os, caso consiga)
-        object_pushed_by_character = pg.sprite.groupcollide(self.characters, self.game_objects, False, False)
+        object_pushed_by_character = self.spatial_hash.groupcollide(self.characters, self.dynamic_objects)
         for each_character in object_pushed_by_character.keys():
             for each_object in object_pushed_by_character[each_character]:
                 if each_object.is_static:
                     comeback = self.locate_collide(each_character, each_object)
-                    comeback = each_character.apply_movement(comeback, False)
+                    comeback = self.push(each_character, comeback, False)
                     if comeback.any():
-                        _ = each_object.apply_movement(comeback)
+                        _ = self.push(each_object, comeback)
                     
                 else:
-                    comeback = each_object.apply_movement(each_character.movement)
+                    comeback = self.push(each_object, each_character.movement)
                     if comeback.any():
-                        _ = each_character.apply_movement(comeback, False)
+                        _ = self.push(each_character, comeback, False)
 
     
     def monsters_collide_with(self):
         fired = []
         # Colisao com algum personagem
-        characters_to_push = pg.sprite.groupcollide(self.villains, self.characters, False, False)
+        characters_to_push = self.spatial_hash.groupcollide(self.villains, self.characters)
         for each_villain in characters_to_push.keys():
             for each_character in characters_to_push[each_villain]:
                 # Nao se empurra
                 if each_villain != each_character and each_villain.movement.any():
                     comeback = -self.locate_collide(each_villain, each_character)
-                    comeback = each_character.apply_movement(comeback)
+                    comeback = self.push(each_character, comeback)
                     if comeback.any():
-                        _ = each_villain.apply_movement(comeback, False)
-        
-        # Atira no personagem caso ele esteja na mira e tenha recarregado
-        for each_villain in self.villains.sprites():
-            if each_villain.aim.any():
-                if self.player.rect.clipline(each_villain.weapon.rect.center, np.array(each_villain.weapon.rect.center) + each_villain.aim*each_villain.weapon.scope/np.linalg.norm(each_villain.aim)) and each_villain.weapon.check_load():
-                    bullet = each_villain.weapon.fire(each_villain.aim)
-                    fired.append(bullet)
-                    
-        self.accessible_elements.add(fired)
-        self.ammus.add(fired)
-        
+                        _ = self.push(each_villain, comeback, False)
+        
+        # Atira no personagem caso ele esteja na mira e tenha recarregado; as linhas de tiro
+        # de todos os viloes sao testadas de uma vez, e os objetos estaticos bloqueiam a mira
+        occluders = self.static_grid.rects if self.static_grid is not None else None
+        self.aim_rays.cast(self.villains.sprites(), self.player, occluders)
+        for each_villain in self.aim_rays.shooters():
+            if each_villain.weapon.check_load():
+                bullet = each_villain.weapon.fire(each_villain.aim)
+                fired.append(bullet)
+        
+        # Os projeteis sao movidos pelo seu pool e entram em self.ammus quando ficam visiveis
         return fired
     
     def npcs_collide_with(self):
+        """ Separa os npcs que se sobrepoem.
+
+        Cada par e resolvido uma vez por tick, pelo primeiro npc do par que esta se movendo:
+        o outro e empurrado e, se nao puder sair, devolve o movimento. O par inverso nao
+        empurra de novo.
+        """
         # npcs empurram uns aos outros
-        npcs_pushed_by_npcs = pg.sprite.groupcollide(self.npcs, self.npcs, False, False)
+        npcs_pushed_by_npcs = self.spatial_hash.groupcollide(self.npcs, self.npcs)
+        handled = set()
         for each_npc1 in npcs_pushed_by_npcs.keys():
             for each_npc2 in npcs_pushed_by_npcs[each_npc1]:
                 # Nao se empurram
-                if each_npc1 != each_npc2 and each_npc1.movement.any():
+                if each_npc1 != each_npc2 and each_npc1.movement.any() and (each_npc1, each_npc2) not in handled:
                     # Separa o npc2 do npc1
                     comeback = -self.locate_collide(each_npc1, each_npc2)
-                    comeback = each_npc2.apply_movement(comeback)
+                    comeback = self.push(each_npc2, comeback)
                     if comeback.any():
-                        _ = each_npc1.apply_movement(comeback)
+                        _ = self.push(each_npc1, comeback)
                         
                     # Nao precisa tratar a mesma colisao depois
-                    npcs_pushed_by_npcs[each_npc2].remove(each_npc1)
+                    handled.add((each_npc2, each_npc1))
     
     
+    def index_elements(self):
+        """ Atualiza o indice espacial com as posicoes atuais dos elementos que colidem.
+
+        Chamado uma vez por tick, antes da resolucao; depois disso, quem e empurrado em `push`
+        atualiza as proprias celulas.
+        """
+        collidables = list(self.characters)
+        collidables.extend(self.dynamic_objects)
+        collidables.extend(self.collectibles)
+        collidables.extend(self.ammus)
+        self.spatial_hash.sync(collidables, (PositionController.x_origin, PositionController.y_origin))
+
     def update(self, phase_elements):
         fired = []
+        self.index_elements()
         self.player_collide_with()
         self.ammus_collide_with()
         self.game_objects_collide_with()
@@ -412,11 +531,6 @@ class CollideController:
         self.npcs_collide_with()
         fired.extend(fired_by_villains)
         
-
-
-        if fired:
-            phase_elements.add(fired)
-        
         """
         Colisoes:
         player - monstro (atacado)
@@ -1,6 +1,8 @@
 import pygame as pg
 from abc import ABC, abstractmethod
 from src.classes.background import PositionController
+from src.classes.assets import asset_cache
+from src.classes.entities import entity_store
 import numpy as np
 
 class Character(pg.sprite.Sprite, ABC):
@@ -47,9 +49,13 @@ class Character(pg.sprite.Sprite, ABC):
     perception : float
         O alcance de percepção do personagem.
     x_position : float
-        A posição X do personagem.
+        A posição X do personagem, lida da linha do personagem em `entity_store`.
     y_position : float
-        A posição Y do personagem.
+        A posição Y do personagem, lida da linha do personagem em `entity_store`.
+    store : EntityStore
+        O armazenamento que guarda a posição, o tamanho e os limites do personagem.
+    row : int
+        A linha do personagem em `store`.
     width : int
         A largura da imagem do personagem.
     height : int
@@ -58,6 +64,8 @@ class Character(pg.sprite.Sprite, ABC):
         A imagem atual do personagem, extraída do spritesheet.
     spritesheet : pg.Surface
         O spritesheet contendo as animações do personagem.
+    frames : tuple
+        Os quadros pré-fatiados do spritesheet, indexados por [direção][quadro].
     current_sprite_x : int
         O índice da sprite atual no eixo X.
     current_sprite_y : int
@@ -108,19 +116,19 @@ class Character(pg.sprite.Sprite, ABC):
         self._speed = speed
         self._perception = perception
         self.position_controller = PositionController(map_limits_sup, width, height)
-        self._x_position = x_position
-        self._y_position = y_position
+        self.store = entity_store
+        self.row = self.store.attach(self, x_position, y_position, width, height, map_limits_sup)
         self._width = width
         self._height = height
         self.movement = np.zeros(2, dtype=float)
-        self._spritesheet = pg.image.load(f'assets\\spritesheets\\{name}_{skin}.png')
-        self._spritesheet = pg.transform.scale(self._spritesheet, (width*sprites_quantity, height*4))
+        self.spritesheet_path = f'assets\\spritesheets\\{name}_{skin}.png'
         self.sprites_quantity = sprites_quantity 
         self._current_sprite_x = 0
         self._current_sprite_y = direction
-        self.image = self.spritesheet.subsurface((self._current_sprite_x * self.width, self._current_sprite_y * self.height, self.width, self.height))
+        self._spritesheet_size = None
+        self.load_frames()
         self.rect = self.image.get_rect()
-        self.rect.center = self._x_position, self._y_position
+        self.rect.center = self.x_position, self.y_position
         self._bullets = bullets
         self._aim = np.zeros(2, dtype=float)
         self._weapon = weapon
@@ -195,7 +203,7 @@ class Character(pg.sprite.Sprite, ABC):
         float
             A posição X do personagem.
         """
-        return self._x_position
+        return self.store.position[self.row, 0]
 
     @x_position.setter
     def x_position(self, value):
@@ -207,7 +215,7 @@ class Character(pg.sprite.Sprite, ABC):
         value : float
             A nova posição X do personagem.
         """
-        self._x_position = value
+        self.store.set_position(self.row, (value, self.y_position))
 
     @property
     def y_position(self):
@@ -219,7 +227,7 @@ class Character(pg.sprite.Sprite, ABC):
         float
             A posição Y do personagem.
         """
-        return self._y_position
+        return self.store.position[self.row, 1]
 
     @y_position.setter
     def y_position(self, value):
@@ -231,7 +239,19 @@ class Character(pg.sprite.Sprite, ABC):
         value : float
             A nova posição Y do personagem.
         """
-        self._y_position = value
+        self.store.set_position(self.row, (self.x_position, value))
+
+    @property
+    def screen_position(self):
+        """
+        Retorna a posição do personagem no sistema de coordenadas da tela.
+
+        Returns
+        -------
+        tuple
+            A posição (x, y) do personagem relativa à câmera.
+        """
+        return tuple(self.store.screen_position[self.row])
 
     @property
     def width(self):
@@ -248,7 +268,7 @@ class Character(pg.sprite.Sprite, ABC):
     @width.setter
     def width(self, value):
         """
-        Define a largura da imagem do personagem e ajusta o tamanho da sprite.
+        Define a largura da imagem do personagem e recarrega a tabela de quadros no novo tamanho.
 
         Parameters
         ----------
@@ -256,8 +276,9 @@ class Character(pg.sprite.Sprite, ABC):
             A nova largura da imagem do personagem.
         """
         self._width = value
+        self.store.resize(self.row, (value, self.store.size[self.row, 1]))
         self.rect.width = value
-        self.image = pg.transform.scale(self.image, (self.rect.width, self.rect.height))
+        self.load_frames()
 
     @property
     def height(self):
@@ -274,7 +295,7 @@ class Character(pg.sprite.Sprite, ABC):
     @height.setter
     def height(self, value):
         """
-        Define a altura da imagem do personagem e ajusta o tamanho da sprite.
+        Define a altura da imagem do personagem e recarrega a tabela de quadros no novo tamanho.
 
         Parameters
         ----------
@@ -282,8 +303,9 @@ class Character(pg.sprite.Sprite, ABC):
             A nova altura da imagem do personagem.
         """
         self._height = value
+        self.store.resize(self.row, (self.store.size[self.row, 0], value))
         self.rect.height = value
-        self.image = pg.transform.scale(self.image, (self.rect.width, self.rect.height))
+        self.load_frames()
 
     @property
     def image(self):
@@ -333,6 +355,33 @@ class Character(pg.sprite.Sprite, ABC):
         """
         self._spritesheet = value
 
+    @property
+    def frames(self):
+        """
+        Retorna a tabela de quadros de animacao do personagem.
+
+        Returns
+        -------
+        tuple
+            Quadros indexados por [direcao][quadro], compartilhados entre personagens com a mesma skin.
+        """
+        return self._frames
+
+    def load_frames(self):
+        """
+        Obtem do cache de assets a spritesheet e a tabela de quadros no tamanho atual do personagem.
+
+        A spritesheet tem uma linha por direcao e `sprites_quantity` quadros por linha. Caso o
+        personagem ja possua uma spritesheet de outro tamanho, a referencia antiga e liberada.
+        """
+        size = (self._width*self.sprites_quantity, self._height*4)
+        if self._spritesheet_size is not None and self._spritesheet_size != size:
+            asset_cache.drop(self, self.spritesheet_path, self._spritesheet_size)
+        self._spritesheet = asset_cache.acquire(self, self.spritesheet_path, size)
+        self._spritesheet_size = size
+        self._frames = asset_cache.frames(self.spritesheet_path, size, self.sprites_quantity, 4)
+        self.image = self._frames[self._current_sprite_y][int(self._current_sprite_x)]
+
     @property
     def current_sprite_x(self):
         """
@@ -447,14 +496,14 @@ class Character(pg.sprite.Sprite, ABC):
         Atualiza a animação do personagem, trocando a sprite atual.
 
         Esse método altera o índice da sprite para a próxima na animação, 
-        se houver mais de uma sprite disponível.
+        se houver mais de uma sprite disponível. O quadro é lido da tabela pré-fatiada,
+        sem criar novas superfícies.
         """
         if self.sprites_quantity > 1:
             self._current_sprite_x += 0.2
             if self._current_sprite_x >= self.sprites_quantity:
                 self.current_sprite_x = 0
-            current_sprite_x = int(self.current_sprite_x)
-            self.image = self.spritesheet.subsurface((current_sprite_x * self.width, self._current_sprite_y * self.height, self.width, self.height))
+            self.image = self._frames[self._current_sprite_y][int(self._current_sprite_x)]
     
     def redefine_direction(self, movement):
         """
@@ -506,18 +555,13 @@ class Character(pg.sprite.Sprite, ABC):
         if redefine_direction:
             self.redefine_direction(movement)
         
-        x_new = self.x_position + movement[0]
-        y_new = self.y_position + movement[1]
-        x_new_corrected, y_new_corrected = self.position_controller.to_frame(x_new, y_new)
-        
         # Devolve a parte do movimento que nao foi aplicado
-        comeback = np.array([x_new, y_new]) - np.array([x_new_corrected, y_new_corrected])
-        
-        self.x_position = x_new_corrected
-        self.y_position = y_new_corrected
+        comeback = self.store.move(self.row, movement)
         self.movement = movement
+        # O rect acompanha a posicao, inclusive quando a resolucao de colisoes empurra o personagem
+        self.set_position_rect(*self.screen_position)
         
-        return -comeback
+        return comeback
         
     @abstractmethod
     def update(self):
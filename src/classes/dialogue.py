@@ -0,0 +1,276 @@
+"""
+This module contains the dialogue renderer used by the menu. Each dialog entry is
+laid out only once (wrapped lines, rendered lines, per-character offsets and the
+speaker portrait), so drawing a frame of the typewriter effect is just a few blits.
+"""
+import pygame
+from src.settings import PROFILE_SIZE
+from src.classes.assets import asset_cache
+
+
+TEXT_COLOR = (255, 255, 255)
+
+
+def wrap_text(text, font, max_width):
+    """
+    Splits the text in lines that fit the maximum width.
+
+    Parameters
+    ----------
+    text : str
+        The text to be wrapped.
+
+    font : pygame.font.Font
+        The font used to measure the text.
+
+    max_width : int
+        The maximum width of the dialog box.
+
+    Returns
+    -------
+    list
+        The wrapped lines.
+    """
+    words = text.split(" ")
+    lines = []
+    current_line = ""
+
+    for word in words:
+        if font.size(current_line + word)[0] + 100 <= max_width:
+            current_line += word + " "
+        else:
+            lines.append(current_line.strip())
+            current_line = word + " "
+
+    if current_line:
+        lines.append(current_line.strip())
+
+    return lines
+
+
+class DialogueLayout:
+    """
+    The precomputed layout of a single dialog entry.
+
+    Attributes
+    ----------
+    speaker_text : pygame.Surface
+        The rendered speaker name.
+
+    lines : list
+        The wrapped lines of the text.
+
+    line_surfaces : list
+        Each wrapped line rendered once, in full.
+
+    advances : list
+        For each line, the pixel width of every prefix, so that `advances[i][n]`
+        is the width of the first `n` characters of the line `i`.
+
+    total_chars : int
+        The number of characters of all the lines.
+    """
+
+    def __init__(self, dialog, font, max_width):
+        """
+        Lays out a dialog entry.
+
+        Parameters
+        ----------
+        dialog : dict
+            The dialog entry, with the keys "speaker" and "text".
+
+        font : pygame.font.Font
+            The font used to render the text.
+
+        max_width : int
+            The maximum width of the dialog box.
+
+        Returns
+        -------
+        None.
+        """
+        self.speaker = dialog["speaker"]
+        self.speaker_text = font.render(self.speaker + ":", True, TEXT_COLOR)
+        self.lines = wrap_text(dialog["text"], font, max_width)
+        self.line_surfaces = [font.render(line, True, TEXT_COLOR) for line in self.lines]
+        self.advances = [[font.size(line[:n])[0] for n in range(len(line) + 1)] for line in self.lines]
+        self.total_chars = sum(len(line) for line in self.lines)
+
+
+class DialogueRenderer:
+    """
+    Draws dialog boxes with a typewriter effect, reusing the layout of each entry.
+
+    Attributes
+    ----------
+    font : pygame.font.Font
+        The font used to render the dialogs, created only once.
+
+    max_width : int
+        The maximum width of the text.
+
+    start_y : int
+        The vertical position of the first line.
+
+    line_spacing : int
+        The distance between two lines.
+
+    box_height : int
+        The height of the dialog box.
+
+    reveal_speed : int
+        Milliseconds needed to reveal a new character.
+
+    Methods
+    -------
+    layout(dialog)
+        Returns the cached layout of a dialog entry.
+
+    portrait(speaker)
+        Returns the cached portrait of a speaker.
+
+    draw(screen, dialog, elapsed)
+        Draws the dialog box revealing the characters according to the elapsed time.
+    """
+
+    def __init__(self, font, max_width, start_y, line_spacing, box_height=150, reveal_speed=50):
+        """
+        Initializes the DialogueRenderer instance.
+
+        Parameters
+        ----------
+        font : pygame.font.Font
+            The font used to render the dialogs.
+
+        max_width : int
+            The maximum width of the text.
+
+        start_y : int
+            The vertical position of the first line.
+
+        line_spacing : int
+            The distance between two lines.
+
+        box_height : int
+            The height of the dialog box.
+
+        reveal_speed : int
+            Milliseconds needed to reveal a new character.
+
+        Returns
+        -------
+        None.
+        """
+        self.font = font
+        self.max_width = max_width
+        self.start_y = start_y
+        self.line_spacing = line_spacing
+        self.box_height = box_height
+        self.reveal_speed = reveal_speed
+        self.box_rect = pygame.Rect(30, start_y - 20, max_width + 40, box_height)
+        self.portrait_size = PROFILE_SIZE
+        self._layouts = {}
+        self._portraits = {}
+
+    def layout(self, dialog):
+        """
+        Returns the layout of a dialog entry, computing it on the first request.
+
+        Parameters
+        ----------
+        dialog : dict
+            The dialog entry, with the keys "speaker" and "text".
+
+        Returns
+        -------
+        DialogueLayout
+            The layout of the entry.
+        """
+        key = (dialog["speaker"], dialog["text"])
+        if key not in self._layouts:
+            self._layouts[key] = DialogueLayout(dialog, self.font, self.max_width)
+        return self._layouts[key]
+
+    def portrait(self, speaker):
+        """
+        Returns the portrait of the speaker, loaded and scaled only once.
+
+        Parameters
+        ----------
+        speaker : str
+            The name of the speaker.
+
+        Returns
+        -------
+        pygame.Surface
+            The portrait of the speaker.
+        """
+        if speaker not in self._portraits:
+            self._portraits[speaker] = asset_cache.acquire(self, f'assets/spritesheets/{speaker}_dialogue.png', self.portrait_size)
+        return self._portraits[speaker]
+
+    def draw_dialog_box(self, screen, speaker, bg_color=(50, 50, 50), border_color=(255, 255, 255), border_width=2):
+        """
+        Draws the default rectangle of the dialog and the portrait of the speaker.
+
+        Returns
+        -------
+        None.
+        """
+        pygame.draw.rect(screen, bg_color, self.box_rect)
+        pygame.draw.rect(screen, border_color, self.box_rect, border_width)
+        # Ajustado para alinhar a imagem ao fundo
+        screen.blit(self.portrait(speaker), (self.box_rect.x + 20, self.box_rect.y + (self.box_rect.height - 120)))
+
+    def draw(self, screen, dialog, elapsed):
+        """
+        Draws the dialog and reveals its text little by little.
+
+        Parameters
+        ----------
+        screen : pygame.Surface
+            The surface where the dialog is drawn.
+
+        dialog : dict
+            The dialog entry, with the keys "speaker" and "text".
+
+        elapsed : int
+            Milliseconds since the dialog started.
+
+        Returns
+        -------
+        bool
+            True if every character has already been revealed.
+        """
+        layout = self.layout(dialog)
+        text_x = self.box_rect.x + 130
+
+        self.draw_dialog_box(screen, layout.speaker)
+        screen.blit(layout.speaker_text, (text_x, self.start_y))
+
+        # Calcula quantas letras mostrar com base no tempo
+        total_chars = elapsed // self.reveal_speed
+
+        # Revela o texto aumentando a largura visivel de cada linha ja renderizada
+        y_offset = self.start_y + 40
+        char_count = 0
+        for line, line_surface, advances in zip(layout.lines, layout.line_surfaces, layout.advances):
+            if y_offset + self.line_spacing > self.box_rect.bottom:
+                break  # Não exibe além da altura do box
+
+            if char_count + len(line) < total_chars:
+                # Mostra a linha inteira se já passou do tempo
+                screen.blit(line_surface, (text_x, y_offset))
+                char_count += len(line)
+            else:
+                # Mostra apenas parte da linha
+                visible_chars = max(0, min(total_chars - char_count, len(line)))
+                area = pygame.Rect(0, 0, advances[visible_chars], line_surface.get_height())
+                screen.blit(line_surface, (text_x, y_offset), area)
+                break
+
+            y_offset += self.line_spacing
+
+        # Verifica se todas as letras já foram exibidas
+        return total_chars >= layout.total_chars
@@ -0,0 +1,343 @@
+import weakref
+import numpy as np
+
+
+class EntityStore:
+    """
+    Dados espaciais de todas as entidades do jogo em arrays NumPy contiguos.
+
+    Cada entidade ocupa uma linha dos arrays de posicao, posicao na tela, tamanho, velocidade
+    e limites do mapa. `GameObject` e `Character` guardam apenas o indice da sua linha, de modo
+    que a translacao da camera e o enquadramento nos limites do mapa sao feitos por operacoes
+    vetorizadas sobre todas as linhas de uma vez. Os arrays dobram de tamanho quando ficam
+    cheios, entao a linha de uma entidade e estavel mas os arrays podem ser trocados: nunca
+    guarde uma view de uma linha.
+
+    Parameters
+    ----------
+    capacity : int
+        Quantidade inicial de linhas.
+
+    Attributes
+    ----------
+    position : np.ndarray
+        Posicao (x, y) no mapa, formato (capacidade, 2).
+    screen_position : np.ndarray
+        Posicao (x, y) no sistema de coordenadas da tela, sempre igual a `position - origin`.
+    size : np.ndarray
+        Largura e altura.
+    velocity : np.ndarray
+        Deslocamento por quadro, aplicado por `integrate`.
+    limits_inf, limits_sup : np.ndarray
+        Menor e maior posicao permitidas para o centro da entidade.
+    previous_position : np.ndarray
+        Posicao no mapa no tick anterior da simulacao, gravada por `snapshot`.
+    alive : np.ndarray
+        Linhas ocupadas.
+    owners : list
+        Referencia fraca para o objeto dono de cada linha, quando reservada por `attach`.
+    origin : np.ndarray
+        Canto superior esquerdo da camera, em coordenadas do mapa.
+    previous_origin : np.ndarray
+        Origem da camera no tick anterior.
+    """
+    FIELDS = ('position', 'previous_position', 'screen_position', 'size', 'velocity', 'limits_inf', 'limits_sup')
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        for field in self.FIELDS:
+            setattr(self, field, np.zeros((capacity, 2)))
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.owners = [None]*capacity
+        self.origin = np.zeros(2)
+        self.previous_origin = np.zeros(2)
+        self._count = 0
+        self._free = []
+        self._logs = weakref.WeakSet()
+
+    def __len__(self):
+        return int(self.alive.sum())
+
+    @property
+    def used(self):
+        """
+        Quantidade de linhas ja usadas, vivas ou livres; as demais nunca foram ocupadas.
+        """
+        return self._count
+
+    def _grow(self):
+        """
+        Dobra a capacidade dos arrays, copiando as linhas existentes.
+        """
+        capacity = self.capacity*2
+        for field in self.FIELDS:
+            array = np.zeros((capacity, 2))
+            array[:self.capacity] = getattr(self, field)
+            setattr(self, field, array)
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:self.capacity] = self.alive
+        self.alive = alive
+        self.owners.extend([None]*(capacity - self.capacity))
+        self.capacity = capacity
+
+    def add(self, x_position, y_position, width, height, map_limits_sup):
+        """
+        Reserva uma linha para uma nova entidade.
+
+        Os limites seguem `PositionController`: o centro da entidade fica a meia largura e
+        meia altura das bordas do mapa.
+
+        Parameters
+        ----------
+        x_position, y_position : float
+            Posicao inicial no mapa.
+        width, height : float
+            Tamanho da entidade.
+        map_limits_sup : sequence
+            Largura e altura do mapa.
+
+        Returns
+        -------
+        int
+            Indice da linha da entidade.
+        """
+        if self._free:
+            row = self._free.pop()
+        else:
+            if self._count == self.capacity:
+                self._grow()
+            row = self._count
+            self._count += 1
+        half = np.array([width, height], dtype=float)/2
+        self.position[row] = x_position, y_position
+        self.previous_position[row] = self.position[row]
+        self.screen_position[row] = self.position[row] - self.origin
+        self.size[row] = width, height
+        self.velocity[row] = 0
+        self.limits_inf[row] = half
+        self.limits_sup[row] = np.asarray(map_limits_sup[:2], dtype=float) - half
+        self.alive[row] = True
+        self._touch(row)
+        return row
+
+    def attach(self, owner, *args):
+        """
+        Reserva uma linha (como `add`) que e liberada quando `owner` for coletado.
+
+        Returns
+        -------
+        int
+            Indice da linha da entidade.
+        """
+        row = self.add(*args)
+        self.owners[row] = weakref.ref(owner)
+        weakref.finalize(owner, self.remove, row)
+        return row
+
+    def owner(self, row):
+        """
+        Retorna o objeto dono da linha, ou None se a linha estiver livre ou sem dono.
+        """
+        reference = self.owners[row]
+        return reference() if reference is not None else None
+
+    def remove(self, row):
+        """
+        Libera a linha de uma entidade, que pode ser reutilizada por outra.
+        """
+        if self.alive[row]:
+            self.alive[row] = False
+            self.velocity[row] = 0
+            self.owners[row] = None
+            self._free.append(row)
+            self._touch(row)
+
+    def set_position(self, rows, positions):
+        """
+        Move as entidades para as posicoes dadas, sem enquadrar nos limites do mapa.
+
+        Parameters
+        ----------
+        rows : int ou np.ndarray
+            Linha ou linhas das entidades.
+        positions : array_like
+            Novas posicoes, no formato de `position[rows]`.
+        """
+        self.position[rows] = positions
+        self.screen_position[rows] = self.position[rows] - self.origin
+        self._touch(rows)
+
+    def resize(self, rows, sizes):
+        """
+        Muda o tamanho das entidades, sem mudar os limites do mapa.
+
+        Parameters
+        ----------
+        rows : int ou np.ndarray
+            Linha ou linhas das entidades.
+        sizes : array_like
+            Novos tamanhos, no formato de `size[rows]`.
+        """
+        self.size[rows] = sizes
+        self._touch(rows)
+
+    def watch(self):
+        """
+        Retorna um registro das linhas que forem ocupadas, liberadas, movidas ou redimensionadas daqui em diante.
+
+        O registro e esquecido quando quem o pediu deixa de referencia-lo.
+
+        Returns
+        -------
+        RowLog
+            O registro, inicialmente vazio.
+        """
+        log = RowLog()
+        self._logs.add(log)
+        return log
+
+    def _touch(self, rows):
+        for log in self._logs:
+            log.record(rows)
+
+    def move(self, rows, movements):
+        """
+        Desloca as entidades, enquadrando-as nos limites do mapa.
+
+        Parameters
+        ----------
+        rows : int ou np.ndarray
+            Linha ou linhas das entidades.
+        movements : array_like
+            Deslocamento (dx, dy) de cada entidade.
+
+        Returns
+        -------
+        np.ndarray
+            A parte de cada deslocamento que foi aplicada a menos por causa dos limites,
+            com o sinal de `apply_movement` (zero quando o movimento foi aplicado inteiro).
+        """
+        target = self.position[rows] + np.asarray(movements, dtype=float)
+        framed = np.minimum(np.maximum(target, self.limits_inf[rows]), self.limits_sup[rows])
+        self.set_position(rows, framed)
+        return framed - target
+
+    def integrate(self, rows=None):
+        """
+        Soma a velocidade a posicao das entidades, sem enquadrar nos limites do mapa.
+
+        Parameters
+        ----------
+        rows : int ou np.ndarray, opcional
+            Linhas a atualizar. Por padrao, todas as entidades vivas.
+        """
+        if rows is None:
+            rows = np.flatnonzero(self.alive[:self.used])
+        self.set_position(rows, self.position[rows] + self.velocity[rows])
+
+    def translate(self, origin):
+        """
+        Recalcula a posicao na tela de todas as entidades para uma nova posicao da camera.
+
+        Parameters
+        ----------
+        origin : sequence
+            Canto superior esquerdo da camera, em coordenadas do mapa.
+        """
+        self.origin[:] = origin
+        np.subtract(self.position[:self.used], self.origin, out=self.screen_position[:self.used])
+
+    def snapshot(self):
+        """
+        Grava as posicoes e a origem atuais como as do tick anterior, no inicio de cada tick.
+        """
+        self.previous_position[:self.used] = self.position[:self.used]
+        self.previous_origin[:] = self.origin
+
+    def interpolated_screen_position(self, rows, alpha):
+        """
+        Retorna a posicao na tela das entidades entre o tick anterior e o atual.
+
+        Parameters
+        ----------
+        rows : int ou np.ndarray
+            Linha ou linhas das entidades.
+        alpha : float
+            Fracao do proximo tick ja decorrida; 1 devolve `screen_position`.
+
+        Returns
+        -------
+        np.ndarray
+            Posicoes na tela, no formato de `position[rows]`.
+        """
+        position = self.previous_position[rows] + alpha*(self.position[rows] - self.previous_position[rows])
+        return position - self.interpolated_origin(alpha)
+
+    def interpolated_origin(self, alpha):
+        """
+        Retorna a origem da camera entre o tick anterior e o atual.
+        """
+        return self.previous_origin + alpha*(self.origin - self.previous_origin)
+
+
+class RowLog:
+    """
+    Linhas de um `EntityStore` alteradas desde a ultima leitura, criado por `EntityStore.watch`.
+
+    Se ninguem le o registro por muito tempo, ele deixa de guardar as linhas e passa a
+    indicar que todas podem ter mudado.
+
+    Parameters
+    ----------
+    limit : int
+        Quantidade de registros guardados antes de desistir das linhas.
+
+    Attributes
+    ----------
+    overflowed : bool
+        Indica que as linhas foram esquecidas e todas devem ser consideradas alteradas.
+    """
+    def __init__(self, limit=4096):
+        self.limit = limit
+        self.overflowed = False
+        self._rows = []
+
+    def record(self, rows):
+        """
+        Anota uma linha ou um array de linhas alteradas.
+        """
+        if self.overflowed:
+            return
+        if len(self._rows) >= self.limit:
+            self.overflowed = True
+            self._rows = []
+            return
+        # Copia, porque quem chama pode reutilizar o array
+        self._rows.append(np.array(rows, dtype=np.intp, ndmin=1))
+
+    def drain(self, used):
+        """
+        Retorna as linhas alteradas desde a ultima leitura, sem repeticao, e esvazia o registro.
+
+        Parameters
+        ----------
+        used : int
+            Quantidade de linhas usadas no armazenamento, devolvidas todas se o registro transbordou.
+
+        Returns
+        -------
+        np.ndarray
+            As linhas alteradas, em ordem crescente.
+        """
+        if self.overflowed:
+            self.overflowed = False
+            return np.arange(used, dtype=np.intp)
+        if not self._rows:
+            return np.zeros(0, dtype=np.intp)
+        rows = np.unique(np.concatenate(self._rows))
+        self._rows = []
+        return rows
+
+
+# Armazenamento compartilhado pelas entidades de todas as fases
+entity_store = EntityStore()
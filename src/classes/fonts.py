@@ -0,0 +1,76 @@
+import os
+import pygame as pg
+
+
+# Fonte distribuida com o jogo, usada pelo menu e pelos dialogos
+FONT_PATH = 'assets/font.ttf'
+
+
+class FontRegistry:
+    """
+    Registro de fontes carregadas sob demanda e compartilhadas.
+
+    Cada fonte e identificada por (face, tamanho, negrito, italico) e so e criada no primeiro
+    uso. Fontes do sistema dependem da busca de `pg.font.SysFont`, que na primeira chamada
+    enumera as fontes instaladas (no Linux executando o fc-list); por isso nada e resolvido
+    na importacao. A face None representa a fonte distribuida com o jogo, cujo caminho e
+    resolvido uma unica vez na criacao do registro.
+
+    Parameters
+    ----------
+    bundled_path : str
+        Caminho da fonte distribuida com o jogo.
+
+    Attributes
+    ----------
+    loads : int
+        Quantidade de fontes criadas.
+    """
+    def __init__(self, bundled_path=FONT_PATH):
+        self.bundled_path = os.path.normpath(bundled_path.replace('\\', '/'))
+        self.loads = 0
+        self._fonts = {}
+
+    def get(self, face=None, size=30, bold=False, italic=False):
+        """
+        Retorna a fonte pedida, criando-a no primeiro uso.
+
+        Parameters
+        ----------
+        face : str, opcional
+            Nome da fonte do sistema. None usa a fonte distribuida com o jogo.
+        size : int
+            Tamanho da fonte.
+        bold : bool
+            Negrito.
+        italic : bool
+            Italico.
+
+        Returns
+        -------
+        pg.font.Font
+            Fonte compartilhada.
+        """
+        key = (face, size, bold, italic)
+        if key not in self._fonts:
+            if not pg.font.get_init():
+                pg.font.init()
+            if face is None:
+                font = pg.font.Font(self.bundled_path, size)
+                font.set_bold(bold)
+                font.set_italic(italic)
+            else:
+                font = pg.font.SysFont(face, size, bold, italic)
+            self._fonts[key] = font
+            self.loads += 1
+        return self._fonts[key]
+
+    def clear(self):
+        """
+        Descarta as fontes criadas.
+        """
+        self._fonts.clear()
+
+
+# Registro compartilhado por todo o jogo
+font_registry = FontRegistry()
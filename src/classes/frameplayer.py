@@ -0,0 +1,185 @@
+"""
+This module contains the frame player used by the animated menu screens. Instead of
+scaling every frame of a sprite sheet up front, the player keeps only the source sheet
+and scales the frames on demand into a small LRU, optionally preparing the next frames
+on a worker thread.
+"""
+import threading
+from collections import OrderedDict
+from queue import Queue
+import pygame
+
+
+class FramePlayer:
+    """
+    A lazy, memory-bounded sequence of the frames of a sprite sheet.
+
+    The player behaves like the list returned by the old `extract_frames`: `len(player)`
+    is the number of frames and `player[i]` is the frame `i` scaled to `frame_size`.
+    At most `cache_size` scaled frames are kept alive at the same time.
+
+    Attributes
+    ----------
+    sprite_sheet : pygame.Surface
+        The source sheet, kept in its original size.
+
+    columns : int
+        The number of frames in each row of the sheet.
+
+    rows : int
+        The number of rows of the sheet.
+
+    frame_size : tuple
+        The size of each scaled frame.
+
+    cache_size : int
+        The maximum number of scaled frames kept in memory.
+
+    prefetch : int
+        How many frames after the requested one are scaled ahead by the worker thread.
+
+    hits : int
+        Number of frames served from the cache.
+
+    misses : int
+        Number of frames scaled while the caller was waiting.
+
+    Methods
+    -------
+    close()
+        Stops the worker thread and drops the scaled frames.
+    """
+
+    def __init__(self, sprite_sheet, columns, rows, frame_size, cache_size=8, prefetch=0):
+        """
+        Initializes the FramePlayer instance.
+
+        Parameters
+        ----------
+        sprite_sheet : pygame.Surface
+            The source sheet.
+
+        columns : int
+            The number of frames in each row of the sheet.
+
+        rows : int
+            The number of rows of the sheet.
+
+        frame_size : tuple
+            The size of each scaled frame.
+
+        cache_size : int
+            The maximum number of scaled frames kept in memory.
+
+        prefetch : int
+            How many frames ahead are scaled by the worker thread. 0 disables the thread.
+
+        Returns
+        -------
+        None.
+        """
+        self.sprite_sheet = sprite_sheet
+        self.columns = columns
+        self.rows = rows
+        self.frame_width = sprite_sheet.get_width() // columns
+        self.frame_height = sprite_sheet.get_height() // rows
+        self.frame_size = (int(frame_size[0]), int(frame_size[1]))
+        # O cache precisa comportar o quadro atual e os pre-carregados
+        self.cache_size = max(cache_size, prefetch + 1)
+        self.prefetch = prefetch
+        self.hits = 0
+        self.misses = 0
+        self._frames = OrderedDict()
+        self._queued = set()
+        self._lock = threading.Lock()
+        self._requests = None
+        self._worker = None
+
+    def __len__(self):
+        return self.columns * self.rows
+
+    def __getitem__(self, index):
+        index = self._check_index(index)
+        with self._lock:
+            frame = self._frames.get(index)
+            if frame is not None:
+                self._frames.move_to_end(index)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if frame is None:
+            frame = self._store(index, self._scale(index))
+        self._prefetch_after(index)
+        return frame
+
+    def _check_index(self, index):
+        index = int(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("frame index out of range")
+        return index
+
+    def _scale(self, index):
+        row, column = divmod(index, self.columns)
+        frame = self.sprite_sheet.subsurface(pygame.Rect(column * self.frame_width, row * self.frame_height, self.frame_width, self.frame_height))
+        return pygame.transform.scale(frame, self.frame_size)
+
+    def _store(self, index, frame):
+        with self._lock:
+            self._queued.discard(index)
+            # Outro thread pode ter escalado o mesmo quadro antes
+            frame = self._frames.setdefault(index, frame)
+            self._frames.move_to_end(index)
+            while len(self._frames) > self.cache_size:
+                self._frames.popitem(last=False)
+        return frame
+
+    def _prefetch_after(self, index):
+        if not self.prefetch:
+            return
+        if self._worker is None:
+            self._requests = Queue()
+            self._worker = threading.Thread(target=self._run_worker, daemon=True)
+            self._worker.start()
+        with self._lock:
+            for offset in range(1, self.prefetch + 1):
+                following = (index + offset) % len(self)
+                if following not in self._frames and following not in self._queued:
+                    self._queued.add(following)
+                    self._requests.put(following)
+
+    def _run_worker(self):
+        while True:
+            index = self._requests.get()
+            if index is None:
+                break
+            self._store(index, self._scale(index))
+
+    def cached_frames(self):
+        """
+        Returns the indexes of the frames currently scaled, from the oldest to the newest.
+
+        Returns
+        -------
+        list
+            The indexes of the cached frames.
+        """
+        with self._lock:
+            return list(self._frames)
+
+    def close(self):
+        """
+        Stops the worker thread and drops the scaled frames.
+
+        Returns
+        -------
+        None.
+        """
+        if self._worker is not None:
+            self._requests.put(None)
+            self._worker.join()
+            self._worker = None
+        with self._lock:
+            self._frames.clear()
+            self._queued.clear()
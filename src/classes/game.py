@@ -1,11 +1,14 @@
+import time
 import pygame 
 from src.settings import * 
 from src.classes.phase import Phase, PhaseManager
 from src.classes.menu import Menu
 from src.classes.background import Interface
+from src.classes.assets import asset_cache
+from src.classes.timestep import FixedTimestep
+from src.classes.lod import lod_scheduler
 import os
 import numpy as np
-from settings import START_SOUND_MENU
 
 class Game:
     """
@@ -22,48 +25,143 @@ class Game:
     clock : pygame.time.Clock
         A clock to control the game's frame rate.
 
+    timestep : FixedTimestep
+        The simulation clock: the game logic advances in fixed ticks of 1/TICK_RATE
+        seconds, while frames are drawn at up to RENDER_RATE per second.
+
     running : bool
         Flag indicating whether the game is currently running.
 
+    startup_timeline : list of tuple
+        (stage name, seconds) for each boot stage, in the order they ran.
+
     Methods
     -------
-    __init__()
+    __init__(startup_profile=False, import_time=None, frame_profile=False)
         Initializes the game, including pygame and the game window.
 
+    boot()
+        Runs the startup stages (pygame, display, mixer, fonts, assets) in order.
+
     new()
         Initializes a new game, creating a new level and menu.
 
     run()
         Runs the main game loop, handling events and updating the game state.
     """
-    def __init__(self) -> None:
+    def __init__(self, startup_profile=False, import_time=None, frame_profile=False) -> None:
         """
         Initializes the game
 
         Parameters
         ----------
-        None.
+        startup_profile : bool
+            If True, prints how long each boot stage took.
+        import_time : float, optional
+            Seconds spent importing the game modules, measured by the caller.
+        frame_profile : bool
+            If True, prints the average time of each frame pipeline stage, and how much
+            work the simulation level of detail skipped, on exit.
 
         Returns
         -------
         None.
         """
-        
-        # Initialize pygame and create window
-        pygame.init()
-        pygame.mixer.init()
-
-
-        # Create the screen and clock
-        self.screen = pygame.display.set_mode((SCREEN_DIMENSIONS[0], SCREEN_DIMENSIONS[0]))
-        self.clock = pygame.time.Clock()
-        
+        self.startup_timeline = []
+        if import_time is not None:
+            self.startup_timeline.append(('imports', import_time))
+        self.boot()
+        if startup_profile:
+            self.print_startup_timeline()
 
         # Game loop control
         self.running = True
         
         self.movement =  np.zeros(2)
         self.attack = np.zeros(2)
+        self.timestep = FixedTimestep()
+        self.frame_profile = frame_profile
+
+    def boot(self):
+        """
+        Runs the startup stages in a fixed order, timing each one.
+
+        Importing the game modules does no pygame work; everything that touches the
+        display, the audio device or the disk happens here.
+
+        Parameters
+        ----------
+        None.
+
+        Returns
+        -------
+        None.
+        """
+        stages = (
+            ('pygame', self.init_pygame),
+            ('display', self.init_display),
+            ('mixer', self.init_mixer),
+            ('fonts', self.init_fonts),
+            ('assets', self.init_assets),
+        )
+        for name, stage in stages:
+            start = time.perf_counter()
+            stage()
+            self.startup_timeline.append((name, time.perf_counter() - start))
+
+    def init_pygame(self):
+        """
+        Initializes the pygame core modules and the clock.
+        """
+        pygame.init()
+        self.clock = pygame.time.Clock()
+
+    def init_display(self):
+        """
+        Creates the game window with the size of the monitor.
+        """
+        info = pygame.display.Info()
+        # Atualiza no lugar: os modulos que importaram SCREEN_DIMENSIONS veem o novo tamanho
+        SCREEN_DIMENSIONS[:] = (info.current_w, info.current_h)
+        self.screen = pygame.display.set_mode(tuple(SCREEN_DIMENSIONS))
+
+    def init_mixer(self):
+        """
+        Opens the audio device, unless pygame.init already did. Without a usable device the
+        game falls back to SDL's dummy audio driver and runs silently.
+        """
+        if pygame.mixer.get_init():
+            return
+        try:
+            pygame.mixer.init()
+        except pygame.error as e:
+            print(f"No audio device available, running without sound: {e}")
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+            pygame.mixer.init()
+
+    def init_fonts(self):
+        """
+        Loads the HUD fonts, so the system font lookup does not happen mid-game.
+        """
+        pygame.font.init()
+        for font in Fonts:
+            font.font
+
+    def init_assets(self):
+        """
+        Opens the asset pack and converts what was loaded before the window existed.
+        """
+        asset_cache.open_pack()
+        asset_cache.convert_pending()
+
+    def print_startup_timeline(self):
+        """
+        Prints the duration of each boot stage and the total startup time.
+        """
+        elapsed = 0
+        for name, duration in self.startup_timeline:
+            elapsed += duration
+            print(f"{name:<8} {duration*1000:8.1f} ms  (total {elapsed*1000:8.1f} ms)")
 
     def new(self):
         """
@@ -103,7 +201,7 @@ class Game:
 
                 self.movement = np.zeros(2)
                 self.attack = np.zeros(2)
-                self.clock.tick(FRAME_RATE)
+                self.clock.tick(RENDER_RATE)
                 
                 for event in pygame.event.get():
                     
@@ -122,6 +220,8 @@ class Game:
                         if event.key == pygame.K_p:
                             self.menu.current_screen = "pause"
                             self.menu.pause()
+                            # O tempo em pausa nao e simulado
+                            self.timestep.reset()
 
                 if self.menu.current_screen == "final_screen":
                     self.menu.final_screen()
@@ -132,9 +232,9 @@ class Game:
                 if self.menu.current_screen == "initial_cutscene":
                     self.menu.stop_music()
                     pygame.time.delay(50)
-                    self.menu.start_botao.play(0)
+                    self.menu.sounds.play('start_botao')
                     pygame.time.delay(1000)
-                    self.menu.start_botao.stop()
+                    self.menu.sounds.stop('start_botao')
                     self.menu.initial_cutscene()
              
                 if self.menu.current_screen == "play":                    
@@ -157,12 +257,20 @@ class Game:
                     if pygame.key.get_pressed()[pygame.K_DOWN]:
                         self.attack[1] += 1
                     
-                    self.level.update(self.movement, self.attack)
+
+                    # Simula os ticks que couberam no tempo real decorrido e desenha entre os dois ultimos
+                    for _ in range(self.timestep.advance()):
+                        self.level.step(self.movement, self.attack)
+                    self.level.render(self.timestep.alpha)
                     pygame.display.flip()
                     
 
                     if self.level.current_dialogue != None:
                         self.menu.dialogue(self.level.current_dialogue)
+                        self.timestep.reset()
+                else:
+                    # Menus e cutscenes nao contam como tempo de jogo
+                    self.timestep.reset()
                 
                 if self.level._current_phase.check_lost():
                     self.menu.current_screen = "game_over"
@@ -185,6 +293,11 @@ class Game:
         except Exception as e:
             print(f"An unexpected error occurred during game execution: {e}")
         finally:
+            # The level or its first phase may not exist if the error happened before them
+            current_phase = getattr(getattr(self, 'level', None), 'current_phase', None)
+            if self.frame_profile and current_phase is not None:
+                print(current_phase.pipeline.report())
+                print(lod_scheduler.report())
             pygame.quit()
 
 
@@ -1,6 +1,10 @@
 import pygame as pg
-from src.settings import SCREEN_DIMENSIONS, FRAME_RATE
+from src.settings import SCREEN_DIMENSIONS, TICK_RATE
 from src.classes.background import PositionController
+from src.classes.assets import asset_cache
+from src.classes.entities import entity_store
+from src.classes.projectiles import projectile_pools
+from src.classes.lod import lod_scheduler, FAR
 import numpy as np
 
 class GameObject(pg.sprite.Sprite):
@@ -34,9 +38,13 @@ class GameObject(pg.sprite.Sprite):
     Attributes
     ----------
     x_position : float
-        A posição X do objeto no jogo.
+        A posição X do objeto no jogo, lida da linha do objeto em `entity_store`.
     y_position : float
-        A posição Y do objeto no jogo.
+        A posição Y do objeto no jogo, lida da linha do objeto em `entity_store`.
+    store : EntityStore
+        O armazenamento que guarda a posição, o tamanho e os limites do objeto.
+    row : int
+        A linha do objeto em `store`.
     width : int
         A largura da imagem do objeto.
     height : int
@@ -47,6 +55,8 @@ class GameObject(pg.sprite.Sprite):
         O caminho para o arquivo de spritesheet.
     spritesheet : pg.Surface
         A imagem carregada do spritesheet.
+    frames : tuple
+        Quadros pré-fatiados do spritesheet, indexados por [linha][quadro].
     sprite_actual_x : int
         O índice atual da sprite no eixo X.
     sprite_actual_y : int
@@ -90,22 +100,81 @@ class GameObject(pg.sprite.Sprite):
         """
         super().__init__()
         self.position_controller = PositionController(map_limits_sup, width, height)
-        self.x_position = x_position
-        self.y_position = y_position
+        self.store = entity_store
+        self.row = self.store.attach(self, x_position, y_position, width, height, map_limits_sup)
         self.width = width
         self.height = height
         self.movement = np.zeros(2)
         self.spritesheet_path = spritesheet
-        self.spritesheet = pg.image.load(spritesheet)
-        self.spritesheet = pg.transform.scale(self.spritesheet, (self.width*sprites_quantity, self.height))
+        self.spritesheet = asset_cache.acquire(self, spritesheet, (self.width*sprites_quantity, self.height))
+        self.frames = asset_cache.frames(spritesheet, (self.width*sprites_quantity, self.height), sprites_quantity, 1)
         self.sprite_actual_x = sprite_actual_x
         self.sprite_actual_y = sprite_actual_y
         self.sprites_quantity = sprites_quantity
         self.is_static = is_static
-        self.image = self.spritesheet.subsurface((self.sprite_actual_x*self.width, self.sprite_actual_y*self.height, width, height))
-        self.image = pg.transform.scale(self.image, (self.width, self.height))
+        self.image = self.frames[self.sprite_actual_y][int(self.sprite_actual_x)]
         self.rect = self.image.get_rect()
         self.rect.center = self.x_position, self.y_position
+
+    @property
+    def x_position(self):
+        """
+        Retorna a posição X do objeto no mapa.
+
+        Returns
+        -------
+        float
+            A posição X do objeto.
+        """
+        return self.store.position[self.row, 0]
+
+    @x_position.setter
+    def x_position(self, value):
+        """
+        Define a posição X do objeto no mapa.
+
+        Parameters
+        ----------
+        value : float
+            A nova posição X do objeto.
+        """
+        self.store.set_position(self.row, (value, self.y_position))
+
+    @property
+    def y_position(self):
+        """
+        Retorna a posição Y do objeto no mapa.
+
+        Returns
+        -------
+        float
+            A posição Y do objeto.
+        """
+        return self.store.position[self.row, 1]
+
+    @y_position.setter
+    def y_position(self, value):
+        """
+        Define a posição Y do objeto no mapa.
+
+        Parameters
+        ----------
+        value : float
+            A nova posição Y do objeto.
+        """
+        self.store.set_position(self.row, (self.x_position, value))
+
+    @property
+    def screen_position(self):
+        """
+        Retorna a posição do objeto no sistema de coordenadas da tela.
+
+        Returns
+        -------
+        tuple
+            A posição (x, y) do objeto relativa à câmera.
+        """
+        return tuple(self.store.screen_position[self.row])
     
     def set_position(self, x_new, y_new):
         """
@@ -118,8 +187,7 @@ class GameObject(pg.sprite.Sprite):
         y_new : float
             A nova posição Y do objeto.
         """
-        self.x_position = x_new
-        self.y_position = y_new
+        self.store.set_position(self.row, (x_new, y_new))
         
     def get_position(self):
         """
@@ -161,17 +229,13 @@ class GameObject(pg.sprite.Sprite):
         np.ndarray
             O vetor de movimento que não pôde ser aplicado devido a limitações de movimento.
         """
-        x_new = self.x_position + movement[0]
-        y_new = self.y_position + movement[1]
-        x_new_corrected, y_new_corrected = self.position_controller.to_frame(x_new, y_new)
-        
         # Devolve a parte do movimento que nao foi aplicado
-        comeback = np.array([x_new, y_new]) - np.array([x_new_corrected, y_new_corrected])
-        
-        self.set_position(x_new_corrected, y_new_corrected)
+        comeback = self.store.move(self.row, movement)
         self.movement = movement
+        # O rect acompanha a posicao, inclusive quando a resolucao de colisoes empurra o objeto
+        self.set_position_rect(*self.screen_position)
         
-        return -comeback
+        return comeback
         
     
     def animate(self):
@@ -184,20 +248,23 @@ class GameObject(pg.sprite.Sprite):
         if self.sprites_quantity > 1:
             self.sprite_actual_x += 0.2
             self.sprite_actual_x %= self.sprites_quantity
-            self.image = self.spritesheet.subsurface((int(self.sprite_actual_x), self.sprite_actual_y, self.width, self.height))
+            self.image = self.frames[self.sprite_actual_y][int(self.sprite_actual_x)]
     
     def update(self):
         """
         Atualiza o estado do objeto.
 
         Esse método é chamado a cada ciclo do jogo para atualizar a posição do objeto e sua animação. 
-        O objeto também ajusta sua posição conforme a movimentação e os limites do mapa.
+        A posição na tela já foi calculada para todos os objetos de uma vez por `EntityStore.translate`.
+        Objetos longe da câmera não são animados.
         """
         self.movement = np.zeros(2)
-        x_position, y_position = self.get_position()
-        x_new, y_new = self.position_controller.apply_translation(x_position, y_position)
-        self.set_position_rect(x_new, y_new)
-        self.animate()
+        self.set_position_rect(*self.screen_position)
+        if lod_scheduler.level(self.row) == FAR:
+            lod_scheduler.record('animation', skipped=1)
+        else:
+            self.animate()
+            lod_scheduler.record('animation', performed=1)
 
 
 class Collectible(GameObject):
@@ -456,13 +523,12 @@ class Ammo(GameObject):
         Atualiza a posição da munição com base em sua direção e velocidade. Verifica se a munição sai da área do jogo 
         e atualiza sua posição no jogo. Além disso, chama a função `update` de `GameObject` para animar e realizar outras atualizações.
 
-        A posição da munição é ajustada com base no tempo (controlado por `FRAME_RATE`), e a função `out_game` é chamada 
+        A posição da munição avança um tick da simulação (`TICK_RATE` ticks por segundo), e a função `out_game` é chamada 
         para garantir que a munição permaneça dentro dos limites do jogo.
         """
-        position = np.array(self.get_position(), dtype=float)
-        position += self.direction*self.speed*10/FRAME_RATE
         self.position_controller.out_game(self)
-        self.set_position(position[0], position[1])
+        self.store.velocity[self.row] = self.direction*self.speed*10/TICK_RATE
+        self.store.integrate(self.row)
         super().update()
         
 # class Weapon:
@@ -513,7 +579,7 @@ class Weapon(GameObject):
     attack_field : int
         O tamanho do campo de ataque da arma, determinando a área ao redor da posição da arma onde ela pode afetar alvos.
     reload_time : int
-        O tempo necessário para recarregar a arma.
+        O tempo necessário para recarregar a arma, em ticks da simulação.
     ammo : Ammo
         A munição que a arma utiliza para disparos.
     scope : float
@@ -565,7 +631,7 @@ class Weapon(GameObject):
         attack_field : int
             O tamanho do campo de ataque da arma, determinando a área ao redor da posição da arma onde ela pode afetar alvos.
         reload_time : int
-            O tempo necessário para recarregar a arma.
+            O tempo necessário para recarregar a arma, em ticks da simulação.
         ammo : Ammo
             A munição que a arma utiliza para disparos.
         scope : float
@@ -583,6 +649,9 @@ class Weapon(GameObject):
         self._reloading = False
         self._ammo = ammo
         self.scope = scope
+        # Pre-aloca os projeteis da municao, compartilhados pelas armas que a usam
+        if isinstance(ammo, Ammo):
+            projectile_pools.pool(ammo)
     
     @property
     def reloading(self):
@@ -647,7 +716,9 @@ class Weapon(GameObject):
         
     def instanciate_bullet(self, direction):
         """
-        Instancia uma nova munição e define sua direção e posição.
+        Coloca em voo um projetil da munição da arma, a partir da posição da arma.
+
+        O projetil vem do pool da munição em `projectile_pools`, sem criar uma nova `Ammo`.
 
         Parameters
         ----------
@@ -656,14 +727,10 @@ class Weapon(GameObject):
 
         Returns
         -------
-        Ammo
-            A nova munição instanciada com a direção fornecida.
+        Projectile
+            O projetil disparado na direção fornecida.
         """
-        bullet = self.ammo.copy()
-        bullet.x_position = self.x_position
-        bullet.y_position = self.y_position
-        bullet.direction = direction
-        return bullet
+        return projectile_pools.spawn(self.ammo, self.get_position(), direction)
         
     def check_load(self):
         """
@@ -678,7 +745,7 @@ class Weapon(GameObject):
             return True
         return False
     
-    def fire(self, direction: np.array) -> Ammo:
+    def fire(self, direction: np.array):
         """
         Dispara uma munição na direção especificada.
 
@@ -689,15 +756,15 @@ class Weapon(GameObject):
 
         Returns
         -------
-        Ammo
-            Uma nova instância de munição disparada, ou None se a arma não estiver pronta para disparar.
+        Projectile
+            O projetil disparado, ou None se a arma não estiver pronta para disparar.
         """
         fired = None
         # Condicoes do disparo
         if self.check_load():
             self.reload = 0
             self.reloading = True
-            # Instancia uma nova municao, copia da municao dada
+            # Dispara um projetil do pool da municao dada
             fired = self.instanciate_bullet(direction)
             
         return fired
@@ -706,7 +773,7 @@ class Weapon(GameObject):
         """
         Atualiza a arma, incluindo a posição do campo de ataque e o estado de recarga.
 
-        Se a arma estiver recarregando, o tempo de recarga é incrementado, e ela para de recarregar quando o tempo necessário é atingido.
+        Se a arma estiver recarregando, o tempo de recarga é incrementado em um tick, e ela para de recarregar quando o tempo necessário é atingido.
         """
         super().update()
         # Atualiza a zona de ataque
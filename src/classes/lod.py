@@ -0,0 +1,142 @@
+import numpy as np
+
+# Niveis de detalhe da simulacao
+NEAR, MID, FAR = 0, 1, 2
+
+
+class LODScheduler:
+    """
+    Nivel de detalhe da simulacao de cada entidade, pela distancia ate a camera.
+
+    A cada tick `classify` calcula, com uma operacao vetorizada sobre todas as linhas do
+    `EntityStore`, a distancia entre o retangulo de cada entidade e o da camera:
+
+    - NEAR (ate `near_margin`): atualizacao completa a cada tick;
+    - MID (ate `far_margin`): a IA decide a cada `ai_interval` ticks, em ticks alternados
+      para entidades vizinhas na ordem de quem pergunta, e entre as decisoes o ultimo
+      movimento e repetido;
+    - FAR: como MID, e sem animacao.
+
+    Posicoes, retangulos de colisao e contadores de jogo (recarga das armas, tempo dos
+    minigames) continuam sendo atualizados em todo tick. Quem pula ou executa um trabalho
+    registra em `record`, e `report` resume quanto foi economizado. Entidades ainda nao
+    classificadas sao NEAR, entao sem `classify` nada muda.
+
+    Parameters
+    ----------
+    near_margin : float
+        Distancia, em pixels, ate a qual a entidade e NEAR.
+    far_margin : float
+        Distancia, em pixels, a partir da qual a entidade e FAR.
+    ai_interval : int
+        Ticks entre duas decisoes da IA das entidades MID e FAR.
+
+    Attributes
+    ----------
+    levels : np.ndarray
+        Nivel de cada linha do armazenamento no ultimo `classify`.
+    tick : int
+        Quantidade de chamadas de `classify`.
+    performed, skipped : dict
+        Quantidade de trabalhos executados e pulados, por tipo.
+    """
+    def __init__(self, near_margin=256, far_margin=1024, ai_interval=4):
+        self.near_margin = near_margin
+        self.far_margin = far_margin
+        self.ai_interval = ai_interval
+        self.levels = np.zeros(0, dtype=np.int8)
+        self.view = np.zeros(4)
+        self.tick = 0
+        self.performed = {}
+        self.skipped = {}
+
+    def classify(self, store, origin, view_size):
+        """
+        Classifica todas as entidades do armazenamento pela distancia ate a camera.
+
+        Parameters
+        ----------
+        store : EntityStore
+            O armazenamento das entidades.
+        origin : sequence
+            Canto superior esquerdo da camera, em coordenadas do mapa.
+        view_size : sequence
+            Largura e altura da camera.
+        """
+        self.view = np.array([0, 0, *view_size], dtype=float)
+        used = store.used
+        screen_position = store.position[:used] - np.asarray(origin, dtype=float)
+        self.levels = self._levels(screen_position, store.size[:used]/2)
+        self.tick += 1
+
+    def _levels(self, centers, half_sizes):
+        # Distancia entre retangulos, pelo eixo mais afastado; zero quando se sobrepoem
+        gap = np.maximum(np.maximum(self.view[:2] - (centers + half_sizes), (centers - half_sizes) - self.view[2:]), 0).max(axis=-1)
+        return np.where(gap <= self.near_margin, NEAR, np.where(gap <= self.far_margin, MID, FAR)).astype(np.int8)
+
+    def level(self, row):
+        """
+        Retorna o nivel de uma linha do armazenamento.
+        """
+        return int(self.levels[row]) if row < len(self.levels) else NEAR
+
+    def levels_of(self, rows):
+        """
+        Retorna o nivel de varias linhas do armazenamento.
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        levels = np.full(len(rows), NEAR, dtype=np.int8)
+        known = rows < len(self.levels)
+        levels[known] = self.levels[rows[known]]
+        return levels
+
+    def rect_level(self, rect):
+        """
+        Retorna o nivel de um retangulo em coordenadas da tela, para quem nao esta no armazenamento.
+        """
+        if not self.tick:
+            return NEAR
+        return int(self._levels(np.array(rect.center, dtype=float), np.array(rect.size, dtype=float)/2))
+
+    def due(self, levels):
+        """
+        Retorna quais entidades decidem neste tick: todas as NEAR e, das demais, uma a cada
+        `ai_interval`, alternando a cada tick.
+
+        Parameters
+        ----------
+        levels : np.ndarray
+            Nivel de cada entidade, na ordem de quem pergunta.
+        """
+        return (levels == NEAR) | ((np.arange(len(levels)) + self.tick) % self.ai_interval == 0)
+
+    def record(self, kind, performed=0, skipped=0):
+        """
+        Soma trabalhos executados e pulados de um tipo.
+        """
+        self.performed[kind] = self.performed.get(kind, 0) + performed
+        self.skipped[kind] = self.skipped.get(kind, 0) + skipped
+
+    def report(self):
+        """
+        Retorna uma linha por tipo de trabalho com quantos foram pulados.
+        """
+        lines = []
+        for kind in self.performed.keys() | self.skipped.keys():
+            skipped = self.skipped.get(kind, 0)
+            total = skipped + self.performed.get(kind, 0)
+            lines.append(f"{kind:<10} {skipped:8d} de {total:8d} pulados ({100*skipped/total if total else 0:5.1f}%)")
+        return '\n'.join(sorted(lines))
+
+    def reset(self):
+        """
+        Esquece a classificacao e zera as contagens.
+        """
+        self.levels = np.zeros(0, dtype=np.int8)
+        self.tick = 0
+        self.performed.clear()
+        self.skipped.clear()
+
+
+# Nivel de detalhe compartilhado pelas entidades da fase atual
+lod_scheduler = LODScheduler()
@@ -0,0 +1,327 @@
+import numpy as np
+
+
+class RingMemory:
+    """
+    Memoria de posicoes de tamanho fixo, em um buffer circular NumPy com soma corrente.
+
+    Inserir e esquecer sao O(1): a posicao mais antiga e sobrescrita quando a memoria esta
+    cheia, e a soma das posicoes guardadas e atualizada a cada mudanca, de modo que o
+    centroide sai sem percorrer a memoria. Iteracao e indexacao seguem da mais antiga para
+    a mais recente, como a lista que esta classe substitui.
+
+    Parameters
+    ----------
+    size : int
+        Quantidade maxima de posicoes guardadas.
+
+    Attributes
+    ----------
+    buffer : np.ndarray
+        Posicoes (x, y), formato (size, 2); so as `len(self)` linhas a partir de `start`
+        (circularmente) sao validas.
+    x_total, y_total : float
+        Soma das posicoes validas. Sao floats do Python: para poucos valores por chamada
+        eles custam menos que operacoes NumPy.
+    """
+    def __init__(self, size):
+        self.size = int(size)
+        self.buffer = np.zeros((max(self.size, 1), 2))
+        self.x_total = 0.0
+        self.y_total = 0.0
+        self.start = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def __bool__(self):
+        return self._count > 0
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('indice fora da memoria')
+        return tuple(self.buffer[(self.start + index) % len(self.buffer)].tolist())
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def append(self, position):
+        """
+        Guarda uma posicao, esquecendo a mais antiga se a memoria estiver cheia.
+        """
+        if self.size <= 0:
+            return
+        x, y = position
+        if self._count == self.size:
+            old_x, old_y = self.buffer[self.start].tolist()
+            self.buffer[self.start] = x, y
+            self.x_total += x - old_x
+            self.y_total += y - old_y
+            self.start = (self.start + 1) % self.size
+        else:
+            self.buffer[(self.start + self._count) % self.size] = x, y
+            self.x_total += x
+            self.y_total += y
+            self._count += 1
+
+    def forget(self):
+        """
+        Esquece a posicao mais antiga, se houver alguma.
+        """
+        if not self._count:
+            return
+        old_x, old_y = self.buffer[self.start].tolist()
+        self.x_total -= old_x
+        self.y_total -= old_y
+        self.start = (self.start + 1) % self.size
+        self._count -= 1
+        if not self._count:
+            # Memoria vazia: a soma volta a zero exato, sem erro de arredondamento acumulado
+            self.clear()
+
+    def centroid(self):
+        """
+        Retorna a media (x, y) das posicoes guardadas, ou None se a memoria estiver vazia.
+        """
+        if not self._count:
+            return None
+        return self.x_total/self._count, self.y_total/self._count
+
+    def resize(self, size):
+        """
+        Muda o tamanho maximo, mantendo as posicoes mais recentes que couberem.
+        """
+        kept = list(self)[-size:] if size > 0 else []
+        self.__init__(size)
+        for position in kept:
+            self.append(position)
+
+    def clear(self):
+        """
+        Esquece todas as posicoes.
+        """
+        self.x_total = 0.0
+        self.y_total = 0.0
+        self.start = 0
+        self._count = 0
+
+
+class RingMemoryBank:
+    """
+    Memorias circulares de varias entidades em arrays NumPy, atualizadas todas de uma vez.
+
+    Cada linha e uma memoria com a mesma semantica de `RingMemory` (tamanho maximo proprio,
+    sobrescrita da mais antiga, soma corrente), mas `append`, `forget` e `centroids` recebem
+    ou devolvem as linhas de uma vez, sem lacos em Python. `view` devolve um objeto com a
+    interface de `RingMemory` para uma linha, para quem usa uma memoria isolada.
+
+    Parameters
+    ----------
+    sizes : sequence of int
+        Tamanho maximo de cada memoria.
+
+    Attributes
+    ----------
+    buffer : np.ndarray
+        Posicoes (x, y), formato (memorias, maior tamanho, 2).
+    totals : np.ndarray
+        Soma das posicoes validas de cada memoria.
+    starts : np.ndarray
+        Indice, no buffer, da posicao mais antiga de cada memoria.
+    counts : np.ndarray
+        Quantidade de posicoes guardadas em cada memoria.
+    """
+    def __init__(self, sizes):
+        self.sizes = np.array(sizes, dtype=np.intp).reshape(-1)
+        self.buffer = np.zeros((len(self.sizes), max(int(self.sizes.max(initial=0)), 1), 2))
+        self.totals = np.zeros((len(self.sizes), 2))
+        self.starts = np.zeros(len(self.sizes), dtype=np.intp)
+        self.counts = np.zeros(len(self.sizes), dtype=np.intp)
+
+    def __len__(self):
+        return len(self.sizes)
+
+    @classmethod
+    def from_memories(cls, memories):
+        """
+        Cria um banco com uma linha para cada memoria dada, copiando as posicoes guardadas.
+
+        Parameters
+        ----------
+        memories : sequence
+            Memorias com a interface de `RingMemory`.
+        """
+        bank = cls([memory.size for memory in memories])
+        for index, memory in enumerate(memories):
+            for position in memory:
+                bank.append([index], [position])
+        return bank
+
+    def append(self, indices, positions):
+        """
+        Guarda uma posicao em cada memoria indicada, esquecendo a mais antiga das que estao cheias.
+
+        Parameters
+        ----------
+        indices : array_like
+            Linhas das memorias, sem repeticoes.
+        positions : array_like
+            Posicao (x, y) guardada em cada memoria, ou uma unica posicao para todas.
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        positions = np.broadcast_to(np.asarray(positions, dtype=float), (len(indices), 2))
+        # Memorias de tamanho zero nao guardam nada
+        kept = self.sizes[indices] > 0
+        indices, positions = indices[kept], positions[kept]
+        sizes = self.sizes[indices]
+        counts = self.counts[indices]
+        full = counts == sizes
+        # Cheia, a proxima posicao livre e a da mais antiga, que e sobrescrita
+        slots = (self.starts[indices] + counts) % sizes
+        self.totals[indices] += positions - np.where(full[:, None], self.buffer[indices, slots], 0.0)
+        self.buffer[indices, slots] = positions
+        self.starts[indices] = np.where(full, (self.starts[indices] + 1) % sizes, self.starts[indices])
+        self.counts[indices] = counts + ~full
+
+    def forget(self, indices):
+        """
+        Esquece a posicao mais antiga de cada memoria indicada que nao esteja vazia.
+
+        Parameters
+        ----------
+        indices : array_like
+            Linhas das memorias, sem repeticoes.
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        indices = indices[self.counts[indices] > 0]
+        self.totals[indices] -= self.buffer[indices, self.starts[indices]]
+        self.starts[indices] = (self.starts[indices] + 1) % self.sizes[indices]
+        self.counts[indices] -= 1
+        # Memorias vazias: a soma volta a zero exato, sem erro de arredondamento acumulado
+        emptied = indices[self.counts[indices] == 0]
+        self.totals[emptied] = 0.0
+        self.starts[emptied] = 0
+
+    def centroids(self):
+        """
+        Retorna a media (x, y) das posicoes de cada memoria; as vazias ficam com (0, 0).
+
+        Returns
+        -------
+        np.ndarray
+            Centroides, formato (memorias, 2). Use `counts > 0` para saber quais sao validos.
+        """
+        return self.totals/np.maximum(self.counts, 1)[:, None]
+
+    def positions(self, index):
+        """
+        Retorna as posicoes guardadas em uma memoria, da mais antiga para a mais recente.
+        """
+        slots = (self.starts[index] + np.arange(self.counts[index])) % max(self.sizes[index], 1)
+        return [tuple(position) for position in self.buffer[index, slots].tolist()]
+
+    def resize(self, index, size):
+        """
+        Muda o tamanho maximo de uma memoria, mantendo as posicoes mais recentes que couberem.
+        """
+        kept = self.positions(index)[-size:] if size > 0 else []
+        if size > self.buffer.shape[1]:
+            buffer = np.zeros((len(self.sizes), size, 2))
+            buffer[:, :self.buffer.shape[1]] = self.buffer
+            self.buffer = buffer
+        self.clear(index)
+        self.sizes[index] = size
+        for position in kept:
+            self.append([index], [position])
+
+    def clear(self, index):
+        """
+        Esquece todas as posicoes de uma memoria.
+        """
+        self.totals[index] = 0.0
+        self.starts[index] = 0
+        self.counts[index] = 0
+
+    def view(self, index):
+        """
+        Retorna a memoria de uma linha com a interface de `RingMemory`.
+        """
+        return BankedMemory(self, index)
+
+
+class BankedMemory:
+    """
+    Uma linha de `RingMemoryBank` com a interface de `RingMemory`.
+
+    Permite que uma entidade cuja memoria passou a ser atualizada em lote continue lendo e
+    escrevendo a propria memoria como antes; cada chamada custa uma operacao NumPy.
+
+    Parameters
+    ----------
+    bank : RingMemoryBank
+        O banco que guarda a memoria.
+    index : int
+        Linha da memoria no banco.
+    """
+    def __init__(self, bank, index):
+        self.bank = bank
+        self.index = index
+
+    @property
+    def size(self):
+        return int(self.bank.sizes[self.index])
+
+    def __len__(self):
+        return int(self.bank.counts[self.index])
+
+    def __bool__(self):
+        return self.bank.counts[self.index] > 0
+
+    def __getitem__(self, index):
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError('indice fora da memoria')
+        return tuple(self.bank.buffer[self.index, (self.bank.starts[self.index] + index) % self.size].tolist())
+
+    def __iter__(self):
+        return iter(self.bank.positions(self.index))
+
+    def append(self, position):
+        """
+        Guarda uma posicao, esquecendo a mais antiga se a memoria estiver cheia.
+        """
+        self.bank.append([self.index], [position])
+
+    def forget(self):
+        """
+        Esquece a posicao mais antiga, se houver alguma.
+        """
+        self.bank.forget([self.index])
+
+    def centroid(self):
+        """
+        Retorna a media (x, y) das posicoes guardadas, ou None se a memoria estiver vazia.
+        """
+        count = self.bank.counts[self.index]
+        if not count:
+            return None
+        x_total, y_total = self.bank.totals[self.index].tolist()
+        return x_total/count, y_total/count
+
+    def resize(self, size):
+        """
+        Muda o tamanho maximo, mantendo as posicoes mais recentes que couberem.
+        """
+        self.bank.resize(self.index, size)
+
+    def clear(self):
+        """
+        Esquece todas as posicoes.
+        """
+        self.bank.clear(self.index)
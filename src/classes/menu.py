@@ -2,18 +2,23 @@
 This module contains the class that abstrain a menu. This class have a lot of
 utility functions to handle buttons and their events.
 """
-from settings import  SCREEN_DIMENSIONS, START_SOUND_MENU, START_BACKGROUND_MENU, START_COLUMNS_MENU, START_ROWS_MENU, FINAL_SOUND_MENU, FINAL_SCREEN_MENU, FINAL_ROWS_MENU, FINAL_COLUMNS_MENU
-from classes.background import Background
+from src.settings import  SCREEN_DIMENSIONS, START_SOUND_MENU, START_BACKGROUND_MENU, START_COLUMNS_MENU, START_ROWS_MENU, FINAL_SCREEN_MENU, FINAL_ROWS_MENU, FINAL_COLUMNS_MENU, FRAME_RATE
+from src.settings import PAUSE_SCREEN_MENU, PAUSE_SCREEN_SIZE, GAME_OVER_SCREEN_MENU, GAME_OVER_SCREEN_SIZE
+from src.classes.background import Background
+from src.classes.dialogue import DialogueRenderer
+from src.classes.assets import asset_cache
+from src.classes.frameplayer import FramePlayer
+from src.classes.sounds import sound_bank
+from src.classes.fonts import font_registry
 import pygame
 import sys
 import json
 
 
-screen = pygame.display.set_mode((0,0))
-
 def get_font(size):
     """
-    Get a Pygame font object with a specified size.
+    Get a Pygame font object with a specified size. Each size is loaded from disk only once,
+    through the shared font registry.
 
     Parameters
     ----------
@@ -26,7 +31,7 @@ def get_font(size):
         A Pygame font object.
     """
 
-    return pygame.font.Font(r"assets/font.ttf", size)
+    return font_registry.get(size=size)
 
 
 class Button:
@@ -59,6 +64,15 @@ class Button:
     text : pygame.Surface
         The rendered text surface.
 
+    base_text : pygame.Surface
+        The text rendered once with the base color.
+
+    hovering_text : pygame.Surface
+        The text rendered once with the hovering color.
+
+    hovering : bool
+        Whether the mouse was over the button on the last check.
+
     rect : pygame.Rect
         The rectangular area of the button.
 
@@ -111,7 +125,10 @@ class Button:
         self.font = font
         self.base_color, self.hovering_color = base_color, hovering_color
         self.text_input = text_input
-        self.text = self.font.render(self.text_input, True, self.base_color)
+        self.base_text = self.font.render(self.text_input, True, self.base_color)
+        self.hovering_text = self.font.render(self.text_input, True, self.hovering_color)
+        self.hovering = False
+        self.text = self.base_text
         if self.image is None:
             self.image = self.text
         self.rect = self.image.get_rect(center=(self.x_pos, self.y_pos))
@@ -160,15 +177,110 @@ class Button:
         position : tuple
             The x, y coordinates of the mouse position.
 
+        Returns
+        -------
+        bool
+            True if the hovering state changed and the button must be redrawn.
+        """
+        hovering = bool(self.check_for_input(position))
+        if hovering == self.hovering:
+            return False
+        self.hovering = hovering
+        self.text = self.hovering_text if hovering else self.base_text
+        return True
+
+
+class MenuScreen:
+    """
+    A retained screen of widgets: a background and buttons created only once.
+
+    Attributes
+    ----------
+    background : pygame.Surface
+        The background image of the screen.
+
+    background_rect : pygame.Rect
+        The area where the background is drawn.
+
+    buttons : dict
+        The buttons of the screen, by name.
+
+    dirty : bool
+        Whether the screen must be redrawn.
+
+    Methods
+    -------
+    refresh(position)
+        Updates the hovering state of the buttons, marking the screen as dirty when it changes.
+
+    draw(screen)
+        Draws the screen if it is dirty.
+    """
+
+    def __init__(self, background, background_rect, buttons):
+        """
+        Initializes the MenuScreen instance.
+
+        Parameters
+        ----------
+        background : pygame.Surface
+            The background image of the screen.
+
+        background_rect : pygame.Rect
+            The area where the background is drawn.
+
+        buttons : dict
+            The buttons of the screen, by name.
+
         Returns
         -------
         None.
         """
+        self.background = background
+        self.background_rect = background_rect
+        self.buttons = buttons
+        self.dirty = True
 
-        if self.check_for_input(position):
-            self.text = self.font.render(self.text_input, True, self.hovering_color)
-        else:
-            self.text = self.font.render(self.text_input, True, self.base_color)
+    def refresh(self, position):
+        """
+        Updates the hovering state of the buttons.
+
+        Parameters
+        ----------
+        position : tuple
+            The x, y coordinates of the mouse position.
+
+        Returns
+        -------
+        bool
+            True if the screen must be redrawn.
+        """
+        for button in self.buttons.values():
+            if button.change_color(position):
+                self.dirty = True
+        return self.dirty
+
+    def draw(self, screen):
+        """
+        Draws the background and the buttons, only if something changed.
+
+        Parameters
+        ----------
+        screen : pygame.Surface
+            The screen where the widgets will be rendered.
+
+        Returns
+        -------
+        bool
+            True if the screen was redrawn.
+        """
+        if not self.dirty:
+            return False
+        screen.blit(self.background, self.background_rect.topleft)
+        for button in self.buttons.values():
+            button.update(screen)
+        self.dirty = False
+        return True
 
 
 
@@ -184,6 +296,9 @@ class Menu:
         level : Level
             The instance of the game level associated with the menu.
 
+        sounds : SoundBank
+            The sound effects and music of the menu, loaded on first use.
+
         Methods
         -------
         main_menu(background_image_path)
@@ -213,20 +328,30 @@ class Menu:
         """
         
         self.clock = pygame.time.Clock()
-        
-        # Configurações do mixer (áudio)
-        pygame.mixer.init()
 
         self.current_screen = "main_menu"
         self.level= level
         self.first_dialogue = False
+        self.dialogue_renderer = None
+        self.screens = {}
+        self.frame_players = {}
         
-        self.typing = pygame.mixer.Sound('assets\sounds\som_dialogo.wav')
-        self.fgv = pygame.mixer.Sound('assets\sounds\\frente_fgv.mp3')
-        self.laboratorio = pygame.mixer.Sound('assets\sounds\laboratorio.wav')
-        self.botao_3 = pygame.mixer.Sound('assets\sounds\\botao_cena3.mp3')
-        self.start_botao =  pygame.mixer.Sound('assets\sounds\\start.mp3')
+        # Efeitos decodificados apenas quando tocados pela primeira vez
+        self.sounds = sound_bank
+
+        # Configurações de tela e da sprite sheet, trocadas por cada tela animada
+        self.screen_width = SCREEN_DIMENSIONS[0]
+        self.screen_height = SCREEN_DIMENSIONS[1]
+        self.sprite_sheet_path = START_BACKGROUND_MENU
+        self.sprite_sheet = None
         
+    @property
+    def screen(self):
+        """
+        The game window, created by the boot sequence of `Game`.
+        """
+        return pygame.display.get_surface()
+
     def load_audio(self, audio_path):
         """
         Load and play the background audio.
@@ -248,24 +373,51 @@ class Menu:
     def stop_music(self):
         pygame.mixer.music.stop()
     
-    def extract_frames(self) -> list:
+    def extract_frames(self) -> FramePlayer:
         """
-        Extract the frames from the sprite sheet and resize them for the screen.
+        Wraps the current sprite sheet in a player that scales its frames for the screen on demand.
          
         Returns
         -------
-        list
-            A lista with all the frames of the video
-        """
-        frames = []
-        for row in range(self.rows):
-            for col in range(self.columns):
-                x = col * self.frame_width
-                y = row * self.frame_height
-                frame = self.sprite_sheet.subsurface(pygame.Rect(x, y, self.frame_width, self.frame_height))
-                frame = pygame.transform.scale(frame, (self.screen_width, self.screen_height))
-                frames.append(frame)
-        return frames
+        FramePlayer
+            A sequence with all the frames of the video
+        """
+        if self.sprite_sheet is None:
+            self.sprite_sheet = asset_cache.acquire(self, self.sprite_sheet_path)
+        return FramePlayer(self.sprite_sheet, self.columns, self.rows, (self.screen_width, self.screen_height), prefetch=2)
+
+    def get_frame_player(self, sheet_path, columns, rows):
+        """
+        Returns the frame player of an animated sheet. The sheet is loaded and wrapped only
+        once, so entering the same screen again reuses it.
+
+        Parameters
+        ----------
+        sheet_path : str
+            The path of the sprite sheet.
+
+        columns : int
+            The number of frames in each row of the sheet.
+
+        rows : int
+            The number of rows of the sheet.
+
+        Returns
+        -------
+        FramePlayer
+            The player of the sheet.
+        """
+        self.columns = columns
+        self.rows = rows
+        self.sprite_sheet = asset_cache.acquire(self, sheet_path)
+        self.dimensions = (self.sprite_sheet.get_width(), self.sprite_sheet.get_height())
+        self.frame_width = self.dimensions[0] // self.columns
+        self.frame_height = self.dimensions[1] // self.rows
+
+        key = (sheet_path, columns, rows, self.screen_width, self.screen_height)
+        if key not in self.frame_players:
+            self.frame_players[key] = self.extract_frames()
+        return self.frame_players[key]
     
     def main_menu(self):  
         """
@@ -283,18 +435,8 @@ class Menu:
 
         self.load_audio(START_SOUND_MENU)
         
-        # Configurações dos frames
-        self.columns = START_COLUMNS_MENU
-        self.rows = START_ROWS_MENU
-        
-        #  Carregar  a imagem com os frames
-        self.sprite_sheet = pygame.image.load(START_BACKGROUND_MENU).convert_alpha()
-        self.dimensions = (self.sprite_sheet.get_width(), self.sprite_sheet.get_height())
-        self.frame_width = self.dimensions[0] // self.columns
-        self.frame_height = self.dimensions[1] // self.rows
-        
-        # Extrair frames da sprite sheet
-        self.frames = self.extract_frames()
+        # Frames da animação, escalados sob demanda e reaproveitados entre entradas
+        self.frames = self.get_frame_player(START_BACKGROUND_MENU, START_COLUMNS_MENU, START_ROWS_MENU)
         
         #  Controle da animação
         self.current_frame = 0
@@ -324,6 +466,8 @@ class Menu:
                         if event.key in (pygame.K_KP_ENTER, pygame.K_RETURN):
                                          
                             self.current_screen = "initial_cutscene"
+                            # Carrega a fase enquanto a cutscene e exibida
+                            self.level.preload_phase()
                             pygame.display.update()
                             
 
@@ -334,12 +478,72 @@ class Menu:
                     self.current_frame = 0
 
                 # Desenhar na tela
-                screen.blit(self.frames[int(self.current_frame)], (0, 0))
+                self.screen.blit(self.frames[int(self.current_frame)], (0, 0))
                 pygame.display.flip()
                 
                 pygame.display.update()
                 
                 
+    def build_screen(self, background_path, background_size, buttons):
+        """
+        Creates a retained screen with a centered background and its buttons.
+
+        Parameters
+        ----------
+        background_path : str
+            The path of the background image.
+
+        background_size : tuple
+            The size of the background image.
+
+        buttons : list
+            Tuples (name, text, font size, relative height) of each button.
+
+        Returns
+        -------
+        MenuScreen
+            The screen, ready to be drawn.
+        """
+        background = asset_cache.acquire(self, background_path, background_size)
+        background_width, background_height = background.get_size()
+        screen_width, screen_height = self.screen.get_size()
+        background_rect = background.get_rect(center=SCREEN_DIMENSIONS/2)
+
+        widgets = {}
+        for name, text, font_size, relative_height in buttons:
+            widgets[name] = Button(image=None, pos=(screen_width // 2, background_rect.topleft[1] + background_height*relative_height),
+                                   text_input=text, font=get_font(font_size), base_color="Black", hovering_color="White")
+        return MenuScreen(background, background_rect, widgets)
+
+    def get_screen(self, name):
+        """
+        Returns the retained screen with the given name, creating it on the first use.
+
+        Parameters
+        ----------
+        name : str
+            "pause" or "game_over".
+
+        Returns
+        -------
+        MenuScreen
+            The requested screen.
+        """
+        if name not in self.screens:
+            if name == "pause":
+                self.screens[name] = self.build_screen(PAUSE_SCREEN_MENU, PAUSE_SCREEN_SIZE, [
+                    ("resume", "RESUME", 40, 0.435),
+                    ("menu", "MENU", 40, 0.62),
+                    ("quit", "QUIT", 40, 0.8),
+                ])
+            elif name == "game_over":
+                self.screens[name] = self.build_screen(GAME_OVER_SCREEN_MENU, GAME_OVER_SCREEN_SIZE, [
+                    ("try_again", "TRY AGAIN", 28, 0.72),
+                ])
+        # Redesenha por completo ao entrar na tela
+        self.screens[name].dirty = True
+        return self.screens[name]
+
     def pause(self):
         """
         Displays the pause screen with options to resume, go to the main menu, or quit the game.
@@ -348,60 +552,40 @@ class Menu:
         -------
         None.
         """
-        
-        background = pygame.image.load('assets/menus/pause_screen.png')  # Caminho para sua imagem
-        background = pygame.transform.scale(background, (850, 600))  
-        background_width, background_height = background.get_size()
-        
-        screen_width, screen_height = screen.get_size()
-        background_rect = background.get_rect(center=SCREEN_DIMENSIONS/2)  
-        
-        background_x = (screen_width - background_width) 
-        background_y = (screen_height - background_height) 
-        
+        pause_screen = self.get_screen("pause")
+        buttons = pause_screen.buttons
+
         while self.current_screen == "pause":
+            self.clock.tick(FRAME_RATE)
             pause_mouse_pos = pygame.mouse.get_pos() #pegar a pos do mouse
 
-            # Desenhar a imagem de fundo
-            screen.blit(background, background_rect.topleft)
-
-            #  Texto botões
-            resume_button = Button(image=None, pos=(screen_width // 2, background_rect.topleft[1] + background_height*0.435),
-                               text_input="RESUME", font=get_font(40), base_color="Black", hovering_color="White")
-            menu_button = Button(image=None, pos=(screen_width // 2, background_rect.topleft[1] + background_height*0.62),
-                             text_input="MENU", font=get_font(40), base_color="Black", hovering_color="White")
-            quit_button = Button(image=None, pos=(screen_width // 2, background_rect.topleft[1] + background_height*0.8),
-                             text_input="QUIT", font=get_font(40), base_color="Black", hovering_color="White")
-
-
-            for button in [resume_button, menu_button, quit_button]:
-                button.change_color(pause_mouse_pos)
-                button.update(screen)
+            # Redesenha apenas quando algum botao muda de estado
+            pause_screen.refresh(pause_mouse_pos)
+            if pause_screen.draw(self.screen):
+                pygame.display.update(pause_screen.background_rect)
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
-                    self.start_botao.play(0)
+                    self.sounds.play('start_botao')
                     pygame.time.delay(100)
                     pygame.quit()
                     sys.exit()
                 if event.type == pygame.MOUSEBUTTONDOWN:
-                    if resume_button.check_for_input(pause_mouse_pos):
-                        self.start_botao.play(0)
+                    if buttons["resume"].check_for_input(pause_mouse_pos):
+                        self.sounds.play('start_botao')
                         pygame.time.delay(50)
                         self.current_screen = "play"
-                    if menu_button.check_for_input(pause_mouse_pos):
+                    if buttons["menu"].check_for_input(pause_mouse_pos):
                         self.current_screen = "main_menu"
                         self.level.quit_phase()
-                        self.start_botao.play(0)
+                        self.sounds.play('start_botao')
                         pygame.time.delay(50)
                         self.load_audio(START_SOUND_MENU)
                         self.play_music(-1)
-                    if quit_button.check_for_input(pause_mouse_pos):
+                    if buttons["quit"].check_for_input(pause_mouse_pos):
                         pygame.quit()
                         sys.exit()
 
-            pygame.display.update()
-
     def selascou(self):
         """
         Displays the game over screen with the option to try the fase again.
@@ -410,27 +594,19 @@ class Menu:
         -------
         None.
         """
-
-        background = pygame.image.load('assets/menus/selascou_screen.png')  # Caminho para sua imagem
-        background = pygame.transform.scale(background, (600, 260))  
-        background_width, background_height = background.get_size()
-        
-        screen_width, screen_height = screen.get_size()
-        background_rect = background.get_rect(center=SCREEN_DIMENSIONS/2)  
+        game_over_screen = self.get_screen("game_over")
+        try_again_button = game_over_screen.buttons["try_again"]
+        # Prepara a fase novamente enquanto o jogador decide
+        self.level.preload_phase()
 
         while self.current_screen == "game_over":
+            self.clock.tick(FRAME_RATE)
             pause_mouse_pos = pygame.mouse.get_pos() #pegar a pos do mouse
 
-            # Desenhar a imagem de fundo
-            screen.blit(background, background_rect.topleft)
-
-            #  Texto botões
-
-            try_again_button = Button(image=None, pos=(screen_width // 2, background_rect.topleft[1] + background_height*0.72),
-                               text_input="TRY AGAIN", font=get_font(28), base_color="Black", hovering_color="White")
-
-            try_again_button.change_color(pause_mouse_pos)
-            try_again_button.update(screen)
+            # Redesenha apenas quando o botao muda de estado
+            game_over_screen.refresh(pause_mouse_pos)
+            if game_over_screen.draw(self.screen):
+                pygame.display.update(game_over_screen.background_rect)
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -438,14 +614,31 @@ class Menu:
                     sys.exit()
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     if try_again_button.check_for_input(pause_mouse_pos):
-                        self.start_botao.play(0)
+                        self.sounds.play('start_botao')
                         pygame.time.delay(50)
                         self.current_screen = "play"
                         self.level.start_phase()
 
 
-            pygame.display.update()
+    def get_dialogue_renderer(self):
+        """
+        Returns the dialogue renderer, creating it on the first use.
 
+        Returns
+        -------
+        DialogueRenderer
+            The renderer shared by every dialog of the game.
+        """
+        if self.dialogue_renderer is None:
+            self.dialogue_renderer = DialogueRenderer(
+                font=get_font(18),
+                max_width=SCREEN_DIMENSIONS[0] - 100,
+                start_y=SCREEN_DIMENSIONS[1] - 150,
+                line_spacing=40,
+                box_height=150,
+                reveal_speed=10  # Controla a velocidade das letras
+            )
+        return self.dialogue_renderer
 
     def dialogue(self, i):
         """
@@ -455,90 +648,17 @@ class Menu:
         -------
         None.
         """
-
-        def draw_dialog_box(speaker, screen, x, y, width, height, bg_color=(50, 50, 50), border_color=(255, 255, 255), border_width=2):
-            """Desenha um retângulo padrão para o diálogo."""
-            pygame.draw.rect(screen, bg_color, (x, y, width, height))
-            pygame.draw.rect(screen, border_color, (x, y, width, height), border_width)
-            picture = pygame.image.load(f'assets/spritesheets/{speaker}_dialogue.png')
-            picture = pygame.transform.scale(picture, (100, 100))
-            screen.blit(picture, (x + 20, y + (height - 120)))  # Ajustado para alinhar a imagem ao fundo
-
-
-        def wrap_text(text, font, max_width):
-            """Divide o texto em linhas que cabem na largura máxima."""
-            words = text.split(" ")
-            lines = []
-            current_line = ""
-
-            for word in words:
-                if font.size(current_line + word)[0] + 100 <= max_width:
-                    current_line += word + " "
-                else:
-                    lines.append(current_line.strip())
-                    current_line = word + " "
-
-            if current_line:
-                lines.append(current_line.strip())
-
-            return lines
-
-
-        def display_dialog(dialog, screen, font, max_width, start_y, line_spacing, box_height=150, reveal_speed=50, start_time=0):
-            """Renderiza o diálogo e revela o texto aos poucos."""
-            box_width = max_width + 40
-            box_x = 30
-            box_y = start_y - 20
-
-            # Desenha o retângulo de fundo
-            draw_dialog_box(dialog["speaker"], screen, box_x, box_y, box_width, box_height)
-
-            # Renderiza o nome do personagem
-            speaker_text = font.render(dialog["speaker"] + ":", True, (255, 255, 255))
-            screen.blit(speaker_text, (box_x + 130, start_y))
-
-            # Divide o texto em linhas
-            wrapped_lines = wrap_text(dialog["text"], font, max_width)
-
-            # Calcula o número de caracteres a serem exibidos
-            time_elapsed = pygame.time.get_ticks() - start_time
-            total_chars = time_elapsed // reveal_speed  # Calcula quantas letras mostrar com base no tempo
-
-            # Renderiza o texto progressivamente
-            y_offset = start_y + 40
-            char_count = 0
-            for line in wrapped_lines:
-                if y_offset + line_spacing > box_y + box_height:
-                    break  # Não exibe além da altura do box
-
-                if char_count + len(line) < total_chars:
-                    # Mostra a linha inteira se já passou do tempo
-                    rendered_line = font.render(line, True, (255, 255, 255))
-                    screen.blit(rendered_line, (box_x + 130, y_offset))
-                    char_count += len(line)
-                else:
-                    # Mostra apenas parte da linha
-                    visible_chars = total_chars - char_count
-                    rendered_line = font.render(line[:visible_chars], True, (255, 255, 255))
-                    screen.blit(rendered_line, (box_x + 130, y_offset))
-                    break
-
-                y_offset += line_spacing
-           
-            if total_chars >= sum(len(line) for line in wrapped_lines):
-                self.typing.stop()
-
-            # Verifica se todas as letras já foram exibidas
-            return total_chars >= sum(len(line) for line in wrapped_lines)
-
+        renderer = self.get_dialogue_renderer()
+        dialogs = self.level.dialogues[f"dialog_{i}"]
 
         # Loop principal
         current_dialog = 0
         running = True
         dialog_done = False
-        self.typing.play(loops=-1)
+        self.sounds.play('typing', loops=-1)
         dialog_start_time = pygame.time.get_ticks()  # Marca o início do diálogo
         while running:
+            self.clock.tick(FRAME_RATE)
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
@@ -546,31 +666,20 @@ class Menu:
                     if event.key == pygame.K_RETURN and dialog_done:  # Avança apenas se o texto estiver completo
                         current_dialog += 1
                         dialog_done = False
-                        self.typing.play(loops=-1)
-                        if current_dialog >= len(self.level.dialogues[f"dialog_{i}"]):
+                        self.sounds.play('typing', loops=-1)
+                        if current_dialog >= len(dialogs):
                             
                             running = False
                         else:
                             dialog_start_time = pygame.time.get_ticks()  # Reinicia o temporizador para o próximo diálogo
 
-            if current_dialog < len(self.level.dialogues[f"dialog_{i}"]):
-                # self.typing.play(loops=-1)
-                dialog_done = display_dialog(
-                    dialog=self.level.dialogues[f"dialog_{i}"][current_dialog],
-                    screen=screen,
-                    font=pygame.font.Font("assets/font.ttf", 18),
-                    max_width=SCREEN_DIMENSIONS[0] - 100,
-                    start_y=SCREEN_DIMENSIONS[1] - 150,
-                    line_spacing=40,
-                    box_height=150,
-                    reveal_speed=10,  # Controla a velocidade das letras
-                    start_time=dialog_start_time  # Passa o tempo de início
-                )
-
+            if current_dialog < len(dialogs):
+                dialog_done = renderer.draw(self.screen, dialogs[current_dialog], pygame.time.get_ticks() - dialog_start_time)
+                if dialog_done:
+                    self.sounds.stop('typing')
 
-            
             pygame.display.update()
-        self.typing.stop()
+        self.sounds.stop('typing')
         self.level.current_dialogue = None
 
     def initial_cutscene(self):
@@ -581,38 +690,38 @@ class Menu:
         -------
         None.
         """
-        self.fgv.play(loops=-1)
+        self.sounds.play('fgv', loops=-1)
         background = pygame.image.load('assets/backgrounds/fachada_fgv.png')  # Caminho para sua imagem
         background = pygame.transform.scale(background, SCREEN_DIMENSIONS)  
         background_rect = background.get_rect(center=SCREEN_DIMENSIONS/2)
-        screen.blit(background, background_rect.topleft)
+        self.screen.blit(background, background_rect.topleft)
         pygame.time.delay(500)
 
         self.dialogue(0)
         pygame.time.delay(500)
-        self.fgv.stop()
+        self.sounds.stop('fgv')
 
-        self.laboratorio.play(loops=-1)
+        self.sounds.play('laboratorio', loops=-1)
         background = pygame.image.load('assets/backgrounds/laboratorio.png')  # Caminho para sua imagem
         background = pygame.transform.scale(background, SCREEN_DIMENSIONS)  
         background_rect = background.get_rect(center=SCREEN_DIMENSIONS/2)
-        screen.blit(background, background_rect.topleft)
+        self.screen.blit(background, background_rect.topleft)
         pygame.time.delay(500)
         
         self.dialogue(1)
         pygame.time.delay(500)
-        self.laboratorio.stop()
+        self.sounds.stop('laboratorio')
 
-        self.botao_3.play(loops=0)
+        self.sounds.play('botao_3')
         background = pygame.image.load('assets/backgrounds/botao.png')  # Caminho para sua imagem
         background = pygame.transform.scale(background, SCREEN_DIMENSIONS) 
         background_rect = background.get_rect(center=SCREEN_DIMENSIONS/2) 
-        screen.blit(background, background_rect.topleft)
+        self.screen.blit(background, background_rect.topleft)
         pygame.time.delay(500)
         
         self.dialogue(2)
         pygame.time.delay(500)
-        self.botao_3.stop()
+        self.sounds.stop('botao_3')
 
         pygame.display.update()
 
@@ -633,26 +742,16 @@ class Menu:
         self.screen_width = SCREEN_DIMENSIONS[0]
         self.screen_height = SCREEN_DIMENSIONS[1]
         
-        # Configurações dos frames
-        self.columns = FINAL_COLUMNS_MENU
-        self.rows = FINAL_ROWS_MENU
-        
-        #  Carregar  a imagem com os frames
-        self.sprite_sheet = pygame.image.load(FINAL_SCREEN_MENU).convert_alpha()
-        self.dimensions = (self.sprite_sheet.get_width(), self.sprite_sheet.get_height())
-        self.frame_width = self.dimensions[0] // self.columns
-        self.frame_height = self.dimensions[1] // self.rows
-        
-        # Extrair frames da sprite sheet
-        self.frames = self.extract_frames()
+        # Frames da animação, escalados sob demanda e reaproveitados entre entradas
+        self.frames = self.get_frame_player(FINAL_SCREEN_MENU, FINAL_COLUMNS_MENU, FINAL_ROWS_MENU)
         
         #  Controle da animação
         self.current_frame = 0
         self.frame_delay = 100  # Tempo entre frames em milissegundos
         self.last_update_time = pygame.time.get_ticks()
 
-        final_music = pygame.mixer.Sound('audios\\backmusic.mp3')
-        final_music.play(-1)
+        # Musica tocada em streaming, sem decodificar o mp3 inteiro
+        self.sounds.play_music('final')
             
         while self.current_screen == "final_screen":
                 
@@ -667,7 +766,7 @@ class Menu:
                         if event.key in (pygame.K_KP_ENTER, pygame.K_RETURN):
                             self.level.phase_counter = 0
                             self.current_screen = "main_menu"
-                            final_music.stop()
+                            self.sounds.stop_music()
                             pygame.display.update()
                             
 
@@ -678,7 +777,7 @@ class Menu:
                     self.current_frame = 0
 
                 # Desenhar na tela
-                screen.blit(self.frames[int(self.current_frame)], (0, 0))
+                self.screen.blit(self.frames[int(self.current_frame)], (0, 0))
                 pygame.display.flip()
                 
                 pygame.display.update()
@@ -0,0 +1,215 @@
+"""
+Navegacao dos viloes pelos objetos estaticos de uma fase, por campos de fluxo.
+
+A grade de navegacao marca as celulas do mapa bloqueadas pelos objetos estaticos, a partir
+da `StaticGrid` da fase. Para cada alvo (o player, os Scooby Snacks) um `FlowField` guarda
+a distancia de cada celula ate o alvo e a direcao do proximo passo; ele so e recalculado
+quando o alvo muda de celula, e no maximo uma vez a cada `interval` ticks. Os viloes apenas
+leem a direcao da sua celula, entao o custo da busca de caminhos nao depende da quantidade
+de viloes.
+"""
+import math
+import numpy as np
+
+# Lado de cada celula da grade de navegacao, em pixels
+NAVIGATION_CELL_SIZE = 64
+
+# Passos para as 8 celulas vizinhas: (linha, coluna, custo)
+STEPS = tuple((d_row, d_column, math.hypot(d_row, d_column)) for d_row in (-1, 0, 1) for d_column in (-1, 0, 1) if d_row or d_column)
+
+
+class NavigationGrid:
+    """
+    Celulas do mapa por onde os personagens podem andar.
+
+    Parameters
+    ----------
+    static_grid : StaticGrid
+        Grade de colisao dos objetos estaticos da fase.
+    cell_size : int
+        Lado de cada celula, em pixels. E arredondado para um multiplo da celula de `static_grid`.
+    clearance : float
+        Folga, em pixels, mantida entre os objetos estaticos e o centro de quem anda; em
+        geral metade da largura dos viloes. E arredondada para celulas de `static_grid`.
+
+    Attributes
+    ----------
+    blocked : np.ndarray
+        Celulas (linha, coluna) bloqueadas.
+    """
+    def __init__(self, static_grid, cell_size=NAVIGATION_CELL_SIZE, clearance=0):
+        factor = max(round(cell_size/static_grid.cell_size), 1)
+        self.cell_size = factor*static_grid.cell_size
+        self.map_size = static_grid.map_size
+        occupied = static_grid.cells > 0
+        # A folga dilata os objetos, uma celula da grade estatica por vez
+        for _ in range(round(clearance/static_grid.cell_size)):
+            dilated = occupied.copy()
+            dilated[1:] |= occupied[:-1]
+            dilated[:-1] |= occupied[1:]
+            dilated[:, 1:] |= occupied[:, :-1]
+            dilated[:, :-1] |= occupied[:, 1:]
+            occupied = dilated
+        # Uma celula de navegacao e bloqueada se qualquer celula estatica dentro dela estiver ocupada
+        rows, columns = occupied.shape
+        padded = np.zeros((math.ceil(rows/factor)*factor, math.ceil(columns/factor)*factor), dtype=bool)
+        padded[:rows, :columns] = occupied
+        self.blocked = padded.reshape(padded.shape[0]//factor, factor, padded.shape[1]//factor, factor).any(axis=(1, 3))
+        self.rows, self.columns = self.blocked.shape
+
+    @property
+    def shape(self):
+        return self.rows, self.columns
+
+    def cells_of(self, positions):
+        """
+        Retorna as celulas (linha, coluna) de posicoes do mapa, limitadas a grade.
+
+        Parameters
+        ----------
+        positions : array_like
+            Posicoes (x, y), formato (n, 2).
+
+        Returns
+        -------
+        tuple of np.ndarray
+            Linhas e colunas das celulas.
+        """
+        positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+        columns = np.clip((positions[:, 0]//self.cell_size).astype(np.intp), 0, self.columns - 1)
+        rows = np.clip((positions[:, 1]//self.cell_size).astype(np.intp), 0, self.rows - 1)
+        return rows, columns
+
+    def cell_of(self, position):
+        """
+        Retorna a celula (linha, coluna) de uma posicao do mapa.
+        """
+        rows, columns = self.cells_of(position)
+        return int(rows[0]), int(columns[0])
+
+
+class FlowField:
+    """
+    Distancia ate um alvo e direcao do proximo passo em cada celula de uma `NavigationGrid`.
+
+    As distancias sao calculadas por relaxacoes vetorizadas das 8 vizinhancas ate nao mudarem
+    mais; passos diagonais nao cortam quinas de celulas bloqueadas. A celula do alvo e
+    sempre considerada livre, para que um alvo encostado em um objeto continue alcancavel.
+
+    Parameters
+    ----------
+    grid : NavigationGrid
+        A grade de navegacao.
+    interval : int
+        Menor quantidade de ticks entre dois recalculos.
+
+    Attributes
+    ----------
+    target : tuple or None
+        Celula (linha, coluna) do alvo do ultimo calculo.
+    distance : np.ndarray
+        Custo do caminho de cada celula ate o alvo; infinito onde nao ha caminho.
+    directions : np.ndarray
+        Passo (dx, dy), com componentes em {-1, 0, 1}, de cada celula em direcao ao alvo;
+        zero na celula do alvo e onde nao ha caminho.
+    computed : int
+        Quantidade de vezes que o campo foi calculado.
+    """
+    def __init__(self, grid, interval=10):
+        self.grid = grid
+        self.interval = interval
+        self.target = None
+        self.distance = np.full(grid.shape, np.inf)
+        self.directions = np.zeros(grid.shape + (2,), dtype=np.int8)
+        self.computed = 0
+        self._ticks_since = interval
+
+    def retarget(self, position):
+        """
+        Chamado uma vez por tick com a posicao do alvo; recalcula o campo se o alvo mudou de
+        celula e o ultimo calculo tiver sido ha pelo menos `interval` ticks.
+
+        Returns
+        -------
+        bool
+            Se o campo foi recalculado.
+        """
+        self._ticks_since += 1
+        cell = self.grid.cell_of(position)
+        if cell == self.target or (self.target is not None and self._ticks_since < self.interval):
+            return False
+        self.compute(cell)
+        return True
+
+    def compute(self, target):
+        """
+        Calcula o campo para o alvo na celula (linha, coluna) dada.
+        """
+        rows, columns = self.grid.shape
+        free = ~self.grid.blocked
+        free[target] = True
+        padded_free = np.zeros((rows + 2, columns + 2), dtype=bool)
+        padded_free[1:-1, 1:-1] = free
+        # Bordas infinitas: os vizinhos de cada celula sao fatias deslocadas do array
+        padded = np.full((rows + 2, columns + 2), np.inf)
+        distance = padded[1:-1, 1:-1]
+        distance[target] = 0.0
+        allowed = [self._allowed(padded_free, d_row, d_column) for d_row, d_column, _ in STEPS]
+        changed = True
+        while changed:
+            changed = False
+            for (d_row, d_column, cost), step_allowed in zip(STEPS, allowed):
+                candidate = padded[1 + d_row:1 + d_row + rows, 1 + d_column:1 + d_column + columns] + cost
+                improved = step_allowed & (candidate < distance)
+                if improved.any():
+                    distance[improved] = candidate[improved]
+                    changed = True
+        self.distance = distance.copy()
+
+        # Direcao do vizinho que leva mais perto do alvo, inclusive saindo de celulas bloqueadas
+        best = np.full((rows, columns), np.inf)
+        directions = np.zeros((rows, columns, 2), dtype=np.int8)
+        for d_row, d_column, cost in STEPS:
+            step_allowed = self._allowed(padded_free, d_row, d_column, from_blocked=True)
+            candidate = padded[1 + d_row:1 + d_row + rows, 1 + d_column:1 + d_column + columns] + cost
+            improved = step_allowed & (candidate < best)
+            best[improved] = candidate[improved]
+            directions[improved] = d_column, d_row
+        directions[target] = 0
+        self.directions = directions
+        self.target = target
+        self.computed += 1
+        self._ticks_since = 0
+
+    @staticmethod
+    def _allowed(padded_free, d_row, d_column, from_blocked=False):
+        """
+        Retorna onde o passo (d_row, d_column) de cada celula para a vizinha e permitido.
+        """
+        rows, columns = padded_free.shape[0] - 2, padded_free.shape[1] - 2
+        allowed = padded_free[1 + d_row:1 + d_row + rows, 1 + d_column:1 + d_column + columns].copy()
+        if not from_blocked:
+            allowed &= padded_free[1:-1, 1:-1]
+        if d_row and d_column:
+            # Diagonais so passam se as duas celulas ortogonais estiverem livres
+            allowed &= padded_free[1 + d_row:1 + d_row + rows, 1:-1]
+            allowed &= padded_free[1:-1, 1 + d_column:1 + d_column + columns]
+        return allowed
+
+    def sample(self, positions):
+        """
+        Retorna o passo de cada posicao do mapa em direcao ao alvo.
+
+        Parameters
+        ----------
+        positions : array_like
+            Posicoes (x, y), formato (n, 2).
+
+        Returns
+        -------
+        np.ndarray
+            Passos (dx, dy) com componentes em {-1, 0, 1}; zero para quem ja esta na celula
+            do alvo ou nao tem caminho ate ele.
+        """
+        rows, columns = self.grid.cells_of(positions)
+        return self.directions[rows, columns].astype(float)
@@ -1,12 +1,25 @@
 import pygame as pg
-from src.settings import SCREEN_DIMENSIONS, FRAME_RATE
+from src.settings import SCREEN_DIMENSIONS, TICK_RATE, EVENT_SPRITE
 from src.classes.gameobjects import GameObject, Collectible, Ammo, Weapon
 from src.classes.protagonist import Group1Protagonist
 from src.classes.background import Background, PositionController, Interface, CollideController
 from src.classes.villain import Villain
+from src.classes.villainai import VillainAI
+from src.classes.navigation import NavigationGrid
+from src.classes.assets import asset_cache, normalize_path
+from src.classes.assetpack import phase_manifest, hud_manifest
+from src.classes.tiles import ensure_tiles
+from src.classes.projectiles import projectile_pools
+from src.classes.staticgrid import StaticGrid, load_static_grid
+from src.classes.spatial import EntityGrid
+from src.classes.entities import entity_store
+from src.classes.pipeline import FramePipeline
+from src.classes.lod import lod_scheduler, FAR
+import threading
 import random
 import numpy as np
 import json
+import os
 
 
 def random_data(background):
@@ -27,13 +40,13 @@ def random_data(background):
 
     ammunition = Ammo(x_position=x, y_position=y, width=20, height=20, map_limits_sup=map_limits_sup, spritesheet='assets\\backgrounds\\shaggy_right_1.png', sprite_actual_x=0, sprite_actual_y=0, sprites_quantity=1, is_static=False, damage=1, effects=[], direction=np.zeros(2, dtype=float), recochet=False, speed=7)
     
-    weapon = Weapon(x_position=x, y_position=y, width=100, height=20, map_limits_sup=map_limits_sup, spritesheet='assets\\backgrounds\\shaggy_right_1.png', sprite_actual_x=0, is_static=False, sprite_actual_y=0, sprites_quantity=1, damage=0.007, kind_damage=None, attack_field=50, reload_time=2*FRAME_RATE, ammo=ammunition, scope=250, special_effect=None)
+    weapon = Weapon(x_position=x, y_position=y, width=100, height=20, map_limits_sup=map_limits_sup, spritesheet='assets\\backgrounds\\shaggy_right_1.png', sprite_actual_x=0, is_static=False, sprite_actual_y=0, sprites_quantity=1, damage=0.007, kind_damage=None, attack_field=50, reload_time=2*TICK_RATE, ammo=ammunition, scope=250, special_effect=None)
 
     player = Group1Protagonist(name='Scooby', speed=10, perception=23, x_position=SCREEN_DIMENSIONS[0], y_position=SCREEN_DIMENSIONS[1], width=width, height=height, direction=0, skin='default', life=5, inventory=[], ability=1, sprites_quantity=4, map_limits_sup=map_limits_sup, bullets=100, weapon=weapon, trap_power=3)
     
     x = random.choice(range(SCREEN_DIMENSIONS[0]*2))
     y = random.choice(range(SCREEN_DIMENSIONS[1]*2))
-    scooby_snacks = Collectible(x, y, 50, 50, map_limits_sup, spritesheet='assets\\backgrounds\\shaggy_right_1.png', sprite_actual_x=0, sprite_actual_y=0, sprites_quantity=1, visible=False, description='Scooby Snacks')
+    scooby_snacks = Collectible(x, y, 50, 50, map_limits_sup, spritesheet='assets\\backgrounds\\shaggy_right_1.png', sprite_actual_x=0, sprite_actual_y=0, sprites_quantity=1, is_static=True, visible=False, description='Scooby Snacks')
     
     width = 75
     height = 100
@@ -46,17 +59,17 @@ def random_data(background):
         y = random.choice(range(SCREEN_DIMENSIONS[1]*2))
         width = 23
         height = 40
-        collectibles.append(Collectible(x_position=x, y_position=y, width=width, height=height, map_limits_sup=map_limits_sup, spritesheet='assets\\backgrounds\\shaggy_right_1.png', sprite_actual_x=0, sprite_actual_y=0, sprites_quantity=1, visible=True, description=description))
+        collectibles.append(Collectible(x_position=x, y_position=y, width=width, height=height, map_limits_sup=map_limits_sup, spritesheet='assets\\backgrounds\\shaggy_right_1.png', sprite_actual_x=0, sprite_actual_y=0, sprites_quantity=1, is_static=False, visible=True, description=description))
         x = random.choice(range(SCREEN_DIMENSIONS[0]*2))
         y = random.choice(range(SCREEN_DIMENSIONS[1]*2))
-        mandatory_events.append(Minigame(id_event=1, player=player, start_zone=(x, y, 100, 75), event_zone=(x, y, 700, 350), end_zone=(x+600, y, 100, 75), is_mandatory=True, map_limits_sup=map_limits_sup, villains=monster, npcs=npcs, time=4*FRAME_RATE))
+        mandatory_events.append(Minigame(id_event=1, player=player, start_zone=(x, y, 100, 75), event_zone=(x, y, 700, 350), end_zone=(x+600, y, 100, 75), is_mandatory=True, map_limits_sup=map_limits_sup, villains=monster, npcs=npcs, time=4*TICK_RATE))
 
 
         x = random.choice(range(SCREEN_DIMENSIONS[0]*2))
         y = random.choice(range(SCREEN_DIMENSIONS[1]*2))
         width = 67
         height = 100
-        npcs.append(GameObject(x,y, width, height, map_limits_sup, spritesheet='assets\\backgrounds\\shaggy_right_1.png', sprite_actual_x=0, sprite_actual_y=0, sprites_quantity=1))
+        npcs.append(GameObject(x,y, width, height, map_limits_sup, spritesheet='assets\\backgrounds\\shaggy_right_1.png', sprite_actual_x=0, sprite_actual_y=0, sprites_quantity=1, is_static=False))
         x = random.choice(range(SCREEN_DIMENSIONS[0]*2))
         y = random.choice(range(SCREEN_DIMENSIONS[1]*2))
         optional_events.append(Event(1, player=player, start_zone=(x, y, 50, 25), event_zone=(x, y, 150, 50), end_zone=(x+50, y, 50, 25), is_mandatory=False, map_limits_sup=map_limits_sup))
@@ -81,8 +94,7 @@ class Event(pg.sprite.Sprite):
         self.event_zone_params = list(event_zone)
         self.end_zone = pg.Rect(*end_zone)
         self.is_mandatory = is_mandatory
-        self.image = pg.image.load('assets\\backgrounds\\lua.png')
-        self.image = pg.transform.scale(self.image, (self.rect.width, self.rect.height))
+        self.image = asset_cache.acquire(self, EVENT_SPRITE, (self.rect.width, self.rect.height))
     
     @property
     def position_controller(self):
@@ -145,23 +157,31 @@ class Event(pg.sprite.Sprite):
         self.in_execution = True
         self.started = True
         self.rect = pg.Rect(*self.event_zone_params)
-        self.image = pg.transform.scale(self.image, (self.rect.width, self.rect.height))
+        self.image = asset_cache.acquire(self, EVENT_SPRITE, (self.rect.width, self.rect.height))
     
     def end_event(self):
         self.in_execution = False
         self.completed = True
     
-    def update(self):
+    def update_rect(self):
         x_position, y_position = self.get_position()
         x_new, y_new = self.position_controller.apply_translation(x_position, y_position)
         self.set_position_rect(x_new, y_new)
         x_end_position, y_end_position = self.get_end_position()
         x_new_end, y_new_end = self.position_controller.apply_translation(x_end_position, y_end_position)
         self.set_position_end_rect(x_new_end, y_new_end)
+
+    def update(self):
+        self.update_rect()
         # Avalia se o usuario iniciou ou finalizou o evento
         if not self.started:
-            if self.can_start():
-                self.start_event()
+            # Longe da camera o player nao pode estar na zona de inicio
+            if lod_scheduler.rect_level(self.rect) == FAR:
+                lod_scheduler.record('event', skipped=1)
+            else:
+                lod_scheduler.record('event', performed=1)
+                if self.can_start():
+                    self.start_event()
         elif self.in_execution:
             self.out_zone = False
             if self.check_end():
@@ -195,6 +215,7 @@ class Minigame(Event):
         self._time = time_new
         
     def pass_time(self):
+        # O tempo do minigame e contado em ticks da simulacao
         new_time = self.time
         new_time -= 1
         self.time = new_time
@@ -240,7 +261,7 @@ class Minigame(Event):
                 self.out_zone = True 
 
 class Phase:
-    def __init__(self, screen, background, npcs, collectibles, mandatory_events, optional_events, player, monster, game_objects, scooby_snacks):
+    def __init__(self, screen, background, npcs, collectibles, mandatory_events, optional_events, player, monsters, game_objects, scooby_snacks, static_grid=None):
         self.screen = screen
         self.phase_elements = pg.sprite.Group()
         self.accessible_elements = pg.sprite.Group()
@@ -251,16 +272,16 @@ class Phase:
         self.player = player
         self.scooby_snacks = scooby_snacks
         
-        self.monster = monster
-        self.monsters = pg.sprite.Group(self.monster)
+        self.monsters = pg.sprite.Group(monsters)
+        self.monster = self.monsters.sprites()[0]
+        self.weapons = pg.sprite.Group([each_monster.weapon for each_monster in self.monsters])
         
         self.phase_elements.add(self.player)
         self.phase_elements.add(self.scooby_snacks)
-        self.accessible_elements.add(self.monster)
+        self.accessible_elements.add(self.monsters)
         
         self.phase_elements.add(self.scooby_snacks)
-        for each_monster in self.monsters.sprites():
-            self.phase_elements.add(each_monster.weapon)
+        self.phase_elements.add(self.weapons)
         
         self.npcs = pg.sprite.Group(npcs)
         self.phase_elements.add(self.npcs)
@@ -277,18 +298,121 @@ class Phase:
         self.optional_events = pg.sprite.Group(optional_events)
         self.phase_elements.add(self.optional_events)
 
+        # Projeteis de fases anteriores nao continuam em voo
+        projectile_pools.clear()
+        # O nivel de detalhe e as contagens de trabalho pulado valem para esta fase
+        lod_scheduler.reset()
+
+        # Grade de colisao dos objetos estaticos, calculada aqui se nao veio pronta do json
+        static_objects = [each_object for each_object in self.game_objects if each_object.is_static]
+        if static_grid is None:
+            static_grid = StaticGrid([(each_object.x_position - each_object.width/2, each_object.y_position - each_object.height/2, each_object.width, each_object.height) for each_object in static_objects], background.get_shape())
+        static_grid.bind(static_objects)
+        self.static_grid = static_grid
+
+        # Os viloes so precisam de campos de fluxo quando ha objetos estaticos para contornar
+        navigation = None
+        if len(self.static_grid):
+            navigation = NavigationGrid(self.static_grid, clearance=min(min(each_monster.width, each_monster.height) for each_monster in self.monsters)/2)
+        self.villain_ai = VillainAI(self.monsters.sprites(), navigation=navigation, lod=lod_scheduler)
+
         # Gerenciador de colisoes
-        self.collide_controller = CollideController(player=self.player, npcs=npcs, villains=self.monsters, game_objects=self.game_objects, collectibles=self.collectibles, ammus=pg.sprite.Group(), mandatory_events=self.mandatory_events, optional_events=self.optional_events, scooby_snacks=self.scooby_snacks, weapons=pg.sprite.Group(each_monster.weapon), phase_elements=self.phase_elements)
+        self.collide_controller = CollideController(player=self.player, npcs=npcs, villains=self.monsters, game_objects=self.game_objects, collectibles=self.collectibles, ammus=projectile_pools.visible, mandatory_events=self.mandatory_events, optional_events=self.optional_events, scooby_snacks=self.scooby_snacks, weapons=self.weapons, phase_elements=self.phase_elements, static_grid=self.static_grid, projectiles=projectile_pools)
+
+        # Elementos no campo de visao, mantidos entre os quadros
+        self.render_index = EntityGrid(entity_store)
+        self.visible_elements = pg.sprite.Group()
+        self.rows_in_view = set()
+        self.events_in_view = set()
+        self.accessible_version = None
+        self.accessible_order = {}
+
+        # Cada tick executa os estagios de 'input' a 'camera' e cada quadro desenhado executa 'render'
+        self.movement_input = np.zeros(2)
+        self.attack_input = np.zeros(2)
+        self.render_alpha = 1.0
+        self.pipeline = FramePipeline([('input', self.process_input), ('lod', self.classify_detail), ('ai', self.run_ai), ('physics', self.run_physics),
+                                       ('collision', self.resolve_collisions), ('camera', self.update_camera), ('render', self.draw_frame)])
+        # A camera ja comeca centrada no player, antes do primeiro tick
+        self.update_camera()
 
         self.background.play_music()
 
-    def render_camera(self):
-        """ Avalia quais elementos do jogo sao acessiveis e estao no campo de visao do protagonista para serem renderizados """
-        objects_to_render = pg.sprite.spritecollide(self.background, self.collide_controller.accessible_elements, False)
-        to_render = pg.sprite.Group()
-        to_render.add(self.player)
-        to_render.add(objects_to_render)
-        to_render.draw(self.screen)
+    def update_visible(self):
+        """ Atualiza os elementos acessiveis no campo de visao, consultando o indice espacial com o retangulo da camera """
+        accessible_elements = self.collide_controller.accessible_elements
+        camera = self.background.rect
+        # Teste exato vetorizado apenas nas linhas do EntityStore proximas da camera
+        self.render_index.sync()
+        rows = np.array(self.render_index.query(*self.background.get_position(), *camera.size), dtype=np.intp)
+        screen_position = entity_store.screen_position[rows]
+        half_size = entity_store.size[rows]/2
+        inside = ((screen_position + half_size > 0) & (screen_position - half_size < camera.size)).all(axis=1)
+        rows_in_view = set(rows[inside].tolist())
+        # Eventos nao estao no EntityStore; sao poucos e testados diretamente
+        events_in_view = {each_event for each_event in self.mandatory_events.sprites() + self.optional_events.sprites() if camera.colliderect(each_event.rect)}
+
+        if accessible_elements.version != self.accessible_version:
+            # Os elementos acessiveis mudaram: o conjunto visivel e refeito por inteiro
+            self.accessible_version = accessible_elements.version
+            self.accessible_order = {each_element: index for index, each_element in enumerate(accessible_elements)}
+            self.visible_elements.empty()
+            self.rows_in_view = set()
+            self.events_in_view = set()
+        # Nos demais quadros so as linhas que entraram ou sairam do campo de visao sao visitadas
+        left = [entity_store.owner(row) for row in self.rows_in_view - rows_in_view]
+        left.extend(self.events_in_view - events_in_view)
+        entered = [entity_store.owner(row) for row in rows_in_view - self.rows_in_view]
+        entered.extend(events_in_view - self.events_in_view)
+        self.rows_in_view = rows_in_view
+        self.events_in_view = events_in_view
+
+        self.visible_elements.remove([each_element for each_element in left if each_element is not None])
+        entered = [each_element for each_element in entered if each_element in self.accessible_order]
+        if entered:
+            # Mantem entre os que entram a ordem de desenho dos elementos acessiveis
+            entered.sort(key=self.accessible_order.__getitem__)
+            self.visible_elements.add(entered)
+
+    def interpolate(self, alpha, origin):
+        """ Coloca os rects do player e dos elementos visiveis entre os dois ultimos ticks, retornando os centros do tick """
+        elements = [self.player] + [each_element for each_element in self.visible_elements if hasattr(each_element, 'row')]
+        # Eventos nao estao no EntityStore e nao se movem: so acompanham a camera
+        events = [each_element for each_element in self.visible_elements if not hasattr(each_element, 'row')]
+        tick_centers = [(each_element, each_element.rect.center) for each_element in elements + events]
+        rows = np.array([each_element.row for each_element in elements], dtype=np.intp)
+        for each_element, center in zip(elements, entity_store.interpolated_screen_position(rows, alpha).tolist()):
+            each_element.rect.center = center
+        shift = entity_store.origin - origin
+        for each_event in events:
+            each_event.rect.center = (each_event.rect.centerx + shift[0], each_event.rect.centery + shift[1])
+        projectile_pools.interpolate(origin, alpha)
+        return tick_centers
+
+    def draw_frame(self):
+        """ Desenha o fundo, o player e os elementos acessiveis no campo de visao, interpolados entre os dois ultimos ticks """
+        # Fundo, sprites, eventos e projeteis usam a mesma camera entre os dois ultimos ticks
+        origin = entity_store.interpolated_origin(self.render_alpha)
+        self.background.draw_background_image(origin)
+        self.update_visible()
+        # Os rects sao refeitos a partir do EntityStore: a camera pode ter andado depois das colisoes
+        tick_centers = self.interpolate(self.render_alpha, origin)
+        self.screen.blit(self.player.image, self.player.rect)
+        self.visible_elements.draw(self.screen)
+        projectile_pools.visible.draw(self.screen)
+        pg.draw.line(self.screen, (0, 0, 0), self.player.rect.center, (np.array(self.player.rect.center)+self.player.aim*50))
+        # Miras das linhas de tiro do ultimo tick, ate o alcance ou o primeiro obstaculo
+        for each_monster, direction, reach in self.collide_controller.aim_rays.lines():
+            if each_monster in self.visible_elements:
+                pg.draw.line(self.screen, (0, 0, 0), each_monster.weapon.rect.center, np.array(each_monster.weapon.rect.center) + direction*reach)
+        # A simulacao continua das posicoes do tick
+        for each_element, center in tick_centers:
+            each_element.rect.center = center
+
+    def render_camera(self, alpha=1.0):
+        """ Executa o estagio de desenho do pipeline """
+        self.render_alpha = alpha
+        self.pipeline.run(first='render')
          
     def check_end(self):
         """  Verifica se o player passou pela phase (chama a próxima phase e encerra a atual) """
@@ -300,26 +424,110 @@ class Phase:
         """ Verifica se o player falhou (seja por tempo, seja por vida, seja por falha em algum evento da phase, etc) """
         return self.player.life <= 0
             
-    def update(self, movement, attack):
-        self.player.aim = np.array(attack)
-
-        # Aplica o movimento do player e atualiza o background, obtendo o centro do mapa
-        movement = self.player.position_controller.normalize_movement(movement, self.player.speed)
+    def process_input(self):
+        """ Estagio 'input': aplica a mira e o movimento do player """
+        # Posicoes do tick anterior, usadas para interpolar o desenho
+        entity_store.snapshot()
+        self.player.aim = np.array(self.attack_input)
+        movement = self.player.position_controller.normalize_movement(self.movement_input, self.player.speed)
         self.player.apply_movement(movement)
-        self.background.update(self.player.x_position, self.player.y_position)
-        self.monsters.update(self.player)
-        
-        # Atualiza todos os elementos da phase, aplicando a translacao para o novo sistema de coordenadas
+
+    def classify_detail(self):
+        """ Estagio 'lod': classifica as entidades pela distancia ate a camera """
+        lod_scheduler.classify(entity_store, self.background.get_position(), self.background.rect.size)
+
+    def run_ai(self):
+        """ Estagio 'ai': os viloes decidem, se movem e atacam """
+        self.villain_ai.update(self.player)
+
+    def run_physics(self):
+        """ Estagio 'physics': move os projeteis e avanca os elementos da fase (municoes, recarga, eventos, animacoes) """
+        # Move todos os projeteis de uma vez; so os visiveis viram sprites na tela
+        projectile_pools.update(self.background.get_position(), static_grid=self.static_grid)
         self.phase_elements.update()
 
+    def resolve_collisions(self):
+        """ Estagio 'collision': resolve as colisoes; quem e empurrado atualiza o proprio rect em apply_movement """
         self.collide_controller.update(self.phase_elements)
-        self.background.update(self.player.x_position, self.player.y_position)
-        self.phase_elements.update()     
-        
+
+    def update_camera(self):
+        """ Estagio 'camera': centraliza a camera no player, ja na posicao final do tick """
+        self.background.update_camera(self.player.x_position, self.player.y_position)
+        # Eventos nao estao no EntityStore; os demais rects sao refeitos no desenho
+        for each_event in self.mandatory_events.sprites() + self.optional_events.sprites():
+            each_event.update_rect()
+
+    def step(self, movement, attack):
+        """ Avanca a simulacao da fase em um tick, executando os estagios de 'input' a 'camera' """
+        self.movement_input = movement
+        self.attack_input = attack
+        self.pipeline.run(last='camera')
+
+    def update(self, movement, attack):
+        """ Avanca um tick e desenha o resultado, sem interpolacao """
+        self.step(movement, attack)
         self.render_camera()
-        pg.draw.line(self.screen, (0, 0, 0), self.player.rect.center, (np.array(self.player.rect.center)+self.player.aim*50))
-        if self.monster.aim.any():
-            pg.draw.line(self.screen, (0, 0, 0), self.monster.weapon.rect.center, np.array(self.monster.weapon.rect.center) + self.monster.aim*self.monster.weapon.scope/np.linalg.norm(self.monster.aim))
+
+
+def phase_json_path(phase_counter):
+    """ Caminho do json de uma fase """
+    return os.path.join('jsons', f'phase_{phase_counter}.json')
+
+
+def load_phase_data(phase_counter):
+    """ Le o json de uma fase """
+    with open(phase_json_path(phase_counter), "r") as file:
+        return json.load(file)
+
+
+class PhasePreloader(threading.Thread):
+    """ Le o json de uma fase e decodifica suas superficies em segundo plano, sem tocar na tela """
+    def __init__(self, phase_counter):
+        super().__init__(daemon=True)
+        self.phase_counter = phase_counter
+        self.phase_data = None
+        self.static_grid = None
+        self.error = None
+        self.references = []
+        self.tile_pack = None
+        
+    def run(self):
+        try:
+            self.phase_data = load_phase_data(self.phase_counter)
+            self.static_grid = load_static_grid(phase_json_path(self.phase_counter), self.phase_data)
+            background = self.phase_data['background']
+            if background.get('tile_size'):
+                # Os tiles sao gerados aqui, se preciso, e o arquivo aberto segue para o TileMap
+                self.tile_pack = ensure_tiles(background['sprite'], background['width'], background['height'], background['tile_size'])
+            for path, size in phase_manifest(self.phase_data) + hud_manifest():
+                # Arquivos ausentes ficam para o carregamento normal, que reporta o erro
+                if os.path.exists(normalize_path(path)):
+                    asset_cache.preload(path, size)
+                    self.references.append((path, size))
+        except Exception as error:
+            # A fase sera carregada de forma sincrona em start_phase
+            self.error = error
+    
+    def finish(self):
+        """ Espera o thread e converte no thread principal as superficies para o formato da tela """
+        self.join()
+        asset_cache.convert_pending()
+        return self.phase_data
+    
+    def take_tiles(self):
+        """ Entrega o arquivo de tiles aberto no thread, que passa a ser de quem o recebe """
+        tile_pack, self.tile_pack = self.tile_pack, None
+        return tile_pack
+    
+    def release(self):
+        """ Libera as referencias mantidas enquanto a fase nao era montada """
+        for path, size in self.references:
+            asset_cache.release(path, size)
+        self.references = []
+        # Arquivo de tiles que ninguem recebeu
+        tile_pack = self.take_tiles()
+        if tile_pack is not None:
+            tile_pack.close()
 
 
 class PhaseManager:
@@ -329,16 +537,34 @@ class PhaseManager:
         # Inicia a primeira fase
         self._current_phase =  None
         self.interface = None
+        self.preloader = None
         # self.start_phase()
 
-
+    def preload_phase(self):
+        """ Comeca a carregar a fase atual em segundo plano, para que start_phase nao trave o jogo """
+        if self.preloader is not None and self.preloader.phase_counter == self.phase_counter:
+            return
+        self.preloader = PhasePreloader(self.phase_counter)
+        self.preloader.start()
     
     def start_phase(self):
-        with open(f"jsons\\phase_{self.phase_counter}.json", "r") as file:
-            phase_data = json.load(file)
+        preloader, self.preloader = self.preloader, None
+        phase_data = None
+        static_grid = None
+        tile_pack = None
+        if preloader is not None:
+            preloaded_data = preloader.finish()
+            if preloader.phase_counter == self.phase_counter:
+                phase_data = preloaded_data
+                static_grid = preloader.static_grid
+                tile_pack = preloader.take_tiles()
+        if phase_data is None:
+            phase_data = load_phase_data(self.phase_counter)
+        if static_grid is None:
+            static_grid = load_static_grid(phase_json_path(self.phase_counter), phase_data)
             
         # Ler e criar elementos da nova fase
-        background = Background(self.screen, phase_data['background']['sprite'], SCREEN_DIMENSIONS[0], SCREEN_DIMENSIONS[1], phase_data['background']['width'], phase_data['background']['height'], phase_data['background']['music'], phase_data['background']['volume'], phase_data['background']['sounds']) 
+        background = Background(self.screen, phase_data['background']['sprite'], SCREEN_DIMENSIONS[0], SCREEN_DIMENSIONS[1], phase_data['background']['width'], phase_data['background']['height'], phase_data['background']['music'], phase_data['background']['volume'], phase_data['background']['sounds'], phase_data['background'].get('tile_size'), tile_pack) 
         map_limits_sup = list(background.get_shape())
         
         ammunition = Ammo(phase_data['ammos']['name']['x_position'], phase_data['ammos']['name']['y_position'], phase_data['ammos']['name']['width'], phase_data['ammos']['name']['height'], map_limits_sup, phase_data['ammos']['name']['spritesheet'], phase_data['ammos']['name']['sprite_actual_x'], phase_data['ammos']['name']['sprite_actual_y'], phase_data['ammos']['name']['sprites_quantity'], phase_data['ammos']['name']['is_static'], phase_data['ammos']['name']['damage'], phase_data['ammos']['name']['effects'], np.zeros(2, dtype=float), phase_data['ammos']['name']['recochet'], phase_data['ammos']['name']['speed'])
@@ -374,11 +600,15 @@ class PhaseManager:
         for each_optional_event in phase_data['optional_events'].keys():
             optional_events.append(Event(phase_data['optional_events'][each_optional_event]['id_event'], player, phase_data['optional_events'][each_optional_event]['start_zone'], phase_data['optional_events'][each_optional_event]['event_zone'], phase_data['optional_events'][each_optional_event]['end_zone'], phase_data['optional_events'][each_optional_event]['is_obrigatory'], map_limits_sup))
 
-        self.current_phase = Phase(self.screen, background, npcs, collectibles, mandatory_events, optional_events, player, villains[0], game_objects, scooby_snacks)
+        self.current_phase = Phase(self.screen, background, npcs, collectibles, mandatory_events, optional_events, player, villains, game_objects, scooby_snacks, static_grid)
         self.interface = Interface(self.screen, self.current_phase, [])
         
         self.current_dialogue = 0
         self.dialogues = phase_data['dialogs']
+        
+        # As entidades ja possuem suas proprias referencias
+        if preloader is not None:
+            preloader.release()
     
     @property
     def phase_counter(self):
@@ -396,19 +626,26 @@ class PhaseManager:
     def current_phase(self, new_phase):
         self._current_phase = new_phase
         
-    def update(self, movement, attack):
-        # Atualiza a fase atual
+    def step(self, movement, attack):
+        """ Avanca a fase atual em um tick da simulacao """
         if not self.current_phase.check_lost():
-            self.current_phase.update(movement, attack) 
+            self.current_phase.step(movement, attack) 
         
         # Verifica a passagem de fase
         if self.current_phase.check_end():
             self.phase_counter = 1
             # self.start_phase()
-         
-        # Atualiza a interface
+
+    def render(self, alpha=1.0):
+        """ Desenha a fase atual, interpolada entre os dois ultimos ticks, e a interface """
+        self.current_phase.render_camera(alpha)
         self.interface.update()
 
+    def update(self, movement, attack):
+        """ Avanca um tick e desenha o resultado """
+        self.step(movement, attack)
+        self.render()
+
     def quit_phase(self):
         self.current_phase.background.stop_music()
         self.current_phase = None
\ No newline at end of file
@@ -0,0 +1,74 @@
+import time
+
+
+class FramePipeline:
+    """
+    Sequencia fixa de estagios de um quadro, cada um executado uma unica vez e cronometrado.
+
+    Os estagios sao funcoes sem argumentos, executadas na ordem em que foram dados; `run`
+    pode executar apenas um trecho da sequencia, para que a simulacao (executada uma vez por
+    tick) e o desenho (uma vez por quadro) usem a mesma sequencia.
+
+    Parameters
+    ----------
+    stages : sequence of tuple
+        Pares (nome, funcao), na ordem de execucao.
+
+    Attributes
+    ----------
+    last : dict
+        Duracao, em segundos, da ultima execucao de cada estagio.
+    total : dict
+        Soma das duracoes de cada estagio.
+    runs : dict
+        Quantidade de execucoes de cada estagio.
+    """
+    def __init__(self, stages):
+        self.stages = list(stages)
+        self.names = [name for name, _ in self.stages]
+        if len(set(self.names)) != len(self.names):
+            raise ValueError(f"Estagios repetidos no pipeline: {self.names}")
+        self.last = dict.fromkeys(self.names, 0.0)
+        self.total = dict.fromkeys(self.names, 0.0)
+        self.runs = dict.fromkeys(self.names, 0)
+
+    def run(self, first=None, last=None):
+        """
+        Executa em ordem os estagios de `first` ate `last`, inclusive.
+
+        Parameters
+        ----------
+        first : str, opcional
+            Primeiro estagio. Por padrao, o primeiro da sequencia.
+        last : str, opcional
+            Ultimo estagio. Por padrao, o ultimo da sequencia.
+        """
+        start_index = self.names.index(first) if first is not None else 0
+        stop_index = self.names.index(last) + 1 if last is not None else len(self.names)
+        for name, stage in self.stages[start_index:stop_index]:
+            start = time.perf_counter()
+            stage()
+            elapsed = time.perf_counter() - start
+            self.last[name] = elapsed
+            self.total[name] += elapsed
+            self.runs[name] += 1
+
+    def averages(self):
+        """
+        Retorna a duracao media, em segundos, de cada estagio ja executado.
+        """
+        return {name: self.total[name]/self.runs[name] for name in self.names if self.runs[name]}
+
+    def report(self):
+        """
+        Retorna uma linha por estagio com a duracao media e a quantidade de execucoes.
+        """
+        return '\n'.join(f"{name:<10} {average*1000:8.3f} ms  ({self.runs[name]} execucoes)" for name, average in self.averages().items())
+
+    def reset(self):
+        """
+        Zera as medicoes.
+        """
+        for name in self.names:
+            self.last[name] = self.total[name] = 0.0
+            self.runs[name] = 0
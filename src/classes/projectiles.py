@@ -0,0 +1,334 @@
+import weakref
+import numpy as np
+import pygame as pg
+from src.settings import SCREEN_DIMENSIONS, TICK_RATE
+
+
+class Projectile(pg.sprite.Sprite):
+    """
+    Sprite reutilizavel de um projetil, pertencente a um `ProjectilePool`.
+
+    A posicao do projetil fica nos arrays do pool; o sprite so recebe um `rect` atualizado e
+    entra no grupo de visiveis enquanto o projetil esta na tela. `kill` devolve o projetil ao
+    pool em vez de descarta-lo.
+
+    Attributes
+    ----------
+    pool : ProjectilePool
+        O pool dono do projetil.
+    slot : int
+        A linha do projetil nos arrays do pool.
+    damage : float
+        O dano causado ao atingir um personagem.
+    effects : list
+        Os efeitos adicionais da municao.
+    """
+    def __init__(self, pool, slot, image, damage, effects):
+        super().__init__()
+        self.pool = pool
+        self.slot = slot
+        self.image = image
+        self.rect = image.get_rect()
+        self.damage = damage
+        self.effects = effects
+
+    @property
+    def position(self):
+        """
+        Retorna a posicao do projetil no mapa.
+        """
+        return tuple(self.pool.position[self.slot])
+
+    def kill(self):
+        """
+        Remove o projetil de todos os grupos e devolve sua linha ao pool.
+        """
+        self.pool.release(self.slot)
+
+    def update(self, *args, **kwargs):
+        # A posicao e integrada pelo pool, de uma vez para todos os projeteis
+        pass
+
+
+class ProjectilePool:
+    """
+    Projeteis de um tipo de municao, pre-alocados e reciclados.
+
+    Posicoes e direcoes ficam em arrays NumPy; a cada quadro `update` integra e testa os
+    limites do mapa de todos os projeteis ativos com operacoes vetorizadas. Os sprites sao
+    criados uma unica vez e apenas os projeteis dentro da tela sao colocados em `visible`,
+    o grupo usado para desenhar e testar colisoes. Os projeteis fora da tela continuam
+    atingindo personagens: `hidden_hits` os testa no mapa, direto nos arrays.
+
+    Parameters
+    ----------
+    image : pg.Surface
+        Imagem compartilhada por todos os projeteis.
+    damage : float
+        Dano de cada projetil.
+    effects : list
+        Efeitos adicionais da municao.
+    speed : float
+        Velocidade da municao; o deslocamento por tick e `direction*speed*10/TICK_RATE`.
+    map_limits_sup : sequence
+        Largura e altura do mapa. O projetil e descartado quando seu centro deixa de caber
+        inteiro no mapa.
+    visible : pg.sprite.Group, opcional
+        Grupo que recebe os projeteis visiveis. Por padrao, um grupo proprio.
+    capacity : int
+        Quantidade de projeteis pre-alocados. O pool dobra de tamanho quando fica cheio.
+
+    Attributes
+    ----------
+    position : np.ndarray
+        Posicao (x, y) no mapa de cada linha.
+    direction : np.ndarray
+        Direcao de cada linha.
+    active : np.ndarray
+        Linhas com projeteis em voo.
+    sprites : list of Projectile
+        O sprite de cada linha.
+    spawned : int
+        Quantidade de disparos atendidos.
+    """
+    def __init__(self, image, damage, effects, speed, map_limits_sup, visible=None, capacity=32):
+        self.image = image
+        self.damage = damage
+        self.effects = effects
+        self.step = speed*10/TICK_RATE
+        self.half_size = np.array(image.get_size(), dtype=float)/2
+        self.limits_inf = self.half_size.copy()
+        self.limits_sup = np.asarray(map_limits_sup[:2], dtype=float) - self.half_size
+        self.visible = visible if visible is not None else pg.sprite.Group()
+        self.capacity = 0
+        self.position = np.zeros((0, 2))
+        self.direction = np.zeros((0, 2))
+        self.active = np.zeros(0, dtype=bool)
+        self.shown = np.zeros(0, dtype=bool)
+        self.sprites = []
+        self._free = []
+        self.spawned = 0
+        self._grow(capacity)
+
+    @classmethod
+    def from_ammo(cls, ammo, visible=None, capacity=32):
+        """
+        Cria o pool de uma municao `Ammo`, usada apenas como modelo.
+        """
+        # Os limites do centro no EntityStore somados dao o tamanho do mapa
+        map_limits_sup = ammo.store.limits_inf[ammo.row] + ammo.store.limits_sup[ammo.row]
+        return cls(ammo.image, ammo.damage, ammo.effects, ammo.speed, map_limits_sup, visible, capacity)
+
+    def __len__(self):
+        return int(self.active.sum())
+
+    def _grow(self, capacity):
+        """
+        Aumenta os arrays para `capacity` linhas e cria os sprites das linhas novas.
+        """
+        old = self.capacity
+        for field in ('position', 'direction'):
+            array = np.zeros((capacity, 2))
+            array[:old] = getattr(self, field)
+            setattr(self, field, array)
+        for field in ('active', 'shown'):
+            array = np.zeros(capacity, dtype=bool)
+            array[:old] = getattr(self, field)
+            setattr(self, field, array)
+        self.sprites.extend(Projectile(self, slot, self.image, self.damage, self.effects) for slot in range(old, capacity))
+        # Linhas mais baixas saem primeiro da pilha
+        self._free.extend(range(capacity - 1, old - 1, -1))
+        self.capacity = capacity
+
+    def spawn(self, position, direction):
+        """
+        Coloca um projetil em voo.
+
+        Parameters
+        ----------
+        position : sequence
+            Posicao inicial no mapa.
+        direction : sequence
+            Direcao do disparo.
+
+        Returns
+        -------
+        Projectile
+            O sprite do projetil.
+        """
+        if not self._free:
+            self._grow(self.capacity*2)
+        slot = self._free.pop()
+        self.position[slot] = position
+        self.direction[slot] = direction
+        self.active[slot] = True
+        self.spawned += 1
+        return self.sprites[slot]
+
+    def release(self, slot):
+        """
+        Encerra o voo do projetil da linha `slot`, devolvendo-a ao pool.
+        """
+        if self.active[slot]:
+            self.active[slot] = False
+            self.shown[slot] = False
+            pg.sprite.Sprite.kill(self.sprites[slot])
+            self._free.append(slot)
+
+    def update(self, origin, view_size=SCREEN_DIMENSIONS, static_grid=None):
+        """
+        Avanca todos os projeteis, descarta os que sairam do mapa ou atingiram um objeto
+        estatico e atualiza os visiveis.
+
+        Parameters
+        ----------
+        origin : sequence
+            Canto superior esquerdo da camera, em coordenadas do mapa.
+        view_size : sequence
+            Tamanho da camera.
+        static_grid : StaticGrid, opcional
+            Objetos estaticos da fase, que destroem os projeteis que os atingem.
+        """
+        rows = np.flatnonzero(self.active)
+        if not rows.size:
+            return
+        self.position[rows] += self.direction[rows]*self.step
+        position = self.position[rows]
+        out = ((position < self.limits_inf) | (position > self.limits_sup)).any(axis=1)
+        if static_grid is not None:
+            out |= static_grid.hits(position, self.half_size)
+        for slot in rows[out]:
+            self.release(slot)
+        rows = rows[~out]
+
+        screen = self.position[rows] - np.asarray(origin, dtype=float)
+        on_screen = ((screen + self.half_size > 0) & (screen - self.half_size < np.asarray(view_size))).all(axis=1)
+        # So os projeteis na tela tem o rect atualizado; os demais existem apenas nos arrays
+        for slot, center in zip(rows[on_screen], screen[on_screen]):
+            sprite = self.sprites[slot]
+            sprite.rect.center = tuple(center)
+            if not self.shown[slot]:
+                self.visible.add(sprite)
+        for slot in rows[~on_screen & self.shown[rows]]:
+            self.sprites[slot].remove(self.visible)
+        self.shown[rows] = on_screen
+
+    def hidden_hits(self, centers, half_sizes):
+        """
+        Retorna os projeteis em voo fora da tela que se sobrepoem a alguma das caixas dadas.
+
+        Parameters
+        ----------
+        centers : np.ndarray
+            Centro de cada caixa no mapa, formato (m, 2).
+        half_sizes : np.ndarray
+            Metade da largura e da altura de cada caixa, formato (m, 2).
+
+        Returns
+        -------
+        list of tuple
+            Pares (projetil, indice da caixa), na ordem das linhas do pool e das caixas.
+        """
+        rows = np.flatnonzero(self.active & ~self.shown)
+        if not rows.size or not len(centers):
+            return []
+        # Sobreposicao estrita dos retangulos, como `pg.Rect.colliderect`
+        overlap = (np.abs(self.position[rows, None] - centers[None]) < self.half_size + half_sizes[None]).all(axis=2)
+        hit_rows, boxes = np.nonzero(overlap)
+        return [(self.sprites[slot], box) for slot, box in zip(rows[hit_rows].tolist(), boxes.tolist())]
+
+    def interpolate(self, origin, alpha):
+        """
+        Posiciona os projeteis visiveis entre o tick anterior e o atual, para o desenho.
+
+        Parameters
+        ----------
+        origin : sequence
+            Canto superior esquerdo da camera, em coordenadas do mapa.
+        alpha : float
+            Fracao do proximo tick ja decorrida; 1 desenha as posicoes do ultimo tick.
+        """
+        rows = np.flatnonzero(self.shown)
+        screen = self.position[rows] - self.direction[rows]*self.step*(1 - alpha) - np.asarray(origin, dtype=float)
+        for slot, center in zip(rows, screen):
+            self.sprites[slot].rect.center = tuple(center)
+
+    def clear(self):
+        """
+        Encerra o voo de todos os projeteis.
+        """
+        for slot in np.flatnonzero(self.active):
+            self.release(slot)
+
+
+class ProjectilePools:
+    """
+    Pools de projeteis do jogo, um por municao modelo.
+
+    Attributes
+    ----------
+    visible : pg.sprite.Group
+        Projeteis visiveis de todos os pools, usados para desenhar e para as colisoes.
+    """
+    def __init__(self):
+        self.visible = pg.sprite.Group()
+        self._pools = weakref.WeakKeyDictionary()
+
+    def pool(self, ammo):
+        """
+        Retorna o pool da municao `ammo`, criando-o no primeiro uso.
+        """
+        if ammo not in self._pools:
+            self._pools[ammo] = ProjectilePool.from_ammo(ammo, self.visible)
+        return self._pools[ammo]
+
+    def spawn(self, ammo, position, direction):
+        """
+        Dispara um projetil da municao `ammo`.
+
+        Returns
+        -------
+        Projectile
+            O sprite do projetil.
+        """
+        return self.pool(ammo).spawn(position, direction)
+
+    def update(self, origin, view_size=SCREEN_DIMENSIONS, static_grid=None):
+        """
+        Avanca os projeteis de todos os pools.
+        """
+        for pool in list(self._pools.values()):
+            pool.update(origin, view_size, static_grid)
+
+    def hidden_hits(self, centers, half_sizes):
+        """
+        Retorna os projeteis de todos os pools que, fora da tela, atingem alguma das caixas dadas.
+        """
+        hits = []
+        for pool in list(self._pools.values()):
+            hits.extend(pool.hidden_hits(centers, half_sizes))
+        return hits
+
+    def interpolate(self, origin, alpha):
+        """
+        Posiciona os projeteis visiveis de todos os pools entre o tick anterior e o atual.
+        """
+        for pool in list(self._pools.values()):
+            pool.interpolate(origin, alpha)
+
+    def active(self):
+        """
+        Retorna a quantidade de projeteis em voo.
+        """
+        return sum(len(pool) for pool in self._pools.values())
+
+    def clear(self):
+        """
+        Encerra o voo de todos os projeteis, por exemplo ao trocar de fase.
+        """
+        for pool in list(self._pools.values()):
+            pool.clear()
+
+
+# Pools compartilhados pelas armas de todas as fases
+projectile_pools = ProjectilePools()
@@ -1,6 +1,7 @@
 import pygame as pg
 from abc import ABC, abstractmethod
 from src.classes.character import Character
+from src.classes.lod import lod_scheduler, FAR
 
 
 class Protagonist(Character, ABC):
@@ -246,11 +247,15 @@ class Group1Protagonist(Protagonist):
         """
         Atualiza a posição do protagonista com base nas movimentações e aplica a animação correspondente.
 
-        Este método também calcula a nova posição e chama o método de animação do protagonista.
+        Este método também calcula a nova posição e chama o método de animação do protagonista,
+        exceto quando ele está longe da câmera.
         """
-        x_new, y_new = self.position_controller.apply_translation(self.x_position, self.y_position)
-        self.set_position_rect(x_new, y_new)
-        self.animate()
+        self.set_position_rect(*self.screen_position)
+        if lod_scheduler.level(self.row) == FAR:
+            lod_scheduler.record('animation', skipped=1)
+        else:
+            self.animate()
+            lod_scheduler.record('animation', performed=1)
 
 
 class Group2Protagonist(Protagonist):
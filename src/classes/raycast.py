@@ -0,0 +1,122 @@
+import numpy as np
+from src.classes.entities import entity_store
+
+
+def ray_box_distances(origins, directions, boxes):
+    """
+    Distancia de cada raio ate cada retangulo alinhado aos eixos, pelo metodo das faixas (slabs).
+
+    Parameters
+    ----------
+    origins : np.ndarray
+        Origem de cada raio, formato (n, 2).
+    directions : np.ndarray
+        Direcao unitaria de cada raio, formato (n, 2).
+    boxes : np.ndarray
+        Retangulos (x, y, largura, altura), formato (m, 4).
+
+    Returns
+    -------
+    np.ndarray
+        Distancia, ao longo de cada raio, ate a entrada em cada retangulo, formato (n, m);
+        zero se a origem ja esta dentro e infinito se o raio nao o atinge.
+    """
+    origins = np.asarray(origins, dtype=float).reshape(-1, 1, 2)
+    directions = np.asarray(directions, dtype=float).reshape(-1, 1, 2)
+    boxes = np.asarray(boxes, dtype=float).reshape(1, -1, 4)
+    low = boxes[..., :2] - origins
+    high = low + boxes[..., 2:]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inverse = 1/directions
+        first = low*inverse
+        second = high*inverse
+    # Raio paralelo a uma faixa: atravessa toda a faixa se comecar dentro dela, nenhuma parte se nao
+    parallel = directions == 0
+    inside = (low <= 0) & (high >= 0)
+    first = np.where(parallel, np.where(inside, -np.inf, np.inf), first)
+    second = np.where(parallel, np.inf, second)
+    near = np.minimum(first, second).max(axis=-1)
+    far = np.maximum(first, second).min(axis=-1)
+    hit = (near <= far) & (far >= 0)
+    return np.where(hit, np.maximum(near, 0.0), np.inf)
+
+
+class AimRays:
+    """
+    Linhas de tiro de todos os viloes contra o player, calculadas de uma vez a cada tick.
+
+    Cada vilao que mira lanca um raio da sua arma na direcao da mira, com o alcance da arma.
+    O raio acerta o player se chegar ao retangulo dele antes do alcance e antes de qualquer
+    obstaculo. O mesmo resultado decide os disparos e desenha as linhas de mira, sem
+    normalizar as miras de novo. As contas sao feitas em coordenadas do mapa.
+
+    Parameters
+    ----------
+    store : EntityStore
+        O armazenamento das entidades.
+
+    Attributes
+    ----------
+    villains : list
+        Viloes do ultimo `cast`, na ordem dos arrays.
+    aiming : np.ndarray
+        Mascara dos viloes com mira diferente de zero.
+    directions : np.ndarray
+        Direcao unitaria da mira de cada vilao; zero para quem nao mira.
+    distances : np.ndarray
+        Distancia da arma de cada vilao ate o player ao longo da mira; infinito se o raio nao o atinge.
+    reach : np.ndarray
+        Comprimento de cada linha de mira: o alcance da arma, encurtado pelo primeiro obstaculo.
+    hits : np.ndarray
+        Mascara dos viloes com o player na linha de tiro.
+    """
+    def __init__(self, store=entity_store):
+        self.store = store
+        self.villains = []
+        self.aiming = np.zeros(0, dtype=bool)
+        self.directions = np.zeros((0, 2))
+        self.distances = np.zeros(0)
+        self.reach = np.zeros(0)
+        self.hits = np.zeros(0, dtype=bool)
+
+    def cast(self, villains, player, occluders=None):
+        """
+        Lanca os raios de mira dos viloes contra o player.
+
+        Parameters
+        ----------
+        villains : sequence of Villain
+            Os viloes.
+        player : Character
+            O alvo dos raios.
+        occluders : np.ndarray, opcional
+            Retangulos (x, y, largura, altura), no mapa, que bloqueiam as linhas de tiro.
+        """
+        self.villains = list(villains)
+        aims = np.array([each_villain.aim for each_villain in self.villains], dtype=float).reshape(-1, 2)
+        norms = np.hypot(aims[:, 0], aims[:, 1])
+        self.aiming = norms > 0
+        self.directions = aims/np.where(self.aiming, norms, 1.0)[:, None]
+        scopes = np.array([each_villain.weapon.scope for each_villain in self.villains], dtype=float)
+        origins = self.store.position[[each_villain.weapon.row for each_villain in self.villains]].reshape(-1, 2)
+
+        self.reach = np.where(self.aiming, scopes, 0.0)
+        if occluders is not None and len(occluders):
+            self.reach = np.minimum(self.reach, ray_box_distances(origins, self.directions, occluders).min(axis=1))
+        size = np.array(player.rect.size, dtype=float)
+        player_box = np.concatenate((self.store.position[player.row] - size/2, size))
+        self.distances = np.where(self.aiming, ray_box_distances(origins, self.directions, player_box)[:, 0], np.inf)
+        self.hits = self.distances <= self.reach
+
+    def shooters(self):
+        """
+        Retorna os viloes com o player na linha de tiro, na ordem dos viloes.
+        """
+        return [self.villains[index] for index in np.flatnonzero(self.hits).tolist()]
+
+    def lines(self):
+        """
+        Retorna, para cada vilao que mira, o vilao, a direcao unitaria e o comprimento da linha de mira.
+        """
+        for index in np.flatnonzero(self.aiming).tolist():
+            yield self.villains[index], self.directions[index], self.reach[index]
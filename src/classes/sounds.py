@@ -0,0 +1,161 @@
+import time
+import pygame as pg
+from src.settings import SOUND_EFFECTS, MUSIC_TRACKS
+from src.classes.assets import normalize_path
+
+
+class SoundBank:
+    """
+    Banco de sons do jogo, identificados por nome logico.
+
+    Efeitos curtos sao decodificados para PCM apenas no primeiro uso e ficam em cache.
+    Musicas longas nunca sao decodificadas por inteiro: sao tocadas em streaming por
+    `pg.mixer.music`. Sons cujo arquivo nao pode ser carregado sao avisados uma unica vez
+    e passam a ser ignorados, sem interromper o jogo.
+
+    Parameters
+    ----------
+    effects : dict
+        Caminho de cada efeito, por nome.
+    music : dict
+        Caminho de cada musica, por nome.
+
+    Attributes
+    ----------
+    decode_time : float
+        Tempo total gasto decodificando efeitos, em segundos.
+    """
+    def __init__(self, effects=None, music=None):
+        self.effects = dict(effects or {})
+        self.music = dict(music or {})
+        self.decode_time = 0
+        self._sounds = {}
+        self._missing = set()
+        self.current_music = None
+
+    def get(self, name):
+        """
+        Retorna o efeito `name`, decodificando-o no primeiro uso.
+
+        Parameters
+        ----------
+        name : str
+            Nome logico do efeito.
+
+        Returns
+        -------
+        pg.mixer.Sound ou None
+            O efeito, ou None se o arquivo nao pode ser carregado.
+        """
+        if name in self._sounds:
+            return self._sounds[name]
+        if name in self._missing:
+            return None
+        start = time.perf_counter()
+        try:
+            sound = pg.mixer.Sound(normalize_path(self.effects[name]))
+        except (pg.error, FileNotFoundError) as error:
+            print(f"Erro ao carregar o som '{name}': {error}")
+            self._missing.add(name)
+            return None
+        self.decode_time += time.perf_counter() - start
+        self._sounds[name] = sound
+        return sound
+
+    def play(self, name, loops=0):
+        """
+        Toca o efeito `name`.
+
+        Returns
+        -------
+        pg.mixer.Channel ou None
+            Canal usado, ou None se o efeito nao estiver disponivel.
+        """
+        sound = self.get(name)
+        if sound is None:
+            return None
+        return sound.play(loops)
+
+    def stop(self, name):
+        """
+        Interrompe o efeito `name` em todos os canais, se ele ja tiver sido carregado.
+        """
+        if name in self._sounds:
+            self._sounds[name].stop()
+
+    def is_playing(self, name):
+        """
+        Verifica se o efeito `name` esta tocando em algum canal.
+        """
+        return name in self._sounds and self._sounds[name].get_num_channels() > 0
+
+    def play_music(self, name, loops=-1, volume=None):
+        """
+        Toca em streaming a musica `name` (nome registrado ou caminho do arquivo).
+
+        Parameters
+        ----------
+        name : str
+            Nome logico ou caminho da musica.
+        loops : int
+            Repeticoes, -1 para tocar indefinidamente.
+        volume : float, opcional
+            Volume entre 0 e 1.
+        """
+        path = normalize_path(self.music.get(name, name))
+        try:
+            pg.mixer.music.load(path)
+        except (pg.error, FileNotFoundError) as error:
+            print(f"Erro ao carregar a musica '{name}': {error}")
+            return
+        if volume is not None:
+            pg.mixer.music.set_volume(volume)
+        pg.mixer.music.play(loops)
+        self.current_music = name
+
+    def stop_music(self):
+        """
+        Interrompe a musica em streaming.
+        """
+        pg.mixer.music.stop()
+        self.current_music = None
+
+    def release(self, name):
+        """
+        Descarta o PCM decodificado do efeito `name`.
+        """
+        sound = self._sounds.pop(name, None)
+        if sound is not None:
+            sound.stop()
+
+    def memory(self):
+        """
+        Retorna a quantidade de bytes de PCM mantidos pelos efeitos decodificados.
+        """
+        mixer = pg.mixer.get_init()
+        if mixer is None:
+            return 0
+        frequency, size, channels = mixer
+        bytes_per_second = frequency*channels*abs(size)//8
+        return int(sum(sound.get_length()*bytes_per_second for sound in self._sounds.values()))
+
+    def stats(self):
+        """
+        Retorna as estatisticas do banco de sons.
+
+        Returns
+        -------
+        dict
+            Efeitos decodificados, bytes de PCM em memoria, tempo de decodificacao em ms
+            e efeitos que nao puderam ser carregados.
+        """
+        return {
+            'decoded': len(self._sounds),
+            'bytes': self.memory(),
+            'decode_ms': self.decode_time*1000,
+            'missing': sorted(self._missing),
+        }
+
+
+# Banco compartilhado pelo menu e pelas fases
+sound_bank = SoundBank(SOUND_EFFECTS, MUSIC_TRACKS)
@@ -0,0 +1,292 @@
+import math
+from collections import defaultdict
+import numpy as np
+import pygame as pg
+
+
+class SpatialHash:
+    """
+    Grade uniforme de celulas, em coordenadas do mapa, que indexa sprites pelo seu `rect`.
+
+    Substitui os testes de todos contra todos de `pg.sprite.groupcollide`: cada sprite so e
+    comparado com os sprites que ocupam as mesmas celulas. Os `rect` dos sprites estao no
+    sistema de coordenadas da tela, entao a origem da camera e somada para que objetos
+    parados continuem nas mesmas celulas quando a camera se move e `sync` nao precise
+    move-los. Os resultados de `collide` e `groupcollide` saem na mesma ordem das funcoes
+    equivalentes do pygame.
+
+    Parameters
+    ----------
+    cell_size : int
+        Lado de cada celula, em pixels. Deve ser da ordem do tamanho dos sprites.
+
+    Attributes
+    ----------
+    cells : dict
+        Sprites de cada celula (coluna, linha).
+    """
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.cells = defaultdict(set)
+        self.origin = (0, 0)
+        self._cells_of = {}
+
+    def __len__(self):
+        return len(self._cells_of)
+
+    def __contains__(self, sprite):
+        return sprite in self._cells_of
+
+    def cells_for(self, rect):
+        """
+        Retorna as celulas cobertas por um retangulo em coordenadas da tela.
+
+        Returns
+        -------
+        tuple
+            As celulas (coluna, linha) cobertas pelo retangulo.
+        """
+        x = rect.x + self.origin[0]
+        y = rect.y + self.origin[1]
+        first_column = math.floor(x/self.cell_size)
+        last_column = math.floor((x + rect.width)/self.cell_size)
+        first_row = math.floor(y/self.cell_size)
+        last_row = math.floor((y + rect.height)/self.cell_size)
+        return tuple((column, row) for column in range(first_column, last_column + 1) for row in range(first_row, last_row + 1))
+
+    def insert(self, sprite):
+        """
+        Indexa um sprite, ou atualiza suas celulas se ele ja estiver indexado.
+        """
+        cells = self.cells_for(sprite.rect)
+        old_cells = self._cells_of.get(sprite)
+        if cells == old_cells:
+            return
+        if old_cells is not None:
+            self._discard(sprite, old_cells)
+        for cell in cells:
+            self.cells[cell].add(sprite)
+        self._cells_of[sprite] = cells
+
+    def remove(self, sprite):
+        """
+        Retira um sprite do indice.
+        """
+        cells = self._cells_of.pop(sprite, None)
+        if cells is not None:
+            self._discard(sprite, cells)
+
+    def _discard(self, sprite, cells):
+        for cell in cells:
+            members = self.cells[cell]
+            members.discard(sprite)
+            if not members:
+                del self.cells[cell]
+
+    def sync(self, sprites, origin=(0, 0)):
+        """
+        Atualiza o indice para conter exatamente `sprites`, nas posicoes atuais.
+
+        So os sprites que mudaram de celula sao movidos.
+
+        Parameters
+        ----------
+        sprites : iterable
+            Todos os sprites que devem estar no indice.
+        origin : sequence
+            Canto superior esquerdo da camera, em coordenadas do mapa.
+        """
+        self.origin = (origin[0], origin[1])
+        current = set(sprites)
+        for sprite in [sprite for sprite in self._cells_of if sprite not in current]:
+            self.remove(sprite)
+        for sprite in current:
+            self.insert(sprite)
+
+    def clear(self):
+        """
+        Esvazia o indice.
+        """
+        self.cells.clear()
+        self._cells_of.clear()
+
+    def candidates(self, rect):
+        """
+        Retorna os sprites indexados nas celulas cobertas pelo retangulo.
+        """
+        found = set()
+        for cell in self.cells_for(rect):
+            members = self.cells.get(cell)
+            if members:
+                found.update(members)
+        return found
+
+    def collide(self, sprite, group, order=None):
+        """
+        Equivalente a `pg.sprite.spritecollide(sprite, group, False)` sobre os sprites indexados.
+
+        Parameters
+        ----------
+        sprite : pg.sprite.Sprite
+            Sprite testado.
+        group : iterable
+            Sprites com os quais `sprite` pode colidir.
+        order : dict, opcional
+            Posicao de cada sprite de `group` na iteracao do grupo. Calculada se omitida.
+
+        Returns
+        -------
+        list
+            Os sprites de `group` que colidem com `sprite`, na ordem do grupo.
+        """
+        if order is None:
+            order = {member: index for index, member in enumerate(group)}
+        rect = sprite.rect
+        hits = [other for other in self.candidates(rect) if other in order and rect.colliderect(other.rect)]
+        if len(hits) > 1:
+            hits.sort(key=order.__getitem__)
+        return hits
+
+    def groupcollide(self, group_a, group_b):
+        """
+        Equivalente a `pg.sprite.groupcollide(group_a, group_b, False, False)` sobre os sprites indexados.
+
+        Returns
+        -------
+        dict
+            Para cada sprite de `group_a` com colisoes, a lista dos sprites de `group_b`
+            com que colide, na ordem do grupo.
+        """
+        order = {member: index for index, member in enumerate(group_b)}
+        crashed = {}
+        for sprite in group_a:
+            hits = self.collide(sprite, group_b, order)
+            if hits:
+                crashed[sprite] = hits
+        return crashed
+
+
+class EntityGrid:
+    """
+    Indice espacial das entidades de um `EntityStore`, pela celula do centro de cada uma.
+
+    O indice acompanha o armazenamento por um `RowLog`: cada `sync` recalcula com NumPy
+    apenas as celulas das linhas ocupadas, liberadas, movidas ou redimensionadas desde o
+    anterior, e so as que mudaram de celula sao movidas no indice. Entidades paradas nao
+    custam nada, nem mesmo uma passada pelos arrays. Como cada entidade fica apenas na celula do seu centro, as consultas
+    ampliam o retangulo pela metade do maior lado entre as entidades.
+
+    Parameters
+    ----------
+    store : EntityStore
+        O armazenamento das entidades.
+    cell_size : int
+        Lado de cada celula, em pixels.
+
+    Attributes
+    ----------
+    cells : dict
+        Linhas de cada celula, pela chave `(coluna << 32) + linha` de `cell_key`.
+    keys : np.ndarray
+        Chave da celula de cada linha do armazenamento no ultimo `sync`.
+    moved : int
+        Quantidade de linhas que mudaram de celula no ultimo `sync`.
+    """
+    # Chave das linhas livres, que nao entram no indice
+    NO_CELL = np.iinfo(np.int64).min
+
+    def __init__(self, store, cell_size=256):
+        self.store = store
+        self.cell_size = cell_size
+        self.cells = defaultdict(set)
+        self.keys = np.zeros(0, dtype=np.int64)
+        self.max_half_size = 0
+        self.moved = 0
+        # O primeiro sync indexa todas as linhas ja existentes
+        self.changes = store.watch()
+        self.changes.overflowed = True
+
+    @staticmethod
+    def cell_key(column, row):
+        """
+        Retorna a chave inteira da celula (coluna, linha).
+        """
+        return (column << 32) + row
+
+    def sync(self):
+        """
+        Atualiza o indice com as posicoes atuais das entidades.
+        """
+        used = self.store.used
+        if len(self.keys) < used:
+            self.keys = np.concatenate((self.keys, np.full(used - len(self.keys), self.NO_CELL, dtype=np.int64)))
+        rows = self.changes.drain(used)
+        if not len(rows):
+            self.moved = 0
+            return
+        cells = (self.store.position[rows]//self.cell_size).astype(np.int64)
+        keys = self.cell_key(cells[:, 0], cells[:, 1])
+        keys[~self.store.alive[rows]] = self.NO_CELL
+        changed = np.flatnonzero(keys != self.keys[rows])
+        for row, old_key, new_key in zip(rows[changed].tolist(), self.keys[rows[changed]].tolist(), keys[changed].tolist()):
+            if old_key != self.NO_CELL:
+                members = self.cells[old_key]
+                members.discard(row)
+                if not members:
+                    del self.cells[old_key]
+            if new_key != self.NO_CELL:
+                self.cells[new_key].add(row)
+        self.keys[rows] = keys
+        self.moved = len(changed)
+        # O maior tamanho so cresce: entidades que encolhem ou saem apenas ampliam as consultas
+        self.max_half_size = max(self.max_half_size, float(self.store.size[rows].max())/2)
+
+    def query(self, x, y, width, height):
+        """
+        Retorna as linhas das entidades que podem colidir com um retangulo em coordenadas do mapa.
+
+        O resultado pode conter entidades que apenas estao perto do retangulo; o teste exato
+        fica com quem consulta.
+
+        Returns
+        -------
+        list
+            Linhas candidatas.
+        """
+        margin = self.max_half_size
+        first_column = math.floor((x - margin)/self.cell_size)
+        last_column = math.floor((x + width + margin)/self.cell_size)
+        first_row = math.floor((y - margin)/self.cell_size)
+        last_row = math.floor((y + height + margin)/self.cell_size)
+        rows = []
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                members = self.cells.get(self.cell_key(column, row))
+                if members:
+                    rows.extend(members)
+        return rows
+
+
+class VersionedGroup(pg.sprite.Group):
+    """
+    `pg.sprite.Group` que conta as mudancas de membros.
+
+    Quem guarda dados derivados do grupo compara `version` com o valor da ultima vez para
+    saber se precisa recalcula-los, sem percorrer o grupo.
+
+    Attributes
+    ----------
+    version : int
+        Incrementado a cada sprite adicionado ou removido, inclusive por `Sprite.kill`.
+    """
+    def __init__(self, *sprites):
+        self.version = 0
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        self.version += 1
+        super().add_internal(sprite, layer)
+
+    def remove_internal(self, sprite):
+        self.version += 1
+        super().remove_internal(sprite)
@@ -0,0 +1,254 @@
+"""
+Camada de colisao dos objetos estaticos de uma fase.
+
+Os objetos com `is_static` nunca se movem, entao seus retangulos sao gravados uma unica vez
+em uma grade de ocupacao em coordenadas do mapa. Cada celula guarda o indice do grupo de
+objetos que a ocupam (0 para celula vazia), e as consultas de personagens e projeteis leem
+apenas as celulas cobertas pelo retangulo consultado. A grade de cada fase e guardada ao
+lado do json da fase e so e recalculada quando o json muda.
+"""
+import os
+import math
+import hashlib
+import numpy as np
+from src.classes.assets import normalize_path
+
+# Lado de cada celula da grade, em pixels
+STATIC_CELL_SIZE = 32
+
+
+def static_rects(phase_data):
+    """
+    Retorna os retangulos (x, y, largura, altura), no mapa, dos objetos estaticos de uma fase.
+
+    A ordem e a mesma em que `PhaseManager.start_phase` cria os objetos.
+    """
+    rects = []
+    for each_game_object in phase_data['game_objects'].values():
+        if each_game_object['is_static']:
+            width, height = each_game_object['width'], each_game_object['height']
+            rects.append((each_game_object['x_position'] - width/2, each_game_object['y_position'] - height/2, width, height))
+    return rects
+
+
+def static_grid_path(json_path):
+    """
+    Retorna o caminho da grade de colisao guardada ao lado do json de uma fase.
+    """
+    return os.path.splitext(normalize_path(json_path))[0] + '.static.npz'
+
+
+def load_static_grid(json_path, phase_data, cell_size=STATIC_CELL_SIZE):
+    """
+    Le a grade de colisao de uma fase, calculando-a e gravando-a se o json tiver mudado.
+
+    Parameters
+    ----------
+    json_path : str
+        Caminho do json da fase.
+    phase_data : dict
+        Conteudo do json da fase.
+    cell_size : int
+        Lado de cada celula.
+
+    Returns
+    -------
+    StaticGrid
+        A grade dos objetos estaticos da fase.
+    """
+    with open(normalize_path(json_path), 'rb') as file:
+        signature = hashlib.sha1(file.read()).hexdigest()
+    grid_path = static_grid_path(json_path)
+    try:
+        grid = StaticGrid.load(grid_path)
+        if grid.signature == signature and grid.cell_size == cell_size:
+            return grid
+    except (OSError, KeyError, ValueError):
+        pass
+    map_size = (phase_data['background']['width'], phase_data['background']['height'])
+    grid = StaticGrid(static_rects(phase_data), map_size, cell_size, signature=signature)
+    try:
+        grid.save(grid_path)
+    except OSError as error:
+        # Sem permissao de escrita a grade so nao fica em cache
+        print(f"Erro ao gravar a grade de colisao '{grid_path}': {error}")
+    return grid
+
+
+class StaticGrid:
+    """
+    Grade de ocupacao dos objetos estaticos de uma fase.
+
+    Parameters
+    ----------
+    rects : sequence
+        Retangulo (x, y, largura, altura) de cada objeto, em coordenadas do mapa.
+    map_size : sequence
+        Largura e altura do mapa.
+    cell_size : int
+        Lado de cada celula.
+    signature : str, opcional
+        Identificador do json de origem, usado para validar o cache.
+
+    Attributes
+    ----------
+    rects : np.ndarray
+        Retangulos dos objetos, formato (n, 4).
+    cells : np.ndarray
+        Grupo de cada celula (linha, coluna); 0 para celula vazia e k para `groups[k - 1]`.
+    groups : list of tuple
+        Indices dos objetos que ocupam as celulas de cada grupo.
+    objects : list
+        Sprite de cada objeto, associados por `bind`.
+    """
+    def __init__(self, rects, map_size, cell_size=STATIC_CELL_SIZE, signature=None, cells=None, groups=None):
+        self.rects = np.asarray(rects, dtype=float).reshape(-1, 4)
+        self.map_size = tuple(int(value) for value in map_size)
+        self.cell_size = cell_size
+        self.signature = signature
+        self.columns = math.ceil(self.map_size[0]/cell_size)
+        self.rows = math.ceil(self.map_size[1]/cell_size)
+        if cells is None:
+            cells, groups = self._bake()
+        self.cells = cells
+        self.groups = groups
+        self.objects = [None]*len(self.rects)
+
+    def __len__(self):
+        return len(self.rects)
+
+    def _cell_range(self, x, y, width, height):
+        """
+        Retorna os intervalos de colunas e linhas cobertos por um retangulo, limitados ao mapa.
+        """
+        first_column = max(math.floor(x/self.cell_size), 0)
+        last_column = min(math.floor((x + width)/self.cell_size), self.columns - 1)
+        first_row = max(math.floor(y/self.cell_size), 0)
+        last_row = min(math.floor((y + height)/self.cell_size), self.rows - 1)
+        return range(first_column, last_column + 1), range(first_row, last_row + 1)
+
+    def _bake(self):
+        """
+        Marca na grade as celulas cobertas por cada objeto.
+        """
+        cells = np.zeros((self.rows, self.columns), dtype=np.int32)
+        groups = []
+        group_ids = {}
+        for index, rect in enumerate(self.rects):
+            columns, rows = self._cell_range(*rect)
+            for row in rows:
+                for column in columns:
+                    current = cells[row, column]
+                    members = (groups[current - 1] if current else ()) + (index,)
+                    if members not in group_ids:
+                        groups.append(members)
+                        group_ids[members] = len(groups)
+                    cells[row, column] = group_ids[members]
+        return cells, groups
+
+    def save(self, path):
+        """
+        Grava a grade em um arquivo .npz.
+        """
+        flat = np.array([index for group in self.groups for index in group], dtype=np.int32)
+        offsets = np.cumsum([0] + [len(group) for group in self.groups]).astype(np.int32)
+        # Grava em um arquivo temporario para nunca deixar um cache pela metade
+        temporary_path = path + '.tmp.npz'
+        np.savez(temporary_path, rects=self.rects, map_size=np.array(self.map_size), cell_size=np.array(self.cell_size),
+                 signature=np.array(self.signature or ''), cells=self.cells, group_members=flat, group_offsets=offsets)
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Le uma grade gravada por `save`.
+        """
+        with np.load(path) as data:
+            offsets = data['group_offsets']
+            members = data['group_members']
+            groups = [tuple(int(index) for index in members[start:end]) for start, end in zip(offsets[:-1], offsets[1:])]
+            return cls(data['rects'], data['map_size'], int(data['cell_size']), str(data['signature']) or None, data['cells'], groups)
+
+    def bind(self, objects):
+        """
+        Associa os sprites aos retangulos, na mesma ordem.
+        """
+        objects = list(objects)
+        if len(objects) != len(self.rects):
+            raise ValueError(f"A grade tem {len(self.rects)} objetos estaticos, mas {len(objects)} foram dados")
+        self.objects = objects
+
+    def query(self, x, y, width, height):
+        """
+        Retorna os indices dos objetos que colidem com um retangulo em coordenadas do mapa.
+
+        A colisao segue `pg.Rect.colliderect`: retangulos que apenas se tocam nao colidem.
+
+        Returns
+        -------
+        list
+            Indices dos objetos, em ordem crescente.
+        """
+        if width <= 0 or height <= 0:
+            return []
+        columns, rows = self._cell_range(x, y, width, height)
+        found = set()
+        for group_id in np.unique(self.cells[rows.start:rows.stop, columns.start:columns.stop]):
+            if group_id:
+                found.update(self.groups[group_id - 1])
+        hits = []
+        for index in sorted(found):
+            other_x, other_y, other_width, other_height = self.rects[index]
+            if x < other_x + other_width and x + width > other_x and y < other_y + other_height and y + height > other_y:
+                hits.append(index)
+        return hits
+
+    def collide(self, rect, origin=(0, 0)):
+        """
+        Retorna os sprites estaticos que colidem com um retangulo em coordenadas da tela.
+
+        Parameters
+        ----------
+        rect : pg.Rect
+            Retangulo consultado, na tela.
+        origin : sequence
+            Canto superior esquerdo da camera, em coordenadas do mapa.
+        """
+        return [self.objects[index] for index in self.query(rect.x + origin[0], rect.y + origin[1], rect.width, rect.height)]
+
+    def hits(self, centers, half_size):
+        """
+        Verifica, para varios retangulos de mesmo tamanho, quais colidem com algum objeto.
+
+        As celulas sao lidas de uma vez para todos os retangulos; o teste exato so e feito
+        para os poucos que caem em celulas ocupadas.
+
+        Parameters
+        ----------
+        centers : np.ndarray
+            Centros dos retangulos no mapa, formato (n, 2).
+        half_size : sequence
+            Metade da largura e da altura dos retangulos.
+
+        Returns
+        -------
+        np.ndarray
+            Mascara booleana dos retangulos que colidem.
+        """
+        centers = np.asarray(centers, dtype=float).reshape(-1, 2)
+        hit = np.zeros(len(centers), dtype=bool)
+        if not len(centers) or not len(self.rects):
+            return hit
+        half_size = np.asarray(half_size, dtype=float)
+        # Pontos de amostra espacados de no maximo uma celula cobrem todas as celulas do retangulo
+        samples = np.ceil(2*half_size/self.cell_size).astype(int) + 1
+        offsets = np.stack(np.meshgrid(np.linspace(-half_size[0], half_size[0], samples[0]),
+                                       np.linspace(-half_size[1], half_size[1], samples[1])), axis=-1).reshape(-1, 2)
+        points = centers[:, None, :] + offsets[None, :, :]
+        columns = np.clip((points[..., 0]//self.cell_size).astype(int), 0, self.columns - 1)
+        rows = np.clip((points[..., 1]//self.cell_size).astype(int), 0, self.rows - 1)
+        candidates = np.flatnonzero(self.cells[rows, columns].any(axis=1))
+        for index in candidates:
+            corner = centers[index] - half_size
+            hit[index] = bool(self.query(corner[0], corner[1], 2*half_size[0], 2*half_size[1]))
+        return hit
@@ -0,0 +1,228 @@
+"""
+Fundo de fase dividido em blocos (tiles) de tamanho fixo.
+
+O mapa e redimensionado uma unica vez, cortado em tiles e gravado em um arquivo indexado no
+mesmo formato do pacote de assets (`src.classes.assetpack`). Durante o jogo apenas os tiles
+que cobrem a camera, mais uma margem, ficam carregados; os demais sao lidos do arquivo
+mapeado em memoria quando a camera se aproxima e descartados quando ela se afasta.
+"""
+import os
+import math
+import pygame as pg
+from src.settings import TILE_DIRECTORY
+from src.classes.assets import normalize_path, convert_for_display
+from src.classes.assetpack import AssetPack, write_blocks, source_signature
+
+
+def tile_file_path(sprite, width, height, tile_size):
+    """
+    Retorna o caminho do arquivo de tiles de uma imagem de fundo em um tamanho de mapa.
+
+    Parameters
+    ----------
+    sprite : str
+        Caminho da imagem de fundo.
+    width, height : int
+        Tamanho do mapa.
+    tile_size : int
+        Lado de cada tile, em pixels.
+
+    Returns
+    -------
+    str
+        Caminho do arquivo, dentro de `TILE_DIRECTORY`.
+    """
+    name = os.path.splitext(os.path.basename(normalize_path(sprite)))[0]
+    return os.path.join(TILE_DIRECTORY, f'{name}_{width}x{height}_{tile_size}.tiles')
+
+
+def tile_meta(sprite, width, height, tile_size):
+    """
+    Retorna as informacoes que identificam um arquivo de tiles valido.
+    """
+    return {
+        'sprite': normalize_path(sprite).replace(os.sep, '/'),
+        'source': source_signature(normalize_path(sprite)),
+        'map_size': [width, height],
+        'tile_size': tile_size,
+    }
+
+
+def build_tiles(sprite, width, height, tile_size, tile_path=None):
+    """
+    Redimensiona a imagem de fundo para o tamanho do mapa e grava seus tiles.
+
+    A imagem inteira so existe em memoria durante a geracao do arquivo.
+
+    Parameters
+    ----------
+    sprite : str
+        Caminho da imagem de fundo.
+    width, height : int
+        Tamanho do mapa.
+    tile_size : int
+        Lado de cada tile, em pixels.
+    tile_path : str, opcional
+        Caminho do arquivo gerado. Por padrao usa `tile_file_path`.
+
+    Returns
+    -------
+    str
+        Caminho do arquivo gerado.
+    """
+    tile_path = tile_path or tile_file_path(sprite, width, height, tile_size)
+    os.makedirs(os.path.dirname(tile_path) or '.', exist_ok=True)
+    surface = pg.image.load(normalize_path(sprite))
+    if surface.get_size() != (width, height):
+        surface = pg.transform.scale(surface, (width, height))
+
+    def blocks():
+        for row in range(math.ceil(height/tile_size)):
+            for column in range(math.ceil(width/tile_size)):
+                rect = pg.Rect(column*tile_size, row*tile_size, tile_size, tile_size).clip(surface.get_rect())
+                yield f'{column},{row}', surface.subsurface(rect), None
+
+    write_blocks(blocks(), tile_path, tile_meta(sprite, width, height, tile_size))
+    return tile_path
+
+
+def ensure_tiles(sprite, width, height, tile_size, tile_path=None):
+    """
+    Abre o arquivo de tiles de um fundo, gerando-o antes se nao existir ou estiver desatualizado.
+
+    Parameters
+    ----------
+    sprite : str
+        Caminho da imagem de fundo.
+    width, height : int
+        Tamanho do mapa.
+    tile_size : int
+        Lado de cada tile, em pixels.
+    tile_path : str, opcional
+        Caminho do arquivo de tiles. Por padrao usa `tile_file_path`.
+
+    Returns
+    -------
+    AssetPack
+        O arquivo de tiles aberto.
+    """
+    tile_path = tile_path or tile_file_path(sprite, width, height, tile_size)
+    expected = tile_meta(sprite, width, height, tile_size)
+    try:
+        pack = AssetPack(tile_path)
+    except (OSError, ValueError):
+        pack = None
+    if pack is not None:
+        meta = dict(pack.meta)
+        # Sem a imagem original o arquivo de tiles e a unica fonte disponivel
+        if expected['source'] is None:
+            meta['source'] = None
+        if meta == expected:
+            return pack
+        pack.close()
+    build_tiles(sprite, width, height, tile_size, tile_path)
+    return AssetPack(tile_path)
+
+
+class TileMap:
+    """
+    Conjunto de tiles de um fundo, com apenas os tiles proximos da camera residentes.
+
+    Parameters
+    ----------
+    sprite : str
+        Caminho da imagem de fundo.
+    width, height : int
+        Tamanho do mapa.
+    tile_size : int
+        Lado de cada tile, em pixels.
+    margin : int
+        Quantidade de tiles carregados alem da borda da camera, em cada direcao.
+    tile_path : str, opcional
+        Caminho do arquivo de tiles. Se nao existir ou estiver desatualizado, e gerado.
+    pack : AssetPack, opcional
+        Arquivo de tiles ja aberto, como o gerado pelo `PhasePreloader` fora do thread
+        principal. Sem ele o arquivo e aberto aqui e, so se preciso, gerado na hora.
+
+    Attributes
+    ----------
+    columns, rows : int
+        Quantidade de tiles em cada direcao.
+    resident : dict
+        Tiles carregados, por (coluna, linha).
+    loads : int
+        Quantidade de tiles lidos do arquivo.
+    evictions : int
+        Quantidade de tiles descartados por terem saido da area da camera.
+    """
+    def __init__(self, sprite, width, height, tile_size, margin=1, tile_path=None, pack=None):
+        self.sprite = sprite
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.margin = margin
+        self.columns = math.ceil(width/tile_size)
+        self.rows = math.ceil(height/tile_size)
+        self.tile_path = tile_path or tile_file_path(sprite, width, height, tile_size)
+        self.pack = pack if pack is not None else ensure_tiles(sprite, width, height, tile_size, self.tile_path)
+        self.resident = {}
+        self.loads = 0
+        self.evictions = 0
+
+    def tile_range(self, x, y, view_width, view_height, margin=0):
+        """
+        Retorna os intervalos de colunas e linhas que cobrem a area, acrescidos de `margin` tiles.
+
+        Returns
+        -------
+        tuple
+            (range de colunas, range de linhas), limitados ao mapa.
+        """
+        first_column = max(int(x)//self.tile_size - margin, 0)
+        first_row = max(int(y)//self.tile_size - margin, 0)
+        last_column = min((int(x) + view_width - 1)//self.tile_size + margin, self.columns - 1)
+        last_row = min((int(y) + view_height - 1)//self.tile_size + margin, self.rows - 1)
+        return range(first_column, last_column + 1), range(first_row, last_row + 1)
+
+    def page(self, x, y, view_width, view_height):
+        """
+        Carrega os tiles proximos da camera e descarta os que ficaram longe.
+
+        Parameters
+        ----------
+        x, y : float
+            Canto superior esquerdo da camera, em coordenadas do mapa.
+        view_width, view_height : int
+            Tamanho da camera.
+        """
+        columns, rows = self.tile_range(x, y, view_width, view_height, self.margin)
+        for tile in list(self.resident):
+            if tile[0] not in columns or tile[1] not in rows:
+                del self.resident[tile]
+                self.evictions += 1
+        for row in rows:
+            for column in columns:
+                if (column, row) not in self.resident:
+                    surface, _ = convert_for_display(self.pack.block(f'{column},{row}'))
+                    self.resident[(column, row)] = surface
+                    self.loads += 1
+
+    def draw(self, screen, x, y, view_width, view_height):
+        """
+        Desenha na tela os tiles visiveis pela camera.
+
+        Parameters
+        ----------
+        screen : pg.Surface
+            Superficie de destino.
+        x, y : float
+            Canto superior esquerdo da camera, em coordenadas do mapa.
+        view_width, view_height : int
+            Tamanho da camera.
+        """
+        columns, rows = self.tile_range(x, y, view_width, view_height)
+        for row in rows:
+            for column in columns:
+                tile = self.resident.get((column, row))
+                if tile is not None:
+                    screen.blit(tile, (column*self.tile_size - int(x), row*self.tile_size - int(y)))
@@ -0,0 +1,79 @@
+import time
+from src.settings import TICK_RATE, MAX_FRAME_TIME
+
+
+class FixedTimestep:
+    """
+    Relogio da simulacao em ticks de duracao fixa, desacoplado dos quadros desenhados.
+
+    O tempo real decorrido entre os quadros e somado a um acumulador, que e consumido em
+    ticks de `1/tick_rate` segundos; a fracao que sobra (`alpha`) e usada pelo desenho para
+    interpolar as posicoes entre o penultimo e o ultimo tick. Assim o jogo anda na mesma
+    velocidade em qualquer taxa de quadros. Intervalos maiores que `max_frame_time` (uma
+    maquina lenta, a janela arrastada) sao limitados, para a simulacao nao acumular ticks
+    sem fim; pausas do jogo devem chamar `reset`.
+
+    Parameters
+    ----------
+    tick_rate : int
+        Ticks da simulacao por segundo.
+    max_frame_time : float
+        Maior intervalo, em segundos, considerado entre dois quadros.
+
+    Attributes
+    ----------
+    tick : float
+        Duracao de um tick, em segundos.
+    accumulator : float
+        Tempo real ainda nao simulado, sempre menor que um tick depois de `advance`.
+    ticks : int
+        Quantidade de ticks simulados desde a criacao do relogio.
+    """
+    def __init__(self, tick_rate=TICK_RATE, max_frame_time=MAX_FRAME_TIME):
+        self.tick_rate = tick_rate
+        self.tick = 1/tick_rate
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+        self.ticks = 0
+        self._last_time = None
+
+    @property
+    def alpha(self):
+        """
+        Fracao do proximo tick ja decorrida, entre 0 e 1, usada para interpolar o desenho.
+        """
+        return min(max(self.accumulator/self.tick, 0.0), 1.0)
+
+    def advance(self, now=None):
+        """
+        Soma o tempo real decorrido desde a ultima chamada e retorna quantos ticks simular.
+
+        Parameters
+        ----------
+        now : float, opcional
+            Instante atual em segundos. Por padrao, `time.perf_counter()`.
+
+        Returns
+        -------
+        int
+            Quantidade de ticks a simular neste quadro (pode ser zero).
+        """
+        if now is None:
+            now = time.perf_counter()
+        if self._last_time is not None:
+            self.accumulator += min(now - self._last_time, self.max_frame_time)
+        self._last_time = now
+        ticks = 0
+        # A tolerancia evita que erros de arredondamento adiem um tick para o quadro seguinte
+        while self.accumulator >= self.tick - 1e-9:
+            self.accumulator -= self.tick
+            ticks += 1
+        self.ticks += ticks
+        return ticks
+
+    def reset(self):
+        """
+        Descarta o tempo acumulado; o proximo `advance` comeca a contar a partir dele mesmo.
+        """
+        self.accumulator = 0.0
+        self._last_time = None
@@ -1,6 +1,7 @@
 import pygame as pg
 from src.classes.character import Character
 from src.classes.gameobjects import Ammo
+from src.classes.memory import RingMemory
 from src.settings import FRAME_RATE
 import numpy as np
 
@@ -12,7 +13,7 @@ class Villain(Character):
 
     Atributos:
         life (int): Quantidade de vida do vilão.
-        memories (list): Lista de memórias de posições anteriores do vilão.
+        memories (RingMemory): Memórias de posições do jogador, da mais antiga para a mais recente.
         mem_size (int): Tamanho máximo da memória do vilão.
         vision_field (pygame.Rect): Área de visão do vilão no mapa.
         scooby_snacks (GameObject): Referência ao objeto "Scooby Snacks", que o vilão persegue.
@@ -26,7 +27,7 @@ class Villain(Character):
         define_direction: Define a direção do vilão com base nas memórias ou no alvo (scooby_snacks).
         set_position_rect_vision: Define a posição do campo de visão do vilão.
         memories_append: Adiciona uma nova memória à lista de memórias do vilão.
-        memories_remove: Remove a primeira memória da lista de memórias do vilão.
+        memories_remove: Remove a memória mais antiga do vilão.
     """
     def __init__(self, name, speed, perception, x_position, y_position, width, height, direction, skin,
                  life, sprites_quantity, map_limits_sup, bullets, weapon, mem_size, vision_field, background, scooby_snacks):
@@ -55,7 +56,7 @@ class Villain(Character):
         """
         super().__init__(name, speed, perception, x_position, y_position, width, height, direction, skin, life, sprites_quantity, map_limits_sup, bullets, weapon)
         self._life = life
-        self._memories = []
+        self._memories = RingMemory(mem_size)
         self._mem_size = mem_size
         self._vision_field = pg.Rect(x_position - vision_field, y_position - vision_field, 2*vision_field, 2*vision_field)
         self.scooby_snacks = scooby_snacks
@@ -84,10 +85,10 @@ class Villain(Character):
     @property
     def memories(self):
         """
-        Obtém a lista de memórias do vilão.
+        Obtém as memórias do vilão.
 
         Retorno:
-            list: Lista contendo as memórias de posições do vilão.
+            RingMemory: As memórias de posições, indexáveis e iteráveis da mais antiga para a mais recente.
         """
         return self._memories
 
@@ -110,6 +111,7 @@ class Villain(Character):
             value (int): Novo tamanho máximo da memória.
         """
         self._mem_size = value
+        self._memories.resize(value)
 
     @property
     def range(self):
@@ -163,21 +165,19 @@ class Villain(Character):
     
     def memories_append(self, memory):
         """
-        Adiciona uma nova memória à lista de memórias do vilão. Se a memória exceder o tamanho máximo, remove a mais antiga.
+        Adiciona uma nova memória às memórias do vilão. Se a memória exceder o tamanho máximo, remove a mais antiga.
 
         Parâmetros:
             memory (tuple): Memória representada por uma tupla (x, y) da posição do vilão.
         """
+        # Buffer circular: a mais antiga e sobrescrita em O(1)
         self._memories.append(memory)
-        if len(self._memories) > self.mem_size:
-            self._memories.pop(0)
     
     def memories_remove(self):
         """
-        Remove a primeira memória da lista de memórias do vilão, se houver memórias armazenadas.
+        Remove a memória mais antiga do vilão, se houver memórias armazenadas.
         """
-        if len(self._memories) > 0:
-            self._memories.pop(0)
+        self._memories.forget()
             
     def define_direction(self):
         """
@@ -186,17 +186,10 @@ class Villain(Character):
         Retorno:
             numpy.ndarray: Vetor de direção do vilão, normalizado de acordo com a velocidade.
         """
-        valid_memories = [memorie for memorie in self.memories]
         vector = [0, 0]
-        if valid_memories:
-            x_sum = 0
-            y_sum = 0
-            for x, y in valid_memories:
-                x_sum += x
-                y_sum += y
-            x_mean = x_sum/len(valid_memories)
-            y_mean = y_sum/len(valid_memories)
-                
+        if self.memories:
+            # Media das memorias pela soma corrente, sem percorrer a memoria
+            x_mean, y_mean = self.memories.centroid()
             vector = [x_mean - self.x_position, y_mean - self.y_position]
         else:
             vector = [self.scooby_snacks.x_position - self.x_position, self.scooby_snacks.y_position - self.y_position]
@@ -272,7 +265,7 @@ class Villain(Character):
         self.apply_movement(movement)
         self.aim = self.movement
         
-        x_new, y_new = self.position_controller.apply_translation(self.x_position, self.y_position)
+        x_new, y_new = self.screen_position
         self.set_position_rect(x_new, y_new)
         self.set_position_rect_vision(x_new, y_new)
 
@@ -0,0 +1,230 @@
+import numpy as np
+from src.classes.entities import entity_store
+from src.classes.memory import RingMemoryBank
+from src.classes.navigation import FlowField
+from src.classes.lod import FAR
+
+
+class VillainAI:
+    """
+    Percepcao e perseguicao de todos os viloes de uma fase em uma unica passada vetorizada.
+
+    Faz o mesmo que `Villain.update` para cada vilao, mas com os dados de todos em arrays:
+    linhas no `EntityStore`, velocidades, metades do campo de visao e do campo de ataque,
+    alvos e memorias (em um `RingMemoryBank`, que passa a ser a memoria de cada vilao). Os
+    testes de visao e de ataque sao feitos em coordenadas do mapa, com os centros do
+    `EntityStore`; em Python sobra apenas um laco curto por vilao que copia o resultado
+    para o rect, o campo de visao e a animacao.
+
+    Com uma grade de navegacao, os viloes contornam os objetos estaticos seguindo campos de
+    fluxo compartilhados: um para o player, seguido por quem se lembra dele, e um para cada
+    alvo. Quem ja esta na celula do alvo, ou nao tem caminho ate ele, anda em linha reta.
+
+    Com um `LODScheduler`, os viloes longe da camera so percebem e decidem a cada alguns
+    ticks, repetindo o ultimo movimento nos demais, e os mais distantes nao sao animados.
+    O teste de ataque continua sendo feito para todos a cada tick.
+
+    Parameters
+    ----------
+    villains : sequence of Villain
+        Os viloes da fase. Cada um deve ter `weapon` e `scooby_snacks` com linha no
+        armazenamento (`row`); armas e alvos podem ser compartilhados.
+    store : EntityStore
+        O armazenamento das entidades.
+    navigation : NavigationGrid, opcional
+        Grade de navegacao da fase. Sem ela, os viloes andam em linha reta.
+    field_interval : int
+        Menor quantidade de ticks entre dois recalculos de cada campo de fluxo.
+    lod : LODScheduler, opcional
+        Nivel de detalhe da simulacao. Sem ele, todos os viloes decidem a cada tick.
+
+    Attributes
+    ----------
+    rows, weapon_rows, target_rows : np.ndarray
+        Linha de cada vilao, da sua arma e do seu alvo no armazenamento.
+    speeds : np.ndarray
+        Velocidade de cada vilao.
+    vision_half, attack_half : np.ndarray
+        Metade da largura e da altura do campo de visao de cada vilao e do campo de ataque da sua arma.
+    memories : RingMemoryBank
+        Memoria de cada vilao.
+    movements : np.ndarray
+        Ultimo movimento decidido por cada vilao.
+    player_field : FlowField or None
+        Campo de fluxo ate o player.
+    target_fields : dict
+        Campo de fluxo ate cada alvo, pela linha do alvo no armazenamento.
+    """
+    def __init__(self, villains, store=entity_store, navigation=None, field_interval=10, lod=None):
+        self.villains = list(villains)
+        self.store = store
+        self.rows = np.array([villain.row for villain in self.villains], dtype=np.intp)
+        self.weapon_rows = np.array([villain.weapon.row for villain in self.villains], dtype=np.intp)
+        self.target_rows = np.array([villain.scooby_snacks.row for villain in self.villains], dtype=np.intp)
+        self.speeds = np.array([villain.speed for villain in self.villains], dtype=float).reshape(-1, 1)
+        self.vision_half = np.array([villain.vision_field.size for villain in self.villains], dtype=float).reshape(-1, 2)/2
+        self.attack_half = np.array([villain.weapon.attack_field.size for villain in self.villains], dtype=float).reshape(-1, 2)/2
+        self.sprite_rows = np.array([villain.current_sprite_y for villain in self.villains], dtype=np.intp)
+        self.movements = np.zeros((len(self.villains), 2))
+        self.lod = lod
+        self.decided = False
+        # As memorias passam para o banco; cada vilao continua acessando a sua por uma view
+        self.memories = RingMemoryBank.from_memories([villain.memories for villain in self.villains])
+        for index, villain in enumerate(self.villains):
+            villain._memories = self.memories.view(index)
+        self.navigation = navigation
+        self.player_field = None
+        self.target_fields = {}
+        if navigation is not None:
+            self.player_field = FlowField(navigation, field_interval)
+            self.target_fields = {row: FlowField(navigation, field_interval) for row in np.unique(self.target_rows).tolist()}
+
+    def __len__(self):
+        return len(self.villains)
+
+    def perceive(self, player, active):
+        """
+        Atualiza as memorias dos viloes indicados com o player e retorna quais viloes podem ataca-lo.
+
+        Parameters
+        ----------
+        player : Player
+            O jogador perseguido.
+        active : np.ndarray
+            Indices dos viloes que percebem neste tick.
+
+        Returns
+        -------
+        np.ndarray
+            Mascara de todos os viloes cuja arma alcanca o player.
+        """
+        player_position = self.store.position[player.row]
+        player_half = np.array(player.rect.size, dtype=float)/2
+        # Sobreposicao estrita de retangulos, como `pg.Rect.colliderect`
+        seen = (np.abs(self.store.position[self.rows[active]] - player_position) < self.vision_half[active] + player_half).all(axis=1)
+        self.memories.append(active[seen], player_position)
+        self.memories.forget(active[~seen])
+        return (np.abs(self.store.position[self.weapon_rows] - player_position) < self.attack_half + player_half).all(axis=1)
+
+    def plan(self, player):
+        """
+        Atualiza os campos de fluxo com as posicoes atuais do player e dos alvos.
+
+        Cada campo so e recalculado quando o seu alvo muda de celula, entao na maioria dos
+        ticks nada e feito.
+        """
+        if self.player_field is None:
+            return
+        self.player_field.retarget(self.store.position[player.row])
+        for row, field in self.target_fields.items():
+            field.retarget(self.store.position[row])
+
+    def steer(self, active):
+        """
+        Retorna o movimento dos viloes indicados: em direcao a media das memorias ou, sem memorias, ao alvo.
+
+        Equivale a `Villain.define_direction` seguido de `normalize_movement`; com grade de
+        navegacao, a direcao vem do campo de fluxo na celula de cada vilao.
+
+        Parameters
+        ----------
+        active : np.ndarray
+            Indices dos viloes que decidem neste tick.
+
+        Returns
+        -------
+        np.ndarray
+            Movimento (dx, dy) de cada vilao indicado, formato (len(active), 2).
+        """
+        speeds = self.speeds[active]
+        remembered = self.memories.counts[active] > 0
+        targets = np.where(remembered[:, None], self.memories.centroids()[active], self.store.position[self.target_rows[active]])
+        vector = targets - self.store.position[self.rows[active]]
+        # Cada eixo anda a velocidade inteira ou fica parado, e o resultado e normalizado
+        direction = np.where(np.abs(vector) < speeds, 0.0, np.sign(vector)*speeds)
+        if self.player_field is not None:
+            flow = self.follow_fields(active)
+            following = flow.any(axis=1)
+            direction[following] = flow[following]*speeds[following]
+        norms = np.hypot(direction[:, 0], direction[:, 1])
+        return direction*(speeds[:, 0]/np.where(norms > 0, norms, 1.0))[:, None]
+
+    def follow_fields(self, active):
+        """
+        Retorna o passo de cada vilao indicado no campo de fluxo que ele segue; zero para quem deve andar em linha reta.
+        """
+        positions = self.store.position[self.rows[active]]
+        flow = np.zeros_like(positions)
+        remembered = self.memories.counts[active] > 0
+        flow[remembered] = self.player_field.sample(positions[remembered])
+        target_rows = self.target_rows[active]
+        for row, field in self.target_fields.items():
+            chasing = ~remembered & (target_rows == row)
+            flow[chasing] = field.sample(positions[chasing])
+        return flow
+
+    def face(self, movements):
+        """
+        Retorna a linha da spritesheet de cada vilao para os movimentos dados, como `redefine_direction`.
+        """
+        return np.select([movements[:, 0] > 0, movements[:, 0] < 0, movements[:, 1] < 0, movements[:, 1] > 0],
+                         [2, 3, 1, 0], default=self.sprite_rows)
+
+    def carry_weapons(self):
+        """
+        Leva cada arma para a borda do seu vilao voltada para a direcao em que ele anda, como `carry_weapon`.
+        """
+        half = self.store.size[self.rows]/2
+        offsets = np.zeros_like(half)
+        offsets[:, 1] = np.select([self.sprite_rows == 0, self.sprite_rows == 1], [half[:, 1], -half[:, 1]], 0.0)
+        offsets[:, 0] = np.select([self.sprite_rows == 2, self.sprite_rows == 3], [half[:, 0], -half[:, 0]], 0.0)
+        # Uma arma compartilhada fica com o ultimo vilao, como nas atualizacoes individuais
+        self.store.set_position(self.weapon_rows, self.store.position[self.rows] + offsets)
+
+    def update(self, player):
+        """
+        Executa um tick de todos os viloes: percepcao, ataque, movimento, arma e animacao.
+
+        Parameters
+        ----------
+        player : Player
+            O jogador perseguido.
+        """
+        if not self.villains:
+            return
+        active = np.arange(len(self.villains))
+        animated = np.ones(len(self.villains), dtype=bool)
+        if self.lod is not None:
+            levels = self.lod.levels_of(self.rows)
+            # No primeiro tick todos decidem, para ninguem repetir um movimento que nao decidiu
+            if self.decided:
+                active = np.flatnonzero(self.lod.due(levels))
+            animated = levels != FAR
+            self.lod.record('ai', performed=len(active), skipped=len(self.villains) - len(active))
+            self.lod.record('animation', performed=int(animated.sum()), skipped=int((~animated).sum()))
+        self.decided = True
+        for index in np.flatnonzero(self.perceive(player, active)).tolist():
+            self.villains[index].attack(player)
+
+        self.plan(player)
+        # Quem nao decide neste tick repete o ultimo movimento
+        self.movements[active] = self.steer(active)
+        movements = self.movements.copy()
+        self.store.move(self.rows, movements)
+        sprite_rows = self.face(movements)
+        # Sem movimento a linha nao muda, mas a animacao recomeca, como em `redefine_direction`
+        restart = (sprite_rows != self.sprite_rows) | ~movements.any(axis=1)
+        self.sprite_rows = sprite_rows
+        self.carry_weapons()
+
+        screen_positions = self.store.screen_position[self.rows].tolist()
+        for villain, movement, center, sprite_row, restart_animation, animate in zip(self.villains, movements, screen_positions, sprite_rows.tolist(), restart.tolist(), animated.tolist()):
+            villain.movement = movement
+            villain.aim = movement
+            villain.rect.center = center
+            villain.vision_field.center = center
+            villain.current_sprite_y = sprite_row
+            if restart_animation:
+                villain.current_sprite_x = 0
+            if animate:
+                villain.animate()
@@ -1,9 +1,11 @@
 import pygame as pg
 import numpy as np
 from enum import Enum
+from src.classes.fonts import font_registry
 
-pg.init()
-SCREEN_DIMENSIONS = np.array([pg.display.Info().current_w, pg.display.Info().current_h])
+# Tamanho padrao da tela; o boot do jogo (Game.boot) preenche com o tamanho do monitor.
+# O array e alterado no lugar, entao todos os modulos que o importaram veem o novo valor.
+SCREEN_DIMENSIONS = np.array([1280, 720])
 GAME_TITLE = 'SCOOBY DOO'
 
 START_SOUND_MENU =  'audios/abertura_inicial.wav'
@@ -16,25 +18,66 @@ FINAL_SCREEN_MENU= 'assets/menus/final_screen.png'
 FINAL_COLUMNS_MENU = 7
 FINAL_ROWS_MENU = 14
 
+# Efeitos curtos, decodificados no primeiro uso, e musicas tocadas em streaming
+SOUND_EFFECTS = {
+    'typing': 'assets/sounds/som_dialogo.wav',
+    'fgv': 'assets/sounds/frente_fgv.mp3',
+    'laboratorio': 'assets/sounds/laboratorio.wav',
+    'botao_3': 'assets/sounds/botao_cena3.mp3',
+    'start_botao': 'assets/sounds/start.mp3',
+    'damage': 'assets/sounds/dano.wav',
+}
+MUSIC_TRACKS = {
+    'start': START_SOUND_MENU,
+    'final': FINAL_SOUND_MENU,
+}
+
+PAUSE_SCREEN_MENU = 'assets/menus/pause_screen.png'
+PAUSE_SCREEN_SIZE = (850, 600)
+GAME_OVER_SCREEN_MENU = 'assets/menus/selascou_screen.png'
+GAME_OVER_SCREEN_SIZE = (600, 260)
+
 SHAGGY_PROFILE = 'assets/spritesheets/Shaggy_dialogue.png' 
 DAPHNE_PROFILE = 'assets/spritesheets/Dapnhe_dialogue.png'
 SCOOBY_PROFILE = 'assets/spritesheets/Scooby_dialogue.png'
 FRED_PROFILE = 'assets/spritesheets/Fred_dialogue.png'
 VELMA_PROFILE = 'assets/spritesheets/Velma_dialogue.png'
+PROFILE_SIZE = (100, 100)
 
 
 FULL_HEART = 'assets/menus/full heart.png'
 EMPTY_HEART = 'assets/menus/empty heart.png'
 HALF_HEART = 'assets/menus/half heart.png'
+HEART_SIZE = (50, 50)
+
+EVENT_SPRITE = 'assets\\backgrounds\\lua.png'
+
+# Pacote gerado por `python -m src.classes.assetpack`
+ASSET_PACK = 'assets/assets.pack'
+# Arquivos de tiles dos fundos com `tile_size`
+TILE_DIRECTORY = 'assets/tiles'
 
 
 class Fonts(Enum):
-    PLAYER_NAME = pg.font.SysFont('comicsansms', 30, True, False)
-    PLAYER_LIFE = pg.font.SysFont('franklingothicheavy', 25, True, False)
-    EVENT_WARNING = pg.font.SysFont('impact', 50, False, True)
-    EVENT_TIME = pg.font.SysFont('showcardgothic', 25, False, False)
+    # (face, tamanho, negrito, italico); a fonte so e carregada no primeiro uso
+    PLAYER_NAME = ('comicsansms', 30, True, False)
+    PLAYER_LIFE = ('franklingothicheavy', 25, True, False)
+    EVENT_WARNING = ('impact', 50, False, True)
+    EVENT_TIME = ('showcardgothic', 25, False, False)
+
+    @property
+    def font(self):
+        return font_registry.get(*self.value)
     
+# Quadros por segundo das telas do menu e das cutscenes
 FRAME_RATE = 30
+# Ticks da simulacao por segundo: toda a logica do jogo (movimento, recarga, tempo dos
+# minigames, animacoes) avanca em ticks de duracao fixa, independente dos quadros desenhados
+TICK_RATE = 30
+# Limite de quadros desenhados por segundo durante o jogo; as posicoes sao interpoladas
+RENDER_RATE = 60
+# Maior intervalo entre dois quadros considerado pela simulacao, em segundos
+MAX_FRAME_TIME = 0.25
 
 # SAIR = pg.K_ESCAPE
 class WASD_Keys(Enum):
@@ -0,0 +1,5 @@
+import os
+
+# Os testes rodam sem janela e sem placa de som
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
@@ -0,0 +1,78 @@
+import os
+import shutil
+import tempfile
+import unittest
+import pygame as pg
+from src.classes.assets import AssetCache
+from src.classes.assetpack import AssetPack, write_pack, phase_manifest
+from src.settings import VELMA_PROFILE, EVENT_SPRITE
+
+
+class TestAssetPack(unittest.TestCase):
+    def setUp(self):
+        pg.init()
+        self.directory = tempfile.mkdtemp()
+        # Copias locais para poder alterar a origem sem mexer nos assets do jogo
+        self.profile = os.path.join(self.directory, 'profile.png')
+        self.background = os.path.join(self.directory, 'garden.jpg')
+        shutil.copy(VELMA_PROFILE, self.profile)
+        shutil.copy('assets/backgrounds/garden.jpg', self.background)
+        self.pack_path = os.path.join(self.directory, 'assets.pack')
+        self.keys = [AssetCache.make_key(self.profile, (50, 50)), AssetCache.make_key(self.background, (80, 60))]
+        self.missing = write_pack(self.keys + [AssetCache.make_key('assets/nao_existe.png', None)], self.pack_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_missing_sources_are_reported(self):
+        self.assertEqual(len(self.missing), 1)
+        self.assertEqual(len(AssetPack(self.pack_path).entries), 2)
+
+    def test_cache_reads_from_pack(self):
+        cache = AssetCache(pack_path=self.pack_path)
+        loose = AssetCache()
+        for path, size in self.keys:
+            packed = cache.load(path, size)
+            decoded = loose.load(path, size)
+            self.assertEqual(packed.get_size(), size)
+            self.assertEqual(bool(packed.get_flags() & pg.SRCALPHA), bool(decoded.get_flags() & pg.SRCALPHA))
+            self.assertEqual(packed.get_at((10, 10)), decoded.get_at((10, 10)))
+        self.assertEqual(cache.stats()['pack_hits'], 2)
+
+    def test_stale_entry_falls_back_to_file(self):
+        stat = os.stat(self.profile)
+        os.utime(self.profile, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        cache = AssetCache(pack_path=self.pack_path)
+        surface = cache.load(self.profile, (50, 50))
+        self.assertEqual(surface.get_size(), (50, 50))
+        stats = cache.stats()
+        self.assertEqual(stats['pack_hits'], 0)
+        self.assertEqual(stats['pack_stale'], 1)
+
+    def test_invalid_pack_is_ignored(self):
+        with open(self.pack_path, 'wb') as file:
+            file.write(b'nao e um pacote')
+        cache = AssetCache(pack_path=self.pack_path)
+        self.assertEqual(cache.load(self.profile, (50, 50)).get_size(), (50, 50))
+        self.assertIsNone(cache.pack_path)
+
+    def test_phase_manifest_sizes(self):
+        phase_data = {
+            'background': {'sprite': 'assets/backgrounds/garden.jpg', 'width': 4000, 'height': 3000},
+            'player': {'name': 'Scooby', 'skin': 'default', 'width': 95, 'height': 75, 'sprites_quantity': 4},
+            'monsters': [],
+            'ammos': {}, 'weapons': {}, 'collectibles': {}, 'game_objects': {}, 'npcs': {},
+            'scooby_snacks': {'spritesheet': 'assets/collectibles/scooby_snacks.png', 'width': 50, 'height': 50, 'sprites_quantity': 1},
+            'mandatory_events': {},
+            'optional_events': {'opt1': {'start_zone': [0, 0, 50, 25], 'event_zone': [0, 0, 150, 50]}},
+            'dialogs': {'dialog_0': [{'speaker': 'Velma', 'text': 'Jinkies!'}]},
+        }
+        manifest = phase_manifest(phase_data)
+        self.assertIn(('assets\\spritesheets\\Scooby_default.png', (380, 300)), manifest)
+        self.assertIn(('assets/collectibles/scooby_snacks.png', (50, 50)), manifest)
+        self.assertIn((EVENT_SPRITE, (150, 50)), manifest)
+        self.assertIn(('assets/spritesheets/Velma_dialogue.png', (100, 100)), manifest)
+
+
+if __name__ == "__main__":
+    unittest.main()
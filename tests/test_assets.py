@@ -0,0 +1,115 @@
+import gc
+import threading
+import unittest
+import pygame as pg
+from src.classes.assets import AssetCache
+from src.settings import VELMA_PROFILE, SCOOBY_PROFILE, FRED_PROFILE
+
+
+class Owner:
+    """Objeto qualquer que pode ser dono de uma referencia"""
+
+
+class TestAssetCache(unittest.TestCase):
+    def setUp(self):
+        pg.init()
+        self.cache = AssetCache(max_unused=1)
+
+    def test_same_key_shares_surface(self):
+        first = self.cache.load(VELMA_PROFILE, (50, 50))
+        second = self.cache.load(VELMA_PROFILE, (50, 50))
+        self.assertIs(first, second)
+        self.assertEqual(first.get_size(), (50, 50))
+        self.assertEqual(self.cache.stats()['hits'], 1)
+        self.assertEqual(self.cache.stats()['misses'], 1)
+
+    def test_separators_share_entry(self):
+        first = self.cache.load('assets/spritesheets/Velma_dialogue.png', (50, 50))
+        second = self.cache.load('assets\\spritesheets\\Velma_dialogue.png', (50, 50))
+        self.assertIs(first, second)
+
+    def test_sizes_are_distinct_entries(self):
+        small = self.cache.load(VELMA_PROFILE, (50, 50))
+        big = self.cache.load(VELMA_PROFILE, (100, 100))
+        self.assertIsNot(small, big)
+        self.assertEqual(self.cache.stats()['entries'], 2)
+
+    def test_refcount_and_release(self):
+        self.cache.load(VELMA_PROFILE, (50, 50))
+        self.cache.load(VELMA_PROFILE, (50, 50))
+        self.assertEqual(self.cache.refcount(VELMA_PROFILE, (50, 50)), 2)
+        self.cache.release(VELMA_PROFILE, (50, 50))
+        self.assertEqual(self.cache.refcount(VELMA_PROFILE, (50, 50)), 1)
+        self.assertEqual(self.cache.stats()['unused'], 0)
+
+    def test_lru_eviction_keeps_referenced(self):
+        self.cache.load(VELMA_PROFILE)
+        self.cache.load(SCOOBY_PROFILE)
+        self.cache.load(FRED_PROFILE)
+        self.cache.release(VELMA_PROFILE)
+        self.cache.release(SCOOBY_PROFILE)
+        # Apenas uma entrada sem referencias cabe no cache: a mais antiga sai
+        stats = self.cache.stats()
+        self.assertEqual(stats['evictions'], 1)
+        self.assertEqual(stats['entries'], 2)
+        self.cache.load(SCOOBY_PROFILE)
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+    def test_acquire_releases_with_owner(self):
+        owner = Owner()
+        self.cache.acquire(owner, VELMA_PROFILE, (50, 50))
+        self.assertEqual(self.cache.refcount(VELMA_PROFILE, (50, 50)), 1)
+        del owner
+        gc.collect()
+        self.assertEqual(self.cache.refcount(VELMA_PROFILE, (50, 50)), 0)
+        self.assertEqual(self.cache.stats()['unused'], 1)
+
+    def test_frames_table_is_shared(self):
+        self.cache.load('assets/spritesheets/Fred_default.png', (256, 256))
+        frames = self.cache.frames('assets/spritesheets/Fred_default.png', (256, 256), 4, 4)
+        self.assertEqual(len(frames), 4)
+        self.assertEqual(len(frames[0]), 4)
+        self.assertEqual(frames[3][2].get_size(), (64, 64))
+        self.assertIs(frames, self.cache.frames('assets/spritesheets/Fred_default.png', (256, 256), 4, 4))
+
+    def test_drop_releases_owner_reference(self):
+        owner = Owner()
+        self.cache.acquire(owner, VELMA_PROFILE, (50, 50))
+        self.cache.acquire(owner, VELMA_PROFILE, (50, 50))
+        self.assertEqual(self.cache.refcount(VELMA_PROFILE, (50, 50)), 1)
+        self.cache.drop(owner, VELMA_PROFILE, (50, 50))
+        self.assertEqual(self.cache.refcount(VELMA_PROFILE, (50, 50)), 0)
+
+    def test_convert_pending_after_display(self):
+        pg.display.quit()
+        pg.display.init()
+        self.cache.load('assets/backgrounds/garden.jpg', (100, 100))
+        self.cache.load(VELMA_PROFILE, (50, 50))
+        self.assertEqual(self.cache.stats()['pending'], 2)
+        screen = pg.display.set_mode((10, 10))
+        self.assertEqual(self.cache.convert_pending(), 2)
+        background = self.cache.load('assets/backgrounds/garden.jpg', (100, 100))
+        profile = self.cache.load(VELMA_PROFILE, (50, 50))
+        self.assertEqual(background.get_bitsize(), screen.get_bitsize())
+        self.assertFalse(background.get_flags() & pg.SRCALPHA)
+        self.assertTrue(profile.get_flags() & pg.SRCALPHA)
+        pg.display.quit()
+
+    def test_preload_waits_for_main_thread_conversion(self):
+        pg.display.quit()
+        pg.display.init()
+        screen = pg.display.set_mode((10, 10))
+        worker = threading.Thread(target=self.cache.preload, args=('assets/backgrounds/garden.jpg', (100, 100)))
+        worker.start()
+        worker.join()
+        self.assertEqual(self.cache.stats()['pending'], 1)
+        self.assertEqual(self.cache.refcount('assets/backgrounds/garden.jpg', (100, 100)), 1)
+        self.assertEqual(self.cache.convert_pending(), 1)
+        background = self.cache.load('assets/backgrounds/garden.jpg', (100, 100))
+        self.assertEqual(background.get_bitsize(), screen.get_bitsize())
+        self.assertEqual(self.cache.stats()['hits'], 1)
+        pg.display.quit()
+
+
+if __name__ == "__main__":
+    unittest.main()
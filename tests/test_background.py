@@ -1,9 +1,16 @@
 import unittest
+from unittest.mock import Mock, patch
 import pygame as pg
 import numpy as np
-from src.classes.background import Background, PositionController
+from src.classes.background import Background, PositionController, Interface, CollideController
+from src.classes.entities import entity_store
+from src.classes.gameobjects import GameObject
+from src.classes.projectiles import ProjectilePool
 from src.settings import SCREEN_DIMENSIONS, VELMA_PROFILE
 
+MAP = [2000, 2000]
+SPRITE = 'assets\\backgrounds\\shaggy_right_1.png'
+
 
 class TestBackground(unittest.TestCase):
     def setUp(self):
@@ -31,6 +38,14 @@ class TestBackground(unittest.TestCase):
         expected_position = (500 - SCREEN_DIMENSIONS[0] // 2, 400 - SCREEN_DIMENSIONS[1] // 2)
         self.assertEqual(self.bg.get_position(), expected_position)
 
+    def test_draw_at_given_origin(self):
+        self.bg.draw_background_image((10, 20))
+        # O mapa e mais estreito que a tela: so a parte dele vista a partir da origem e desenhada
+        area = pg.Rect(0, 0, 1000 - 10, SCREEN_DIMENSIONS[1])
+        expected = pg.Surface(area.size)
+        expected.blit(self.bg.sprite.subsurface(area.move(10, 20)), (0, 0))
+        self.assertEqual(pg.image.tobytes(self.screen.subsurface(area), 'RGB'), pg.image.tobytes(expected, 'RGB'))
+
 
 class TestPositionController(unittest.TestCase):
     def setUp(self):
@@ -54,5 +69,94 @@ class TestPositionController(unittest.TestCase):
         self.assertEqual(self.controller.apply_translation(x, y), expected)
 
 
+class TestInterface(unittest.TestCase):
+    def setUp(self):
+        pg.init()
+        self.screen = pg.Surface(SCREEN_DIMENSIONS)
+        self.phase = Mock()
+        self.phase.player.name = "Velma"
+        self.phase.player.life = 5
+        self.interface = Interface(self.screen, self.phase, [])
+
+    def test_hud_is_retained_between_frames(self):
+        self.interface.update()
+        self.interface.update()
+        self.assertEqual(self.interface.hud_rebuilds, 1)
+
+    def test_hud_rebuilds_when_hearts_change(self):
+        self.interface.update()
+        self.phase.player.life = 4.995
+        self.interface.update()
+        self.assertEqual(self.interface.hud_rebuilds, 2)
+        # Mesma quantidade de coracoes visiveis, sem refazer a camada
+        self.phase.player.life = 4.99
+        self.interface.update()
+        self.assertEqual(self.interface.hud_rebuilds, 2)
+
+    def test_get_hearts(self):
+        self.assertEqual(self.interface.get_hearts(3.5), ('full', 'full', 'full', 'half', 'empty'))
+
+
+class TestCollideController(unittest.TestCase):
+    def setUp(self):
+        pg.init()
+        entity_store.translate((0, 0))
+        PositionController.set_origin(0, 0)
+        self.player = GameObject(500, 500, 40, 40, MAP, SPRITE, 0, 0, 1, False)
+        self.player.life = 10
+        self.npc = GameObject(520, 500, 40, 40, MAP, SPRITE, 0, 0, 1, False)
+        self.npc.life = 10
+        self.pool = ProjectilePool(pg.Surface((10, 10)), damage=3, effects=[], speed=6, map_limits_sup=MAP)
+        self.controller = self.build([self.npc])
+
+    def build(self, npcs):
+        return CollideController(
+            player=self.player, npcs=pg.sprite.Group(npcs), villains=pg.sprite.Group(), game_objects=pg.sprite.Group(),
+            collectibles=pg.sprite.Group(), ammus=self.pool.visible, mandatory_events=pg.sprite.Group(pg.sprite.Sprite()),
+            optional_events=pg.sprite.Group(), scooby_snacks=None, weapons=pg.sprite.Group(), phase_elements=pg.sprite.Group(),
+            projectiles=self.pool)
+
+    def fire(self, position, view_origin, view_size=(200, 200)):
+        bullet = self.pool.spawn(position, (0, 0))
+        self.pool.update(view_origin, view_size)
+        self.controller.index_elements()
+        self.controller.ammus_collide_with()
+        return bullet
+
+    def test_bullets_off_screen_hit_characters(self):
+        bullet = self.fire((480, 500), (1000, 1000))
+        self.assertNotIn(bullet, self.pool.visible)
+        self.assertEqual((self.player.life, self.npc.life), (7, 10))
+        self.assertEqual(len(self.pool), 0)
+
+    def test_bullets_off_screen_miss_elsewhere(self):
+        self.fire((900, 900), (1000, 1000))
+        self.assertEqual((self.player.life, self.npc.life), (10, 10))
+        self.assertEqual(len(self.pool), 1)
+
+    def test_damage_is_applied_once_per_hit(self):
+        # O projetil cobre o player e o npc: cada um perde o dano uma vez
+        bullet = self.fire((510, 500), (0, 0), (1000, 1000))
+        self.assertFalse(self.pool.active[bullet.slot])
+        self.assertEqual((self.player.life, self.npc.life), (7, 7))
+        self.controller.ammus_collide_with()
+        self.assertEqual((self.player.life, self.npc.life), (7, 7))
+
+    def test_pushed_sprites_move_in_the_spatial_hash(self):
+        self.controller.index_elements()
+        self.controller.push(self.npc, np.array([600.0, 0.0]))
+        self.assertIn(self.npc, self.controller.spatial_hash.candidates(self.npc.rect))
+
+    def test_npcs_resolve_each_pair_once(self):
+        other = GameObject(540, 500, 40, 40, MAP, SPRITE, 0, 0, 1, False)
+        controller = self.build([self.npc, other])
+        self.npc.movement = np.array([1.0, 0.0])
+        other.movement = np.array([-1.0, 0.0])
+        controller.index_elements()
+        with patch.object(controller, 'push', wraps=controller.push) as push:
+            controller.npcs_collide_with()
+        self.assertEqual(push.call_count, 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -124,6 +124,13 @@ class TestCharacter(unittest.TestCase):
         self.character.animate()
         self.assertEqual(int(self.character.current_sprite_x), 0)
 
+    def test_animate_uses_shared_frames(self):
+        other = TestCharacterImplementation("Fred", 5, 100, 80, 80, 64, 64, 0, "default", 100, 4, [800, 600], [], "sword")
+        self.assertIs(self.character.frames, other.frames)
+        for _ in range(10):
+            self.character.animate()
+            self.assertIn(self.character.image, self.character.frames[self.character.current_sprite_y])
+
     def test_apply_movement(self):
         self.character.apply_movement([5, -5])
         self.assertEqual(self.character.x_position, 55)
@@ -0,0 +1,36 @@
+import unittest
+import pygame
+from src.classes.dialogue import DialogueRenderer, wrap_text
+
+
+class TestDialogueRenderer(unittest.TestCase):
+    """Testa o layout pré-calculado e a revelação dos diálogos."""
+
+    def setUp(self):
+        pygame.init()
+        self.font = pygame.font.Font("assets/font.ttf", 18)
+        self.screen = pygame.Surface((800, 600))
+        self.renderer = DialogueRenderer(self.font, max_width=700, start_y=450, line_spacing=40, box_height=150, reveal_speed=10)
+        self.dialog = {"speaker": "Velma", "text": "Jinkies! It looks like we've been beamed into Gustavo's computer game."}
+
+    def test_layout_is_cached(self):
+        """Verifica se o layout de um diálogo é calculado uma única vez."""
+        self.assertIs(self.renderer.layout(self.dialog), self.renderer.layout(self.dialog))
+
+    def test_layout_matches_wrap_text(self):
+        """Verifica se as linhas e os deslocamentos correspondem ao texto quebrado."""
+        layout = self.renderer.layout(self.dialog)
+        self.assertEqual(layout.lines, wrap_text(self.dialog["text"], self.font, 700))
+        for line, advances in zip(layout.lines, layout.advances):
+            self.assertEqual(len(advances), len(line) + 1)
+            self.assertEqual(advances[-1], self.font.size(line)[0])
+
+    def test_draw_reveals_until_done(self):
+        """Verifica se o diálogo só termina depois de revelar todas as letras."""
+        layout = self.renderer.layout(self.dialog)
+        self.assertFalse(self.renderer.draw(self.screen, self.dialog, 50))
+        self.assertTrue(self.renderer.draw(self.screen, self.dialog, layout.total_chars*10))
+
+
+if __name__ == "__main__":
+    unittest.main()
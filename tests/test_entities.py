@@ -0,0 +1,87 @@
+import gc
+import unittest
+import numpy as np
+from src.classes.entities import EntityStore
+
+
+class Owner:
+    pass
+
+
+class TestEntityStore(unittest.TestCase):
+    def setUp(self):
+        self.store = EntityStore(capacity=2)
+
+    def test_move_frames_inside_map(self):
+        row = self.store.add(100, 100, 50, 20, [400, 300])
+        comeback = self.store.move(row, [-90, 250])
+        # O centro fica a meia largura e meia altura das bordas
+        np.testing.assert_array_equal(self.store.position[row], [25, 290])
+        np.testing.assert_array_equal(comeback, [15, -60])
+
+    def test_move_many_rows_at_once(self):
+        rows = np.array([self.store.add(x, 50, 10, 10, [200, 200]) for x in (20, 100, 190)])
+        comeback = self.store.move(rows, np.full((3, 2), 10.0))
+        np.testing.assert_array_equal(self.store.position[rows, 0], [30, 110, 195])
+        np.testing.assert_array_equal(comeback[:, 0], [0, 0, -5])
+
+    def test_translate_updates_screen_positions(self):
+        rows = [self.store.add(x, x, 10, 10, [1000, 1000]) for x in (100, 200, 300)]
+        self.store.translate((50, 80))
+        np.testing.assert_array_equal(self.store.screen_position[rows], [[50, 20], [150, 120], [250, 220]])
+        # Posicoes alteradas depois da translacao continuam relativas a camera
+        self.store.set_position(rows[0], (60, 90))
+        np.testing.assert_array_equal(self.store.screen_position[rows[0]], [10, 10])
+
+    def test_grows_and_keeps_rows(self):
+        rows = [self.store.add(i, i, 10, 10, [1000, 1000]) for i in range(5)]
+        self.assertGreaterEqual(self.store.capacity, 5)
+        np.testing.assert_array_equal(self.store.position[rows, 0], range(5))
+
+    def test_rows_are_released_with_owner(self):
+        owner = Owner()
+        row = self.store.attach(owner, 10, 10, 10, 10, [100, 100])
+        del owner
+        gc.collect()
+        self.assertEqual(len(self.store), 0)
+        self.assertEqual(self.store.add(20, 20, 10, 10, [100, 100]), row)
+
+    def test_watch_records_changed_rows(self):
+        rows = [self.store.add(x, x, 10, 10, [1000, 1000]) for x in (100, 200, 300)]
+        log = self.store.watch()
+        self.store.move(np.array(rows[:2]), np.ones((2, 2)))
+        self.store.resize(rows[2], (20, 20))
+        self.store.set_position(rows[0], (50, 50))
+        self.store.translate((10, 10))
+        np.testing.assert_array_equal(log.drain(self.store.used), rows)
+        self.assertEqual(len(log.drain(self.store.used)), 0)
+        self.store.remove(rows[1])
+        np.testing.assert_array_equal(log.drain(self.store.used), [rows[1]])
+
+    def test_unread_watch_overflows_to_every_row(self):
+        rows = [self.store.add(x, x, 10, 10, [1000, 1000]) for x in (100, 200)]
+        log = self.store.watch()
+        log.limit = 3
+        for _ in range(5):
+            self.store.set_position(rows[0], (60, 60))
+        self.assertTrue(log.overflowed)
+        np.testing.assert_array_equal(log.drain(self.store.used), rows)
+        self.assertFalse(log.overflowed)
+
+    def test_integrate_applies_velocity(self):
+        row = self.store.add(10, 10, 10, 10, [100, 100])
+        self.store.velocity[row] = 3, -4
+        self.store.integrate()
+        np.testing.assert_array_equal(self.store.position[row], [13, 6])
+
+    def test_interpolates_between_ticks(self):
+        row = self.store.add(100, 100, 10, 10, [1000, 1000])
+        self.store.snapshot()
+        self.store.move(row, [20, -10])
+        self.store.translate((10, 0))
+        np.testing.assert_array_equal(self.store.interpolated_screen_position(row, 0.5), [105, 95])
+        np.testing.assert_array_equal(self.store.interpolated_screen_position(row, 1), self.store.screen_position[row])
+
+
+if __name__ == "__main__":
+    unittest.main()
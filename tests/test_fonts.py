@@ -0,0 +1,31 @@
+import unittest
+import pygame as pg
+from src.classes.fonts import FontRegistry
+from src.settings import Fonts
+
+
+class TestFontRegistry(unittest.TestCase):
+    def setUp(self):
+        pg.init()
+        self.registry = FontRegistry()
+
+    def test_fonts_are_created_on_first_use(self):
+        self.assertEqual(self.registry.loads, 0)
+        font = self.registry.get(size=18)
+        self.assertIs(self.registry.get(size=18), font)
+        self.assertEqual(self.registry.loads, 1)
+
+    def test_style_is_part_of_key(self):
+        regular = self.registry.get(size=18)
+        bold = self.registry.get(size=18, bold=True)
+        self.assertIsNot(regular, bold)
+        self.assertTrue(bold.get_bold())
+        self.assertFalse(regular.get_bold())
+
+    def test_enum_fonts_are_shared(self):
+        self.assertIsInstance(Fonts.PLAYER_NAME.font, pg.font.Font)
+        self.assertIs(Fonts.PLAYER_NAME.font, Fonts.PLAYER_NAME.font)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import time
+import unittest
+import pygame
+from src.classes.frameplayer import FramePlayer
+
+
+class TestFramePlayer(unittest.TestCase):
+    """Testa o reprodutor de quadros com cache limitado."""
+
+    def setUp(self):
+        pygame.init()
+        # Cada quadro 10x10 tem uma cor diferente para identificar a origem
+        self.sheet = pygame.Surface((40, 20))
+        for index in range(8):
+            row, column = divmod(index, 4)
+            self.sheet.fill((index*30, 0, 0), pygame.Rect(column*10, row*10, 10, 10))
+
+    def test_len_and_frame_size(self):
+        """Verifica se o reprodutor se comporta como a lista de quadros escalados."""
+        player = FramePlayer(self.sheet, 4, 2, (50, 30))
+        self.assertEqual(len(player), 8)
+        self.assertEqual(player[5].get_size(), (50, 30))
+        self.assertEqual(player[5].get_at((0, 0))[:3], (150, 0, 0))
+        self.assertEqual(player[-1].get_at((0, 0))[:3], (210, 0, 0))
+        with self.assertRaises(IndexError):
+            player[8]
+
+    def test_cache_is_bounded(self):
+        """Verifica se apenas os quadros mais recentes ficam em memoria."""
+        player = FramePlayer(self.sheet, 4, 2, (50, 30), cache_size=3)
+        for index in range(8):
+            player[index]
+        self.assertEqual(player.cached_frames(), [5, 6, 7])
+        self.assertIs(player[7], player[7])
+        self.assertEqual(player.misses, 8)
+
+    def test_prefetch_prepares_next_frames(self):
+        """Verifica se o thread de apoio escala os proximos quadros antes do pedido."""
+        player = FramePlayer(self.sheet, 4, 2, (50, 30), cache_size=4, prefetch=2)
+        player[7]
+        deadline = time.time() + 2
+        while len(player.cached_frames()) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(sorted(player.cached_frames()), [0, 1, 7])
+        player[0]
+        self.assertEqual(player.misses, 1)
+        player.close()
+        self.assertEqual(player.cached_frames(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
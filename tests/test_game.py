@@ -0,0 +1,46 @@
+import os
+import sys
+import subprocess
+import unittest
+from unittest.mock import patch
+import pygame as pg
+from src.classes.game import Game
+
+
+class TestGameBoot(unittest.TestCase):
+    def test_imports_have_no_side_effects(self):
+        # Processo separado: os outros testes ja inicializaram o pygame neste processo
+        code = (
+            "import pygame as pg\n"
+            "import src.classes.game, src.classes.menu, src.classes.phase, src.classes.background\n"
+            "print(pg.get_init(), pg.display.get_init(), pg.mixer.get_init(), pg.font.get_init())\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], 'False False None False')
+
+    def test_boot_runs_stages_in_order(self):
+        game = Game(import_time=0.5)
+        self.assertEqual([name for name, _ in game.startup_timeline],
+                         ['imports', 'pygame', 'display', 'mixer', 'fonts', 'assets'])
+        self.assertTrue(all(duration >= 0 for _, duration in game.startup_timeline))
+        self.assertEqual(game.screen, pg.display.get_surface())
+        self.assertTrue(pg.font.get_init())
+
+    def test_run_survives_failure_before_the_first_phase(self):
+        game = Game(import_time=0.5)
+        game.frame_profile = True
+        with patch.object(game, 'new', side_effect=pg.error('no level')), patch('src.classes.game.pygame.quit'):
+            game.run()
+        self.assertFalse(hasattr(game, 'level'))
+
+    def test_mixer_falls_back_to_silent_audio(self):
+        game = Game(import_time=0.5)
+        pg.mixer.quit()
+        with patch.dict(os.environ, {'SDL_AUDIODRIVER': 'no_such_driver'}):
+            game.init_mixer()
+            self.assertEqual(os.environ['SDL_AUDIODRIVER'], 'dummy')
+        self.assertIsNotNone(pg.mixer.get_init())
+
+
+if __name__ == "__main__":
+    unittest.main()
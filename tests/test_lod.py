@@ -0,0 +1,88 @@
+import unittest
+import numpy as np
+import pygame as pg
+from src.classes.entities import EntityStore, entity_store
+from src.classes.gameobjects import GameObject
+from src.classes.lod import LODScheduler, lod_scheduler, NEAR, MID, FAR
+from src.classes.villainai import VillainAI
+from tests.test_villainai import build_villains, MAP, SPRITE
+
+
+class TestLODScheduler(unittest.TestCase):
+    def setUp(self):
+        self.store = EntityStore()
+        # Dentro da camera, logo ao lado, a 800 px e a 3000 px dela
+        for x in (400, 900, 1600, 3900):
+            self.store.add(x, 300, 40, 40, (4000, 3000))
+        self.scheduler = LODScheduler(near_margin=256, far_margin=1024, ai_interval=4)
+
+    def test_classifies_by_distance_to_camera(self):
+        self.assertEqual(self.scheduler.level(0), NEAR)
+        self.scheduler.classify(self.store, (0, 0), (800, 600))
+        np.testing.assert_array_equal(self.scheduler.levels_of([0, 1, 2, 3, 10]), [NEAR, NEAR, MID, FAR, NEAR])
+        # A camera anda e os niveis mudam
+        self.scheduler.classify(self.store, (2400, 0), (800, 600))
+        np.testing.assert_array_equal(self.scheduler.levels, [FAR, FAR, MID, MID])
+
+    def test_rect_level(self):
+        self.assertEqual(self.scheduler.rect_level(pg.Rect(5000, 5000, 10, 10)), NEAR)
+        self.scheduler.classify(self.store, (0, 0), (800, 600))
+        self.assertEqual(self.scheduler.rect_level(pg.Rect(700, 500, 200, 200)), NEAR)
+        self.assertEqual(self.scheduler.rect_level(pg.Rect(1500, 0, 10, 10)), MID)
+        self.assertEqual(self.scheduler.rect_level(pg.Rect(-3000, 0, 10, 10)), FAR)
+
+    def test_due_staggers_far_entities(self):
+        levels = np.array([NEAR, MID, MID, MID, MID, FAR])
+        decisions = np.zeros(len(levels), dtype=int)
+        for _ in range(8):
+            self.scheduler.classify(self.store, (0, 0), (800, 600))
+            decisions += self.scheduler.due(levels)
+        np.testing.assert_array_equal(decisions, [8, 2, 2, 2, 2, 2])
+
+    def test_report(self):
+        self.scheduler.record('animation', performed=3, skipped=1)
+        self.scheduler.record('animation', skipped=4)
+        self.assertIn('animation         5 de        8 pulados ( 62.5%)', self.scheduler.report())
+        self.scheduler.reset()
+        self.assertEqual(self.scheduler.report(), '')
+
+
+class TestLODInGame(unittest.TestCase):
+    def setUp(self):
+        entity_store.translate((0, 0))
+        lod_scheduler.reset()
+
+    def tearDown(self):
+        lod_scheduler.reset()
+
+    def test_far_objects_keep_position_but_skip_animation(self):
+        near = GameObject(100, 100, 40, 40, MAP, SPRITE, 0, 0, 4, False)
+        far = GameObject(1900, 1900, 40, 40, MAP, SPRITE, 0, 0, 4, False)
+        lod_scheduler.classify(entity_store, (0, 0), (400, 300))
+        far.set_position(1800, 1900)
+        near.update()
+        far.update()
+        self.assertEqual((near.sprite_actual_x, far.sprite_actual_x), (0.2, 0))
+        self.assertEqual(far.rect.center, (1800, 1900))
+        self.assertEqual((lod_scheduler.performed['animation'], lod_scheduler.skipped['animation']), (1, 1))
+
+    def test_far_villains_dead_reckon_between_decisions(self):
+        scooby_snacks = GameObject(1900, 100, 20, 20, MAP, SPRITE, 0, 0, 1, False)
+        player = GameObject(100, 100, 40, 40, MAP, SPRITE, 0, 0, 1, False)
+        villains = build_villains(scooby_snacks, [(200, 200), (1500, 1500)])
+        scheduler = LODScheduler(near_margin=100, far_margin=400, ai_interval=4)
+        ai = VillainAI(villains, lod=scheduler)
+        for tick in range(8):
+            scheduler.classify(entity_store, (0, 0), (400, 300))
+            ai.update(player)
+        near, far = villains
+        # Ambos andam a cada tick; so o proximo decide e e animado a cada tick
+        self.assertAlmostEqual(np.hypot(far.x_position - 1500, far.y_position - 1500), 8*5)
+        self.assertEqual(len(near.memories), 3)
+        self.assertEqual(far.current_sprite_x, 0)
+        self.assertEqual((scheduler.performed['ai'], scheduler.skipped['ai']), (11, 5))
+        self.assertEqual(scheduler.skipped['animation'], 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
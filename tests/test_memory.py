@@ -0,0 +1,70 @@
+import random
+import unittest
+import numpy as np
+from src.classes.memory import RingMemory, RingMemoryBank
+
+
+class TestRingMemory(unittest.TestCase):
+    def test_matches_list_semantics(self):
+        random.seed(1)
+        memory = RingMemory(5)
+        reference = []
+        for _ in range(500):
+            if random.random() < 0.7:
+                point = (random.uniform(0, 3000), random.uniform(0, 3000))
+                memory.append(point)
+                reference.append(point)
+                if len(reference) > 5:
+                    reference.pop(0)
+            else:
+                memory.forget()
+                if reference:
+                    reference.pop(0)
+            self.assertEqual(list(memory), reference)
+            if reference:
+                np.testing.assert_allclose(memory.centroid(), np.mean(reference, axis=0))
+            else:
+                self.assertIsNone(memory.centroid())
+
+    def test_resize_keeps_newest(self):
+        memory = RingMemory(4)
+        for x in range(6):
+            memory.append((x, x))
+        memory.resize(2)
+        self.assertEqual(list(memory), [(4, 4), (5, 5)])
+        np.testing.assert_array_equal(memory.centroid(), [4.5, 4.5])
+
+
+class TestRingMemoryBank(unittest.TestCase):
+    def test_matches_ring_memories(self):
+        random.seed(2)
+        sizes = [1, 3, 5, 0]
+        bank = RingMemoryBank(sizes)
+        memories = [RingMemory(size) for size in sizes]
+        for _ in range(300):
+            seen = np.array([random.random() < 0.6 for _ in sizes])
+            point = (random.uniform(0, 3000), random.uniform(0, 3000))
+            bank.append(np.flatnonzero(seen), point)
+            bank.forget(np.flatnonzero(~seen))
+            for index, memory in enumerate(memories):
+                memory.append(point) if seen[index] else memory.forget()
+                view = bank.view(index)
+                self.assertEqual(list(view), list(memory))
+                if memory:
+                    np.testing.assert_allclose(view.centroid(), memory.centroid())
+                    np.testing.assert_allclose(bank.centroids()[index], memory.centroid())
+                else:
+                    self.assertIsNone(view.centroid())
+
+    def test_resize_grows_buffer(self):
+        bank = RingMemoryBank([2, 2])
+        for x in range(3):
+            bank.append([0, 1], (x, x))
+        bank.view(1).resize(4)
+        bank.append([1], (7, 7))
+        self.assertEqual(list(bank.view(1)), [(1, 1), (2, 2), (7, 7)])
+        self.assertEqual(list(bank.view(0)), [(1, 1), (2, 2)])
+
+
+if __name__ == "__main__":
+    unittest.main()
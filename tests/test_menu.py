@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import Mock, patch
 import pygame
-from src.classes.menu import Menu, Button, get_font
+from src.classes.menu import Menu, Button, MenuScreen, get_font
 
 class TestGetFont(unittest.TestCase):
     """Testa a função get_font para retornar uma fonte válida do pygame."""
@@ -14,6 +14,10 @@ class TestGetFont(unittest.TestCase):
         rendered_text = font.render("Test", True, (0, 0, 0))
         self.assertIsInstance(rendered_text, pygame.Surface)  # Verifica se renderiza corretamente
 
+    def test_get_font_is_cached(self):
+        """Verifica se a mesma fonte é reaproveitada para o mesmo tamanho."""
+        self.assertIs(get_font(30), get_font(30))
+
 class TestButton(unittest.TestCase):
     """Testa a funcionalidade da classe Button."""
     
@@ -38,6 +42,33 @@ class TestButton(unittest.TestCase):
         """Testa se o clique fora do botão retorna False."""
         self.assertFalse(self.button.check_for_input((200, 200)))
 
+    def test_change_color_reports_hover_changes(self):
+        """Testa se o texto só é trocado quando o estado de hover muda."""
+        self.assertTrue(self.button.change_color((100, 100)))
+        self.assertIs(self.button.text, self.button.hovering_text)
+        self.assertFalse(self.button.change_color((100, 100)))
+        self.assertTrue(self.button.change_color((200, 200)))
+        self.assertIs(self.button.text, self.button.base_text)
+
+class TestMenuScreen(unittest.TestCase):
+    """Testa o redesenho sob demanda das telas de menu."""
+
+    def setUp(self):
+        pygame.init()
+        font = pygame.font.Font(None, 30)
+        button = Button(image=None, pos=(100, 100), text_input="Test", font=font, base_color="Black", hovering_color="White")
+        background = pygame.Surface((200, 200))
+        self.menu_screen = MenuScreen(background, background.get_rect(), {"test": button})
+        self.screen = pygame.Surface((200, 200))
+
+    def test_draw_only_when_dirty(self):
+        """Testa se a tela só é redesenhada quando algo muda."""
+        self.assertTrue(self.menu_screen.draw(self.screen))
+        self.menu_screen.refresh((150, 150))
+        self.assertFalse(self.menu_screen.draw(self.screen))
+        self.menu_screen.refresh((100, 100))
+        self.assertTrue(self.menu_screen.draw(self.screen))
+
 class TestMenu(unittest.TestCase):
     """Testa a funcionalidade da classe Menu."""
     
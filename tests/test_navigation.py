@@ -0,0 +1,87 @@
+import unittest
+import numpy as np
+from src.classes.entities import entity_store
+from src.classes.gameobjects import GameObject
+from src.classes.navigation import NavigationGrid, FlowField
+from src.classes.staticgrid import StaticGrid
+from src.classes.villainai import VillainAI
+from tests.test_villainai import build_villains, MAP, SPRITE
+
+# Parede vertical no meio do mapa, com uma passagem embaixo
+WALL = (960, 0, 64, 1600)
+
+
+class TestNavigationGrid(unittest.TestCase):
+    def test_blocks_cells_under_static_objects(self):
+        grid = NavigationGrid(StaticGrid([WALL], MAP), cell_size=64)
+        self.assertEqual(grid.shape, (32, 32))
+        self.assertTrue(grid.blocked[:25, 15].all())
+        self.assertFalse(grid.blocked[26:, 15].any())
+        self.assertFalse(grid.blocked[:, :14].any())
+
+    def test_clearance_widens_obstacles(self):
+        grid = NavigationGrid(StaticGrid([WALL], MAP), cell_size=64, clearance=32)
+        self.assertTrue(grid.blocked[:25, 14].all())
+        self.assertTrue(grid.blocked[:25, 16].all())
+
+
+class TestFlowField(unittest.TestCase):
+    def setUp(self):
+        self.grid = NavigationGrid(StaticGrid([WALL], MAP), cell_size=64)
+
+    def walk(self, field, cell, steps=200):
+        path = [cell]
+        for _ in range(steps):
+            d_x, d_y = field.directions[cell]
+            if not d_x and not d_y:
+                break
+            cell = (cell[0] + int(d_y), cell[1] + int(d_x))
+            path.append(cell)
+        return path
+
+    def test_routes_around_obstacles(self):
+        field = FlowField(self.grid)
+        field.compute((5, 25))
+        path = self.walk(field, (5, 5))
+        self.assertEqual(path[-1], (5, 25))
+        self.assertFalse(any(self.grid.blocked[cell] for cell in path))
+        # A passagem fica abaixo da parede
+        self.assertGreaterEqual(max(row for row, _ in path), 25)
+        self.assertAlmostEqual(field.distance[5, 24], 1)
+
+    def test_unreachable_cells_have_no_direction(self):
+        grid = NavigationGrid(StaticGrid([(960, 0, 64, 2000)], MAP), cell_size=64)
+        field = FlowField(grid)
+        field.compute((5, 25))
+        self.assertTrue(np.isinf(field.distance[5, 5]))
+        np.testing.assert_array_equal(field.sample([(5*64 + 32, 5*64 + 32)]), [[0, 0]])
+
+    def test_recomputes_only_when_target_changes_cell(self):
+        field = FlowField(self.grid, interval=3)
+        self.assertTrue(field.retarget((100, 100)))
+        self.assertFalse(field.retarget((110, 100)))
+        # Outra celula, mas ainda dentro do intervalo
+        self.assertFalse(field.retarget((300, 100)))
+        self.assertTrue(field.retarget((300, 100)))
+        self.assertEqual((field.target, field.computed), ((1, 4), 2))
+
+
+class TestVillainNavigation(unittest.TestCase):
+    def test_villains_go_around_the_wall(self):
+        entity_store.translate((0, 0))
+        scooby_snacks = GameObject(1600, 400, 20, 20, MAP, SPRITE, 0, 0, 1, False)
+        player = GameObject(100, 1900, 40, 40, MAP, SPRITE, 0, 0, 1, False)
+        villains = build_villains(scooby_snacks, [(400, 400), (500, 300)])
+        ai = VillainAI(villains, navigation=NavigationGrid(StaticGrid([WALL], MAP), clearance=32))
+        for _ in range(1000):
+            ai.update(player)
+            # O centro de nenhum vilao entra na parede pelo caminho
+            for villain in villains:
+                self.assertFalse(WALL[0] < villain.x_position < WALL[0] + WALL[2] and villain.y_position < WALL[1] + WALL[3])
+        for villain in villains:
+            self.assertLess(np.hypot(villain.x_position - 1600, villain.y_position - 400), 10)
+        self.assertEqual(ai.target_fields[scooby_snacks.row].computed, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
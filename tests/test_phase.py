@@ -0,0 +1,92 @@
+import random
+import unittest
+from unittest.mock import Mock
+import numpy as np
+import pygame as pg
+from src.settings import SCREEN_DIMENSIONS
+from src.classes.assets import asset_cache
+from src.classes.background import Background
+from src.classes.entities import entity_store
+from src.classes.phase import Phase, PhaseManager, PhasePreloader, random_data
+
+
+class TestPhasePreloader(unittest.TestCase):
+    def setUp(self):
+        pg.init()
+        self.screen = pg.display.set_mode((10, 10))
+
+    def tearDown(self):
+        pg.display.quit()
+
+    def test_preloader_warms_cache(self):
+        preloader = PhasePreloader(0)
+        preloader.start()
+        phase_data = preloader.finish()
+        self.assertIsNone(preloader.error)
+        self.assertEqual(phase_data['player']['name'], 'Scooby')
+        self.assertGreater(len(preloader.references), 0)
+        # Tudo ja convertido no thread principal
+        self.assertEqual(asset_cache.stats()['pending'], 0)
+        path, size = preloader.references[0]
+        self.assertGreaterEqual(asset_cache.refcount(path, size), 1)
+        preloader.release()
+        self.assertEqual(preloader.references, [])
+
+    def test_preloader_hands_over_the_tile_file(self):
+        preloader = PhasePreloader(0)
+        preloader.start()
+        preloader.finish()
+        # O fundo da fase 0 e dividido em tiles, gerados no thread
+        tile_pack = preloader.take_tiles()
+        self.assertIsNotNone(tile_pack)
+        self.assertGreater(len(tile_pack.entries), 0)
+        self.assertIsNone(preloader.take_tiles())
+        preloader.release()
+        tile_pack.close()
+
+    def test_preload_phase_runs_once_per_phase(self):
+        manager = PhaseManager(self.screen)
+        manager.preload_phase()
+        preloader = manager.preloader
+        manager.preload_phase()
+        self.assertIs(manager.preloader, preloader)
+        preloader.finish()
+        preloader.release()
+
+
+class TestPhaseRender(unittest.TestCase):
+    def setUp(self):
+        pg.init()
+        self.screen = pg.display.set_mode((10, 10))
+        random.seed(0)
+        background = Background(pg.Surface(SCREEN_DIMENSIONS), 'assets/backgrounds/garden.jpg', SCREEN_DIMENSIONS[0], SCREEN_DIMENSIONS[1], 4000, 3000, 'audios/backmusic.mp3', 0, [])
+        npcs, collectibles, mandatory_events, optional_events, player, monster, scooby_snacks = random_data(background)
+        self.phase = Phase(background.screen, background, npcs, collectibles, mandatory_events, optional_events, player, monster, [], scooby_snacks)
+        self.phase.background.stop_music()
+
+    def tearDown(self):
+        pg.display.quit()
+
+    def test_background_and_sprites_share_the_interpolated_camera(self):
+        background = self.phase.background
+        background.update_camera(1000, 1000)
+        entity_store.snapshot()
+        background.update_camera(1010, 1000)
+        background.draw_background_image = Mock(wraps=background.draw_background_image)
+        interpolate = self.phase.interpolate
+        player_centers = []
+        def spy(alpha, origin):
+            tick_centers = interpolate(alpha, origin)
+            player_centers.append(self.phase.player.rect.center)
+            return tick_centers
+        self.phase.interpolate = spy
+        self.phase.render_camera(0.5)
+
+        origin = background.draw_background_image.call_args.args[0]
+        np.testing.assert_allclose(origin, (1005 - SCREEN_DIMENSIONS[0]/2, 1000 - SCREEN_DIMENSIONS[1]/2))
+        # O player e desenhado na posicao do mapa menos a mesma origem do fundo
+        np.testing.assert_allclose(np.array([self.phase.player.x_position, self.phase.player.y_position]) - origin, player_centers[0], atol=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+from src.classes.pipeline import FramePipeline
+
+
+class TestFramePipeline(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.pipeline = FramePipeline([(name, lambda name=name: self.calls.append(name)) for name in ('input', 'ai', 'physics', 'render')])
+
+    def test_runs_each_stage_once_in_order(self):
+        self.pipeline.run()
+        self.assertEqual(self.calls, ['input', 'ai', 'physics', 'render'])
+        self.assertEqual(set(self.pipeline.averages()), {'input', 'ai', 'physics', 'render'})
+
+    def test_runs_a_slice_of_the_stages(self):
+        self.pipeline.run(last='physics')
+        self.pipeline.run(first='render')
+        self.assertEqual(self.calls, ['input', 'ai', 'physics', 'render'])
+        self.assertEqual(self.pipeline.runs, {'input': 1, 'ai': 1, 'physics': 1, 'render': 1})
+
+    def test_rejects_repeated_stages(self):
+        with self.assertRaises(ValueError):
+            FramePipeline([('render', print), ('render', print)])
+
+
+if __name__ == "__main__":
+    unittest.main()
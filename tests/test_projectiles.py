@@ -0,0 +1,57 @@
+import unittest
+import numpy as np
+import pygame as pg
+from src.classes.projectiles import ProjectilePool
+
+
+class TestProjectilePool(unittest.TestCase):
+    def setUp(self):
+        pg.init()
+        self.pool = ProjectilePool(pg.Surface((10, 10)), damage=1, effects=[], speed=6, map_limits_sup=[1000, 1000], capacity=2)
+
+    def test_spawn_recycles_released_sprites(self):
+        first = self.pool.spawn((100, 100), (1, 0))
+        first.kill()
+        self.assertEqual(len(self.pool), 0)
+        self.assertIs(self.pool.spawn((200, 200), (0, 1)), first)
+        self.assertEqual(len(self.pool.sprites), 2)
+
+    def test_grows_when_full(self):
+        for _ in range(5):
+            self.pool.spawn((100, 100), (1, 0))
+        self.assertEqual(len(self.pool), 5)
+        self.assertGreaterEqual(self.pool.capacity, 5)
+
+    def test_update_integrates_and_drops_out_of_map(self):
+        inside = self.pool.spawn((100, 100), (1, 0))
+        outside = self.pool.spawn((6, 100), (-1, 0))
+        self.pool.update((0, 0), (1000, 1000))
+        np.testing.assert_allclose(inside.position, (100 + self.pool.step, 100))
+        self.assertFalse(self.pool.active[outside.slot])
+        self.assertEqual(len(self.pool), 1)
+
+    def test_only_projectiles_on_screen_are_visible(self):
+        on_screen = self.pool.spawn((150, 150), (0, 0))
+        off_screen = self.pool.spawn((800, 800), (0, 0))
+        self.pool.update((100, 100), (200, 200))
+        self.assertIn(on_screen, self.pool.visible)
+        self.assertNotIn(off_screen, self.pool.visible)
+        self.assertEqual(on_screen.rect.center, (50, 50))
+        # A camera se move e os papeis se invertem
+        self.pool.update((700, 700), (200, 200))
+        self.assertNotIn(on_screen, self.pool.visible)
+        self.assertIn(off_screen, self.pool.visible)
+
+    def test_hidden_hits_only_test_projectiles_off_screen(self):
+        on_screen = self.pool.spawn((150, 150), (0, 0))
+        off_screen = self.pool.spawn((800, 800), (0, 0))
+        self.pool.update((100, 100), (200, 200))
+        centers = np.array([[150.0, 150.0], [812.0, 800.0], [815.0, 800.0]])
+        hits = self.pool.hidden_hits(centers, np.full((3, 2), 10.0))
+        # Caixas que apenas encostam no projetil nao contam, como em colliderect
+        self.assertEqual(hits, [(off_screen, 1)])
+        self.assertNotIn(on_screen, [each for each, _ in hits])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import random
+import unittest
+from types import SimpleNamespace
+import numpy as np
+import pygame as pg
+from src.classes.gameobjects import GameObject
+from src.classes.raycast import ray_box_distances, AimRays
+
+MAP = [2000, 2000]
+SPRITE = 'assets\\backgrounds\\shaggy_right_1.png'
+
+
+class TestRayBoxDistances(unittest.TestCase):
+    def test_distances(self):
+        boxes = np.array([[10, -5, 10, 10], [-20, -20, 5, 5]])
+        distances = ray_box_distances([(0, 0), (15, 0)], [(1, 0), (0, 1)], boxes)
+        np.testing.assert_allclose(distances, [[10, np.inf], [0, np.inf]])
+
+    def test_parallel_rays(self):
+        box = [[0, 0, 10, 10]]
+        distances = ray_box_distances([(-5, 5), (-5, 10.5), (5, -3)], [(1, 0), (1, 0), (0, -1)], box)
+        np.testing.assert_allclose(distances[:, 0], [5, np.inf, np.inf])
+
+    def test_matches_clipline(self):
+        random.seed(3)
+        rect = pg.Rect(100, 100, 60, 40)
+        for _ in range(300):
+            origin = np.array([random.uniform(0, 300), random.uniform(0, 300)])
+            angle = random.uniform(0, 2*np.pi)
+            direction = np.array([np.cos(angle), np.sin(angle)])
+            scope = random.uniform(10, 200)
+            distance = ray_box_distances(origin, direction, [rect])[0, 0]
+            # Longe das bordas o resultado nao depende do arredondamento de clipline
+            if min(abs(distance - scope), abs(distance)) < 2 or (np.isinf(distance) and rect.inflate(4, 4).clipline(origin, origin + direction*scope)):
+                continue
+            self.assertEqual(distance <= scope, bool(rect.clipline(origin, origin + direction*scope)))
+
+
+class TestAimRays(unittest.TestCase):
+    def setUp(self):
+        self.player = GameObject(1000, 1000, 40, 40, MAP, SPRITE, 0, 0, 1, False)
+
+    def villain(self, x, y, aim, scope=300):
+        weapon = GameObject(x, y, 10, 10, MAP, SPRITE, 0, 0, 1, False)
+        weapon.scope = scope
+        return SimpleNamespace(aim=np.array(aim, dtype=float), weapon=weapon)
+
+    def test_hits_scope_and_occluders(self):
+        villains = [self.villain(800, 1000, (3, 0)), self.villain(800, 1000, (0, 1)), self.villain(500, 1000, (1, 0)),
+                    self.villain(1000, 800, (0, 0)), self.villain(1000, 700, (0, 2))]
+        rays = AimRays()
+        rays.cast(villains, self.player)
+        np.testing.assert_array_equal(rays.hits, [True, False, False, False, True])
+        np.testing.assert_allclose(rays.distances[[0, 4]], [180, 280])
+        np.testing.assert_allclose(rays.directions[0], [1, 0])
+        self.assertEqual(rays.shooters(), [villains[0], villains[4]])
+        self.assertEqual([each[0] for each in rays.lines()], [villains[0], villains[1], villains[2], villains[4]])
+
+        # Uma parede entre o primeiro vilao e o player bloqueia o tiro e encurta a mira
+        rays.cast(villains, self.player, occluders=np.array([[900, 950, 20, 100]]))
+        np.testing.assert_array_equal(rays.hits, [False, False, False, False, True])
+        self.assertAlmostEqual(rays.reach[0], 100)
+        self.assertAlmostEqual(rays.reach[1], 300)
+
+    def test_no_villains(self):
+        rays = AimRays()
+        rays.cast([], self.player)
+        self.assertEqual(rays.shooters(), [])
+        self.assertEqual(list(rays.lines()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
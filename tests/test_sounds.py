@@ -0,0 +1,43 @@
+import unittest
+import pygame as pg
+from src.classes.sounds import SoundBank
+
+
+class TestSoundBank(unittest.TestCase):
+    def setUp(self):
+        pg.init()
+        pg.mixer.init()
+        self.bank = SoundBank(
+            effects={'damage': 'assets\\sounds\\dano.wav', 'missing': 'assets/sounds/nao_existe.wav'},
+            music={'final': 'assets/sounds/backmusic.mp3'},
+        )
+
+    def test_effects_are_decoded_once_on_first_use(self):
+        self.assertEqual(self.bank.stats()['decoded'], 0)
+        sound = self.bank.get('damage')
+        self.assertIs(self.bank.get('damage'), sound)
+        stats = self.bank.stats()
+        self.assertEqual(stats['decoded'], 1)
+        self.assertGreater(stats['bytes'], 0)
+
+    def test_missing_effect_is_ignored(self):
+        self.assertIsNone(self.bank.play('missing'))
+        self.assertIsNone(self.bank.get('missing'))
+        self.assertEqual(self.bank.stats()['missing'], ['missing'])
+
+    def test_music_is_streamed(self):
+        self.bank.play_music('final')
+        self.assertEqual(self.bank.current_music, 'final')
+        # Musicas nao entram no cache de efeitos decodificados
+        self.assertEqual(self.bank.stats()['decoded'], 0)
+        self.bank.stop_music()
+        self.assertIsNone(self.bank.current_music)
+
+    def test_release_drops_decoded_effect(self):
+        self.bank.get('damage')
+        self.bank.release('damage')
+        self.assertEqual(self.bank.stats()['bytes'], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
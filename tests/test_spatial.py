@@ -0,0 +1,109 @@
+import random
+import unittest
+import pygame as pg
+from src.classes.spatial import SpatialHash, EntityGrid, VersionedGroup
+from src.classes.entities import EntityStore
+
+
+def make_sprite(x, y, width, height):
+    sprite = pg.sprite.Sprite()
+    sprite.rect = pg.Rect(x, y, width, height)
+    return sprite
+
+
+class TestSpatialHash(unittest.TestCase):
+    def setUp(self):
+        random.seed(3)
+        self.group_a = pg.sprite.Group(make_sprite(random.randint(-500, 2000), random.randint(-500, 2000), random.randint(5, 150), random.randint(5, 150)) for _ in range(150))
+        self.group_b = pg.sprite.Group(make_sprite(random.randint(-500, 2000), random.randint(-500, 2000), random.randint(5, 150), random.randint(5, 150)) for _ in range(150))
+        self.hash = SpatialHash(cell_size=64)
+        self.hash.sync(list(self.group_a) + list(self.group_b), (37.5, -12.25))
+
+    def test_groupcollide_matches_pygame(self):
+        self.assertEqual(self.hash.groupcollide(self.group_a, self.group_b), pg.sprite.groupcollide(self.group_a, self.group_b, False, False))
+        self.assertEqual(self.hash.groupcollide(self.group_a, self.group_a), pg.sprite.groupcollide(self.group_a, self.group_a, False, False))
+
+    def test_collide_matches_pygame(self):
+        for sprite in self.group_a:
+            self.assertEqual(self.hash.collide(sprite, self.group_b), pg.sprite.spritecollide(sprite, self.group_b, False))
+
+    def test_sync_moves_and_drops_sprites(self):
+        moved = next(iter(self.group_a))
+        moved.rect.topleft = (5000, 5000)
+        removed = next(iter(self.group_b))
+        removed.kill()
+        self.hash.sync(list(self.group_a) + list(self.group_b), (37.5, -12.25))
+        self.assertNotIn(removed, self.hash)
+        self.assertIn(moved, self.hash.candidates(pg.Rect(5000, 5000, 1, 1)))
+        self.assertEqual(self.hash.groupcollide(self.group_a, self.group_b), pg.sprite.groupcollide(self.group_a, self.group_b, False, False))
+
+    def test_camera_motion_keeps_static_cells(self):
+        sprite = make_sprite(100, 100, 10, 10)
+        spatial_hash = SpatialHash(cell_size=64)
+        spatial_hash.sync([sprite], (0, 0))
+        cells = spatial_hash.cells_for(sprite.rect)
+        # A camera anda 40 pixels e o rect na tela anda -40: a celula no mapa e a mesma
+        sprite.rect.move_ip(-40, 0)
+        spatial_hash.sync([sprite], (40, 0))
+        self.assertEqual(spatial_hash.cells_for(sprite.rect), cells)
+
+
+class TestEntityGrid(unittest.TestCase):
+    def setUp(self):
+        random.seed(5)
+        self.store = EntityStore(capacity=8)
+        for _ in range(300):
+            self.store.add(random.uniform(0, 3000), random.uniform(0, 3000), random.randint(5, 150), random.randint(5, 150), (3000, 3000))
+        self.grid = EntityGrid(self.store, cell_size=128)
+        self.grid.sync()
+
+    def brute_force(self, x, y, width, height):
+        rows = set()
+        for row in range(self.store.used):
+            if self.store.alive[row]:
+                (center_x, center_y), (row_width, row_height) = self.store.position[row], self.store.size[row]
+                if abs(center_x - (x + width/2)) < (width + row_width)/2 and abs(center_y - (y + height/2)) < (height + row_height)/2:
+                    rows.add(row)
+        return rows
+
+    def test_query_contains_every_overlap(self):
+        for x, y in ((0, 0), (1000, 700), (2500, 2600), (-300, 1500)):
+            self.assertTrue(self.brute_force(x, y, 1280, 720) <= set(self.grid.query(x, y, 1280, 720)))
+
+    def test_sync_only_moves_changed_rows(self):
+        self.grid.sync()
+        self.assertEqual(self.grid.moved, 0)
+        self.store.set_position(3, (10, 10))
+        self.store.remove(4)
+        self.grid.sync()
+        self.assertEqual(self.grid.moved, 2)
+        self.assertIn(3, self.grid.query(0, 0, 20, 20))
+        self.assertNotIn(4, self.grid.query(-500, -500, 4000, 4000))
+
+    def test_sync_reads_only_logged_rows(self):
+        row = self.store.add(10, 10, 400, 400, (3000, 3000))
+        self.store.resize(3, (2, 2))
+        self.grid.sync()
+        # Apenas as duas linhas alteradas sao lidas; a nova ja entra no indice e amplia as consultas
+        self.assertIn(row, self.grid.query(0, 0, 20, 20))
+        self.assertEqual(self.grid.max_half_size, 200)
+        # Escrever direto no array, sem passar pelo armazenamento, nao e visto pelo indice
+        self.store.position[5] = (10, 10)
+        self.grid.sync()
+        self.assertEqual(self.grid.moved, 0)
+
+
+class TestVersionedGroup(unittest.TestCase):
+    def test_version_counts_membership_changes(self):
+        sprite = make_sprite(0, 0, 10, 10)
+        group = VersionedGroup()
+        group.add(sprite)
+        version = group.version
+        group.add(sprite)
+        self.assertEqual(group.version, version)
+        sprite.kill()
+        self.assertGreater(group.version, version)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+import numpy as np
+import pygame as pg
+from src.classes.staticgrid import StaticGrid, load_static_grid, static_grid_path
+
+
+class TestStaticGrid(unittest.TestCase):
+    def setUp(self):
+        self.rects = [(100, 100, 100, 20), (150, 90, 40, 40), (600, 300, 30, 200)]
+        self.grid = StaticGrid(self.rects, (1000, 800), cell_size=32)
+
+    def test_query_matches_colliderect(self):
+        rng = np.random.default_rng(1)
+        for x, y, width, height in rng.integers(0, 700, (300, 4)):
+            width, height = width % 120 + 1, height % 120 + 1
+            expected = [index for index, rect in enumerate(self.rects) if pg.Rect(x, y, width, height).colliderect(pg.Rect(rect))]
+            self.assertEqual(self.grid.query(x, y, width, height), expected)
+
+    def test_overlapping_objects_share_cells(self):
+        self.assertEqual(self.grid.query(155, 100, 10, 10), [0, 1])
+
+    def test_hits_matches_query(self):
+        rng = np.random.default_rng(2)
+        centers = rng.uniform(0, 800, (500, 2))
+        expected = [bool(self.grid.query(x - 10, y - 10, 20, 20)) for x, y in centers]
+        self.assertEqual(self.grid.hits(centers, (10, 10)).tolist(), expected)
+        # Retangulos maiores que uma celula tambem sao testados por inteiro
+        self.assertTrue(self.grid.hits([[615, 400]], (100, 5))[0])
+
+    def test_collide_returns_bound_sprites(self):
+        objects = ['a', 'b', 'c']
+        self.grid.bind(objects)
+        self.assertEqual(self.grid.collide(pg.Rect(10, 10, 20, 20), origin=(590, 390)), ['c'])
+
+
+class TestStaticGridCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.json_path = os.path.join(self.directory, 'phase_0.json')
+        self.phase_data = {
+            'background': {'width': 1000, 'height': 800},
+            'game_objects': {
+                'g1': {'x_position': 150, 'y_position': 110, 'width': 100, 'height': 20, 'is_static': 1},
+                'g2': {'x_position': 500, 'y_position': 500, 'width': 50, 'height': 50, 'is_static': 0},
+            },
+        }
+        self.write_json()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def write_json(self):
+        with open(self.json_path, 'w') as file:
+            json.dump(self.phase_data, file)
+
+    def test_grid_is_cached_next_to_json(self):
+        grid = load_static_grid(self.json_path, self.phase_data)
+        self.assertEqual(len(grid), 1)
+        self.assertTrue(os.path.exists(static_grid_path(self.json_path)))
+        cached = load_static_grid(self.json_path, self.phase_data)
+        np.testing.assert_array_equal(cached.cells, grid.cells)
+        self.assertEqual(cached.groups, grid.groups)
+
+    def test_changed_json_rebuilds_grid(self):
+        load_static_grid(self.json_path, self.phase_data)
+        self.phase_data['game_objects']['g2']['is_static'] = 1
+        self.write_json()
+        self.assertEqual(len(load_static_grid(self.json_path, self.phase_data)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+import pygame as pg
+from src.classes.tiles import TileMap
+
+
+class TestTileMap(unittest.TestCase):
+    def setUp(self):
+        pg.init()
+        self.directory = tempfile.mkdtemp()
+        self.tile_path = os.path.join(self.directory, 'garden.tiles')
+        self.sprite = os.path.join(self.directory, 'garden.jpg')
+        shutil.copy('assets/backgrounds/garden.jpg', self.sprite)
+        self.tiles = TileMap(self.sprite, 1000, 700, 128, margin=1, tile_path=self.tile_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_grid_covers_map(self):
+        self.assertEqual((self.tiles.columns, self.tiles.rows), (8, 6))
+        self.assertEqual(len(self.tiles.pack.entries), 48)
+        # Tiles da borda ficam menores quando o mapa nao e multiplo do tamanho do tile
+        self.assertEqual(tuple(self.tiles.pack.entries['7,5']['size']), (1000 - 7*128, 700 - 5*128))
+
+    def test_only_tiles_near_camera_are_resident(self):
+        self.tiles.page(300, 200, 200, 150)
+        # Colunas 2 a 3 e linhas 1 a 2 visiveis, com um tile de margem
+        self.assertEqual(set(self.tiles.resident), {(column, row) for column in range(1, 5) for row in range(0, 4)})
+        self.tiles.page(800, 500, 200, 150)
+        self.assertEqual(set(self.tiles.resident), {(column, row) for column in range(5, 8) for row in range(2, 6)})
+        self.assertGreater(self.tiles.evictions, 0)
+
+    def test_draw_matches_full_image(self):
+        full = pg.transform.scale(pg.image.load(self.sprite), (1000, 700))
+        screen = pg.Surface((200, 150))
+        self.tiles.page(301, 199, 200, 150)
+        self.tiles.draw(screen, 301, 199, 200, 150)
+        expected = full.subsurface((301, 199, 200, 150))
+        self.assertEqual(pg.image.tobytes(screen, 'RGB'), pg.image.tobytes(expected, 'RGB'))
+
+    def test_stale_tile_file_is_rebuilt(self):
+        stat = os.stat(self.sprite)
+        os.utime(self.sprite, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.tiles.pack.close()
+        rebuilt = TileMap(self.sprite, 1000, 700, 128, tile_path=self.tile_path)
+        self.assertEqual(rebuilt.pack.meta['source'][0], stat.st_mtime_ns + 10**9)
+
+    def test_open_pack_is_used_without_rebuilding(self):
+        with patch('src.classes.tiles.ensure_tiles') as ensure_tiles:
+            handed = TileMap(self.sprite, 1000, 700, 128, tile_path=self.tile_path, pack=self.tiles.pack)
+        ensure_tiles.assert_not_called()
+        self.assertIs(handed.pack, self.tiles.pack)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+from src.classes.timestep import FixedTimestep
+
+
+class TestFixedTimestep(unittest.TestCase):
+    def setUp(self):
+        self.timestep = FixedTimestep(tick_rate=30, max_frame_time=0.25)
+        self.timestep.advance(0.0)
+
+    def test_ticks_do_not_depend_on_frame_rate(self):
+        for frame in range(1, 121):
+            self.timestep.advance(frame/120)
+        self.assertEqual(self.timestep.ticks, 30)
+        slow = FixedTimestep(tick_rate=30)
+        slow.advance(0.0)
+        for frame in range(1, 11):
+            slow.advance(frame/10)
+        self.assertEqual(slow.ticks, 30)
+
+    def test_alpha_is_the_leftover_fraction(self):
+        self.assertEqual(self.timestep.advance(0.05), 1)
+        self.assertAlmostEqual(self.timestep.alpha, 0.5)
+
+    def test_long_frames_are_clamped(self):
+        self.assertEqual(self.timestep.advance(10.0), 7)
+
+    def test_reset_discards_elapsed_time(self):
+        self.timestep.reset()
+        self.assertEqual(self.timestep.advance(5.0), 0)
+        self.assertEqual(self.timestep.advance(5.0 + 1/30), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
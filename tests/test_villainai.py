@@ -0,0 +1,71 @@
+import unittest
+from unittest.mock import Mock
+import numpy as np
+import pygame as pg
+from src.classes.entities import entity_store
+from src.classes.gameobjects import GameObject
+from src.classes.villain import Villain
+from src.classes.villainai import VillainAI
+
+MAP = [2000, 2000]
+SPRITE = 'assets\\backgrounds\\shaggy_right_1.png'
+
+
+def build_villains(scooby_snacks, starts):
+    background = Mock()
+    background.get_shape.return_value = tuple(MAP)
+    villains = []
+    for x, y in starts:
+        weapon = GameObject(x, y, 10, 10, MAP, SPRITE, 0, 0, 1, False)
+        weapon.attack_field = pg.Rect(0, 0, 0, 0)
+        villains.append(Villain('Fred', 5, 3, x, y, 64, 64, 0, 'default', 5, 4, MAP, 100, weapon, 3, 150, background, scooby_snacks))
+    return villains
+
+
+class TestVillainAI(unittest.TestCase):
+    def setUp(self):
+        entity_store.translate((0, 0))
+        self.scooby_snacks = GameObject(1800, 1800, 20, 20, MAP, SPRITE, 0, 0, 1, False)
+        self.player = GameObject(1000, 1000, 40, 40, MAP, SPRITE, 0, 0, 1, False)
+        self.player.life = 10
+        # Viloes que veem o player, que nao o veem e um parado sobre o alvo
+        self.starts = [(900, 950), (1100, 1130), (300, 200), (1810, 1790), (1000, 1140)]
+
+    def test_matches_individual_updates(self):
+        individual = build_villains(self.scooby_snacks, self.starts)
+        batched = build_villains(self.scooby_snacks, self.starts)
+        ai = VillainAI(batched)
+        for tick in range(12):
+            # O player anda e sai do campo de visao de alguns viloes no meio do teste
+            self.player.set_position(1000 + 40*tick, 1000)
+            self.player.rect.center = self.player.screen_position
+            for villain in individual:
+                villain.update(self.player)
+            ai.update(self.player)
+            for one, other in zip(individual, batched):
+                np.testing.assert_allclose((other.x_position, other.y_position), (one.x_position, one.y_position))
+                np.testing.assert_allclose(other.weapon.get_position(), one.weapon.get_position())
+                np.testing.assert_allclose(list(other.memories), list(one.memories))
+                np.testing.assert_allclose(other.aim, one.aim)
+                self.assertEqual((other.current_sprite_y, other.current_sprite_x), (one.current_sprite_y, one.current_sprite_x))
+                self.assertEqual(other.rect.center, one.rect.center)
+
+    def test_attacks_player_in_reach(self):
+        villains = build_villains(self.scooby_snacks, [(1030, 1000), (300, 300)])
+        for villain in villains:
+            villain.weapon.damage = 2
+            villain.weapon.attack_field = pg.Rect(0, 0, 40, 40)
+        VillainAI(villains).update(self.player)
+        self.assertEqual(self.player.life, 8)
+
+    def test_memories_stay_readable_from_villain(self):
+        villain = build_villains(self.scooby_snacks, [(1000, 1050)])[0]
+        villain.memories_append((10, 20))
+        ai = VillainAI([villain])
+        self.assertEqual(list(villain.memories), [(10, 20)])
+        ai.update(self.player)
+        self.assertEqual(list(villain.memories), [(10, 20), (1000, 1000)])
+
+
+if __name__ == "__main__":
+    unittest.main()